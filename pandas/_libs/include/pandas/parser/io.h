@@ -19,6 +19,8 @@ typedef struct _rd_source {
   PyObject *obj;
   PyObject *buffer;
   size_t position;
+  /* buffer exported by a memory-mapped source, view.obj is NULL until then */
+  Py_buffer view;
 } rd_source;
 
 #define RDS(source) ((rd_source *)source)
@@ -29,3 +31,6 @@ void del_rd_source(void *src);
 
 char *buffer_rd_bytes(void *source, size_t nbytes, size_t *bytes_read,
                       int *status, const char *encoding_errors);
+
+char *buffer_mmap_bytes(void *source, size_t nbytes, size_t *bytes_read,
+                        int *status, const char *encoding_errors);
@@ -22,6 +22,7 @@ typedef struct {
   void *(*new_rd_source)(PyObject *);
   void (*del_rd_source)(void *);
   char *(*buffer_rd_bytes)(void *, size_t, size_t *, int *, const char *);
+  char *(*buffer_mmap_bytes)(void *, size_t, size_t *, int *, const char *);
   void (*uint_state_init)(uint_state *);
   int (*uint64_conflict)(uint_state *);
   void (*coliter_setup)(coliter_t *, parser_t *, int64_t, int64_t);
@@ -65,6 +66,9 @@ static PandasParser_CAPI *PandasParserAPI = NULL;
 #define buffer_rd_bytes(source, nbytes, bytes_read, status, encoding_errors)   \
   PandasParserAPI->buffer_rd_bytes((source), (nbytes), (bytes_read), (status), \
                                    (encoding_errors))
+#define buffer_mmap_bytes(source, nbytes, bytes_read, status, encoding_errors) \
+  PandasParserAPI->buffer_mmap_bytes((source), (nbytes), (bytes_read),         \
+                                     (status), (encoding_errors))
 #define uint_state_init(self) PandasParserAPI->uint_state_init((self))
 #define uint64_conflict(self) PandasParserAPI->uint64_conflict((self))
 #define coliter_setup(self, parser, i, start)                                  \
@@ -6,6 +6,7 @@ from csv import (
     QUOTE_NONE,
     QUOTE_NONNUMERIC,
 )
+import mmap
 import warnings
 
 from pandas.util._exceptions import find_stack_level
@@ -250,6 +251,9 @@ cdef extern from "pandas/parser/pd_parser.h":
 
     char* buffer_rd_bytes(void *source, size_t nbytes,
                           size_t *bytes_read, int *status, const char *encoding_errors)
+    char* buffer_mmap_bytes(void *source, size_t nbytes,
+                            size_t *bytes_read, int *status,
+                            const char *encoding_errors)
 
     void uint_state_init(uint_state *self)
     int uint64_conflict(uint_state *self)
@@ -322,6 +326,11 @@ cdef char* buffer_rd_bytes_wrapper(void *source, size_t nbytes,
                                    const char *encoding_errors) noexcept:
     return buffer_rd_bytes(source, nbytes, bytes_read, status, encoding_errors)
 
+cdef char* buffer_mmap_bytes_wrapper(void *source, size_t nbytes,
+                                     size_t *bytes_read, int *status,
+                                     const char *encoding_errors) noexcept:
+    return buffer_mmap_bytes(source, nbytes, bytes_read, status, encoding_errors)
+
 cdef void del_rd_source_wrapper(void *src) noexcept:
     del_rd_source(src)
 
@@ -625,7 +634,12 @@ cdef class TextReader:
 
         ptr = new_rd_source(source)
         self.parser.source = ptr
-        self.parser.cb_io = buffer_rd_bytes_wrapper
+        if isinstance(source, mmap.mmap):
+            # tokenize the mapped pages in place instead of copying them
+            # through read()
+            self.parser.cb_io = buffer_mmap_bytes_wrapper
+        else:
+            self.parser.cb_io = buffer_rd_bytes_wrapper
         self.parser.cb_cleanup = del_rd_source_wrapper
 
     cdef _get_header(self, list prelim_header):
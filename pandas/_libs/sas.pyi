@@ -1,3 +1,7 @@
+import numpy as np
+
+from pandas._typing import npt
+
 from pandas.io.sas.sas7bdat import SAS7BDATReader
 
 class Parser:
@@ -5,3 +9,9 @@ class Parser:
     def read(self, nrows: int) -> None: ...
 
 def get_subheader_index(signature: bytes) -> int: ...
+def decompress_page(
+    page: bytes,
+    pointers: npt.NDArray[np.int64],
+    row_length: int,
+    compression: bytes,
+) -> npt.NDArray[np.uint8]: ...
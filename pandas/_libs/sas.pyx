@@ -13,6 +13,10 @@ from libc.stdlib cimport (
     calloc,
     free,
 )
+from libc.string cimport (
+    memcpy,
+    memset,
+)
 
 import numpy as np
 
@@ -36,12 +40,6 @@ cdef uint8_t buf_get(Buffer buf, size_t offset) except? 255:
     return buf.data[offset]
 
 
-cdef bint buf_set(Buffer buf, size_t offset, uint8_t value) except 0:
-    assert offset < buf.length, "Out of bounds write"
-    buf.data[offset] = value
-    return True
-
-
 cdef bytes buf_as_bytes(Buffer buf, size_t offset, size_t length):
     assert offset + length <= buf.length, "Out of bounds read"
     return buf.data[offset:offset+length]
@@ -58,179 +56,292 @@ cdef buf_free(Buffer buf):
     if buf.data != NULL:
         free(buf.data)
 
+
+# The decompression functions do not raise, so that they can run without the
+# GIL. They return the number of decompressed bytes, or one of these codes for
+# corrupt input, which check_decompressed turns into an exception.
+cdef enum:
+    decompress_out_of_bounds_read = -1
+    decompress_out_of_bounds_write = -2
+    # The control byte is subtracted from this code.
+    decompress_unknown_control_byte = -0x100
+
+
+cdef inline int buf_copy(
+    Buffer outbuff, size_t rpos, Buffer inbuff, size_t ipos, size_t nbytes
+) noexcept nogil:
+    if ipos + nbytes > inbuff.length:
+        return decompress_out_of_bounds_read
+    if rpos + nbytes > outbuff.length:
+        return decompress_out_of_bounds_write
+    memcpy(&outbuff.data[rpos], &inbuff.data[ipos], nbytes)
+    return 0
+
+
+cdef inline int buf_fill(
+    Buffer outbuff, size_t rpos, uint8_t value, size_t nbytes
+) noexcept nogil:
+    if rpos + nbytes > outbuff.length:
+        return decompress_out_of_bounds_write
+    memset(&outbuff.data[rpos], value, nbytes)
+    return 0
+
+
+cdef inline int buf_copy_pattern(
+    Buffer outbuff, size_t rpos, size_t ofs, size_t nbytes
+) noexcept nogil:
+    # The pattern may overlap the bytes being written, so copy byte by byte.
+    cdef size_t k
+    if ofs > rpos:
+        return decompress_out_of_bounds_read
+    if rpos + nbytes > outbuff.length:
+        return decompress_out_of_bounds_write
+    for k in range(nbytes):
+        outbuff.data[rpos + k] = outbuff.data[rpos - ofs + k]
+    return 0
+
+
+cdef int check_decompressed(int rpos, int row_length) except -1:
+    if rpos == decompress_out_of_bounds_read:
+        raise ValueError("Out of bounds read")
+    elif rpos == decompress_out_of_bounds_write:
+        raise ValueError("Out of bounds write")
+    elif rpos <= decompress_unknown_control_byte:
+        raise ValueError(
+            f"unknown control byte: {decompress_unknown_control_byte - rpos}"
+        )
+    elif rpos != row_length:
+        raise ValueError(
+            f"Expected decompressed line of length {row_length} bytes "
+            f"but decompressed {rpos} bytes"
+        )
+    return 0
+
+
 # rle_decompress decompresses data using a Run Length Encoding
 # algorithm.  It is partially documented here:
 #
 # https://cran.r-project.org/package=sas7bdat/vignettes/sas7bdat.pdf
 # Licence at LICENSES/SAS7BDAT_LICENSE
-cdef int rle_decompress(Buffer inbuff, Buffer outbuff) except? 0:
+cdef int rle_decompress(Buffer inbuff, Buffer outbuff) noexcept nogil:
 
     cdef:
-        uint8_t control_byte, x
-        int rpos = 0
-        int i, nbytes, end_of_first_byte
-        size_t ipos = 0
-        Py_ssize_t _
+        uint8_t control_byte
+        size_t end_of_first_byte, nbytes
+        size_t rpos = 0, ipos = 0
+        int err
 
     while ipos < inbuff.length:
-        control_byte = buf_get(inbuff, ipos) & 0xF0
-        end_of_first_byte = <int>(buf_get(inbuff, ipos) & 0x0F)
+        control_byte = inbuff.data[ipos] & 0xF0
+        end_of_first_byte = inbuff.data[ipos] & 0x0F
         ipos += 1
 
         if control_byte == 0x00:
-            nbytes = <int>(buf_get(inbuff, ipos)) + 64 + end_of_first_byte * 256
+            if ipos >= inbuff.length:
+                return decompress_out_of_bounds_read
+            nbytes = inbuff.data[ipos] + 64 + end_of_first_byte * 256
             ipos += 1
-            for _ in range(nbytes):
-                buf_set(outbuff, rpos, buf_get(inbuff, ipos))
-                rpos += 1
-                ipos += 1
+            err = buf_copy(outbuff, rpos, inbuff, ipos, nbytes)
+            ipos += nbytes
         elif control_byte == 0x40:
             # not documented
-            nbytes = <int>(buf_get(inbuff, ipos)) + 18 + end_of_first_byte * 256
-            ipos += 1
-            for _ in range(nbytes):
-                buf_set(outbuff, rpos, buf_get(inbuff, ipos))
-                rpos += 1
-            ipos += 1
+            if ipos + 1 >= inbuff.length:
+                return decompress_out_of_bounds_read
+            nbytes = inbuff.data[ipos] + 18 + end_of_first_byte * 256
+            err = buf_fill(outbuff, rpos, inbuff.data[ipos + 1], nbytes)
+            ipos += 2
         elif control_byte == 0x60:
-            nbytes = end_of_first_byte * 256 + <int>(buf_get(inbuff, ipos)) + 17
+            if ipos >= inbuff.length:
+                return decompress_out_of_bounds_read
+            nbytes = end_of_first_byte * 256 + inbuff.data[ipos] + 17
             ipos += 1
-            for _ in range(nbytes):
-                buf_set(outbuff, rpos, 0x20)
-                rpos += 1
+            err = buf_fill(outbuff, rpos, 0x20, nbytes)
         elif control_byte == 0x70:
-            nbytes = end_of_first_byte * 256 + <int>(buf_get(inbuff, ipos)) + 17
+            if ipos >= inbuff.length:
+                return decompress_out_of_bounds_read
+            nbytes = end_of_first_byte * 256 + inbuff.data[ipos] + 17
             ipos += 1
-            for _ in range(nbytes):
-                buf_set(outbuff, rpos, 0x00)
-                rpos += 1
+            err = buf_fill(outbuff, rpos, 0x00, nbytes)
         elif control_byte == 0x80:
             nbytes = end_of_first_byte + 1
-            for i in range(nbytes):
-                buf_set(outbuff, rpos, buf_get(inbuff, ipos + i))
-                rpos += 1
+            err = buf_copy(outbuff, rpos, inbuff, ipos, nbytes)
             ipos += nbytes
         elif control_byte == 0x90:
             nbytes = end_of_first_byte + 17
-            for i in range(nbytes):
-                buf_set(outbuff, rpos, buf_get(inbuff, ipos + i))
-                rpos += 1
+            err = buf_copy(outbuff, rpos, inbuff, ipos, nbytes)
             ipos += nbytes
         elif control_byte == 0xA0:
             nbytes = end_of_first_byte + 33
-            for i in range(nbytes):
-                buf_set(outbuff, rpos, buf_get(inbuff, ipos + i))
-                rpos += 1
+            err = buf_copy(outbuff, rpos, inbuff, ipos, nbytes)
             ipos += nbytes
         elif control_byte == 0xB0:
             nbytes = end_of_first_byte + 49
-            for i in range(nbytes):
-                buf_set(outbuff, rpos, buf_get(inbuff, ipos + i))
-                rpos += 1
+            err = buf_copy(outbuff, rpos, inbuff, ipos, nbytes)
             ipos += nbytes
         elif control_byte == 0xC0:
+            if ipos >= inbuff.length:
+                return decompress_out_of_bounds_read
             nbytes = end_of_first_byte + 3
-            x = buf_get(inbuff, ipos)
+            err = buf_fill(outbuff, rpos, inbuff.data[ipos], nbytes)
             ipos += 1
-            for _ in range(nbytes):
-                buf_set(outbuff, rpos, x)
-                rpos += 1
         elif control_byte == 0xD0:
             nbytes = end_of_first_byte + 2
-            for _ in range(nbytes):
-                buf_set(outbuff, rpos, 0x40)
-                rpos += 1
+            err = buf_fill(outbuff, rpos, 0x40, nbytes)
         elif control_byte == 0xE0:
             nbytes = end_of_first_byte + 2
-            for _ in range(nbytes):
-                buf_set(outbuff, rpos, 0x20)
-                rpos += 1
+            err = buf_fill(outbuff, rpos, 0x20, nbytes)
         elif control_byte == 0xF0:
             nbytes = end_of_first_byte + 2
-            for _ in range(nbytes):
-                buf_set(outbuff, rpos, 0x00)
-                rpos += 1
+            err = buf_fill(outbuff, rpos, 0x00, nbytes)
         else:
-            raise ValueError(f"unknown control byte: {control_byte}")
+            return decompress_unknown_control_byte - control_byte
+
+        if err:
+            return err
+        rpos += nbytes
 
-    return rpos
+    return <int>rpos
 
 
 # rdc_decompress decompresses data using the Ross Data Compression algorithm:
 #
 # http://collaboration.cmc.ec.gc.ca/science/rpn/biblio/ddj/Website/articles/CUJ/1992/9210/ross/ross.htm
-cdef int rdc_decompress(Buffer inbuff, Buffer outbuff) except? 0:
+cdef int rdc_decompress(Buffer inbuff, Buffer outbuff) noexcept nogil:
 
     cdef:
         uint8_t cmd
         uint16_t ctrl_bits = 0, ctrl_mask = 0, ofs, cnt
-        int rpos = 0, k, ii
-        size_t ipos = 0
-
-    ii = -1
+        size_t rpos = 0, ipos = 0
+        int err
 
     while ipos < inbuff.length:
-        ii += 1
         ctrl_mask = ctrl_mask >> 1
         if ctrl_mask == 0:
-            ctrl_bits = ((<uint16_t>buf_get(inbuff, ipos) << 8) +
-                         <uint16_t>buf_get(inbuff, ipos + 1))
+            if ipos + 1 >= inbuff.length:
+                return decompress_out_of_bounds_read
+            ctrl_bits = ((<uint16_t>inbuff.data[ipos] << 8) +
+                         <uint16_t>inbuff.data[ipos + 1])
             ipos += 2
             ctrl_mask = 0x8000
 
+        if ipos >= inbuff.length:
+            return decompress_out_of_bounds_read
+
         if ctrl_bits & ctrl_mask == 0:
-            buf_set(outbuff, rpos, buf_get(inbuff, ipos))
+            if rpos >= outbuff.length:
+                return decompress_out_of_bounds_write
+            outbuff.data[rpos] = inbuff.data[ipos]
             ipos += 1
             rpos += 1
             continue
 
-        cmd = (buf_get(inbuff, ipos) >> 4) & 0x0F
-        cnt = <uint16_t>(buf_get(inbuff, ipos) & 0x0F)
+        cmd = (inbuff.data[ipos] >> 4) & 0x0F
+        cnt = <uint16_t>(inbuff.data[ipos] & 0x0F)
         ipos += 1
 
         # short RLE
         if cmd == 0:
+            if ipos >= inbuff.length:
+                return decompress_out_of_bounds_read
             cnt += 3
-            for k in range(cnt):
-                buf_set(outbuff, rpos + k, buf_get(inbuff, ipos))
-            rpos += cnt
+            err = buf_fill(outbuff, rpos, inbuff.data[ipos], cnt)
             ipos += 1
 
         # long RLE
         elif cmd == 1:
-            cnt += <uint16_t>buf_get(inbuff, ipos) << 4
+            if ipos + 1 >= inbuff.length:
+                return decompress_out_of_bounds_read
+            cnt += <uint16_t>inbuff.data[ipos] << 4
             cnt += 19
-            ipos += 1
-            for k in range(cnt):
-                buf_set(outbuff, rpos + k, buf_get(inbuff, ipos))
-            rpos += cnt
-            ipos += 1
+            err = buf_fill(outbuff, rpos, inbuff.data[ipos + 1], cnt)
+            ipos += 2
 
         # long pattern
         elif cmd == 2:
+            if ipos + 1 >= inbuff.length:
+                return decompress_out_of_bounds_read
             ofs = cnt + 3
-            ofs += <uint16_t>buf_get(inbuff, ipos) << 4
-            ipos += 1
-            cnt = <uint16_t>buf_get(inbuff, ipos)
-            ipos += 1
-            cnt += 16
-            for k in range(cnt):
-                buf_set(outbuff, rpos + k, buf_get(outbuff, rpos - <int>ofs + k))
-            rpos += cnt
+            ofs += <uint16_t>inbuff.data[ipos] << 4
+            cnt = <uint16_t>inbuff.data[ipos + 1] + 16
+            ipos += 2
+            err = buf_copy_pattern(outbuff, rpos, ofs, cnt)
 
         # short pattern
         else:
+            if ipos >= inbuff.length:
+                return decompress_out_of_bounds_read
             ofs = cnt + 3
-            ofs += <uint16_t>buf_get(inbuff, ipos) << 4
+            ofs += <uint16_t>inbuff.data[ipos] << 4
             ipos += 1
-            for k in range(cmd):
-                buf_set(outbuff, rpos + k, buf_get(outbuff, rpos - <int>ofs + k))
-            rpos += cmd
+            cnt = cmd
+            err = buf_copy_pattern(outbuff, rpos, ofs, cnt)
+
+        if err:
+            return err
+        rpos += cnt
+
+    return <int>rpos
+
+
+def decompress_page(
+    const uint8_t[:] page,
+    const int64_t[:, :] pointers,
+    int row_length,
+    bytes compression,
+):
+    """
+    Decompress the rows of a page without holding the GIL.
 
-    return rpos
+    Row ``i`` is found at ``page[offset:offset + length]`` with
+    ``offset, length = pointers[i]`` and is written to line ``i`` of the
+    returned ``(len(pointers), row_length)`` uint8 array.
+    """
+    cdef:
+        Py_ssize_t i, n = pointers.shape[0]
+        int64_t offset, length
+        int rpos = row_length
+        int (*decompress)(Buffer, Buffer) noexcept nogil
+        const uint8_t *source
+        uint8_t *target
+        uint8_t[:, :] rows
+
+    if compression == const.rle_compression:
+        decompress = rle_decompress
+    elif compression == const.rdc_compression:
+        decompress = rdc_decompress
+    else:
+        raise ValueError(f"unknown compression: {compression}")
+
+    result = np.empty((n, row_length), dtype=np.uint8)
+    if n == 0 or row_length == 0:
+        return result
+    rows = result
+    source = &page[0]
+    target = &rows[0, 0]
+
+    with nogil:
+        for i in range(n):
+            offset = pointers[i, 0]
+            length = pointers[i, 1]
+            if offset < 0 or offset + length > page.shape[0]:
+                rpos = decompress_out_of_bounds_read
+                break
+            if length < row_length:
+                rpos = decompress(
+                    Buffer(<uint8_t *>&source[offset], length),
+                    Buffer(&target[i * row_length], row_length),
+                )
+                if rpos != row_length:
+                    break
+            else:
+                memcpy(&target[i * row_length], &source[offset], row_length)
+
+    check_decompressed(rpos, row_length)
+    return result
 
 
 cdef enum ColumnTypes:
+    column_type_skip = 0
     column_type_decimal = 1
     column_type_string = 2
 
@@ -311,6 +422,8 @@ cdef class Parser:
         object[:, :] string_chunk
         uint8_t *cached_page
         int cached_page_len
+        uint8_t[:, :] decompressed_page
+        bint page_decompressed
         int current_row_on_page_index
         int current_page_block_count
         int current_page_data_subheader_pointers_len
@@ -324,13 +437,14 @@ cdef class Parser:
         int subheader_pointer_length
         int current_page_type
         bint is_little_endian
-        int (*decompress)(Buffer, Buffer) except? 0
+        int (*decompress)(Buffer, Buffer) noexcept nogil
         object parser
 
     def __init__(self, object parser):
         cdef:
             int j
             char[:] column_types
+            list column_selected
 
         self.parser = parser
         self.blank_missing = parser.blank_missing
@@ -350,10 +464,13 @@ cdef class Parser:
         self.update_next_page()
 
         column_types = parser.column_types()
+        column_selected = parser._column_selected
 
-        # map column types
+        # map column types, the columns that are not selected are skipped
         for j in range(self.column_count):
-            if column_types[j] == b"d":
+            if not column_selected[j]:
+                self.column_types[j] = column_type_skip
+            elif column_types[j] == b"d":
                 self.column_types[j] = column_type_decimal
             elif column_types[j] == b"s":
                 self.column_types[j] = column_type_string
@@ -410,6 +527,11 @@ cdef class Parser:
             self.parser._current_page_data_subheader_pointers
         )
         self.current_page_subheaders_count = self.parser._current_page_subheaders_count
+        # the rows of the page may have been decompressed on a thread pool
+        decompressed_page = self.parser._current_page_decompressed
+        self.page_decompressed = decompressed_page is not None
+        if self.page_decompressed:
+            self.decompressed_page = decompressed_page
 
     cdef bint readline(self) except? True:
 
@@ -438,6 +560,14 @@ cdef class Parser:
                     if done:
                         return True
                     continue
+                if self.page_decompressed:
+                    self.process_row(
+                        Buffer(
+                            &self.decompressed_page[self.current_row_on_page_index, 0],
+                            self.row_length,
+                        )
+                    )
+                    return False
                 offset, length = self.parser._current_page_data_subheader_pointers[
                     self.current_row_on_page_index
                 ]
@@ -480,30 +610,34 @@ cdef class Parser:
     cdef void process_byte_array_with_data(self, int offset, int length) except *:
 
         cdef:
-            Py_ssize_t j
-            int s, k, m, jb, js, current_row, rpos
-            int64_t lngt, start, ct
             Buffer source, decompressed_source
-            int64_t[:] column_types
-            int64_t[:] lengths
-            int64_t[:] offsets
-            uint8_t[:, :] byte_chunk
-            object[:, :] string_chunk
-            bint compressed
 
         assert offset + length <= self.cached_page_len, "Out of bounds read"
         source = Buffer(&self.cached_page[offset], length)
 
-        compressed = self.decompress != NULL and length < self.row_length
-        if compressed:
+        if self.decompress != NULL and length < self.row_length:
             decompressed_source = buf_new(self.row_length)
-            rpos = self.decompress(source, decompressed_source)
-            if rpos != self.row_length:
-                raise ValueError(
-                    f"Expected decompressed line of length {self.row_length} bytes "
-                    f"but decompressed {rpos} bytes"
+            try:
+                check_decompressed(
+                    self.decompress(source, decompressed_source), self.row_length
                 )
-            source = decompressed_source
+                self.process_row(decompressed_source)
+            finally:
+                buf_free(decompressed_source)
+        else:
+            self.process_row(source)
+
+    cdef void process_row(self, Buffer source) except *:
+
+        cdef:
+            Py_ssize_t j
+            int s, k, m, jb, js, current_row
+            int64_t lngt, start, ct
+            int64_t[:] column_types
+            int64_t[:] lengths
+            int64_t[:] offsets
+            uint8_t[:, :] byte_chunk
+            object[:, :] string_chunk
 
         current_row = self.current_row_in_chunk_index
         column_types = self.column_types
@@ -520,7 +654,9 @@ cdef class Parser:
                 break
             start = offsets[j]
             ct = column_types[j]
-            if ct == column_type_decimal:
+            if ct == column_type_skip:
+                continue
+            elif ct == column_type_decimal:
                 # decimal
                 if self.is_little_endian:
                     m = s + 8 - lngt
@@ -544,6 +680,3 @@ cdef class Parser:
         self.current_row_on_page_index += 1
         self.current_row_in_chunk_index += 1
         self.current_row_in_file_index += 1
-
-        if compressed:
-            buf_free(decompressed_source)
@@ -25,6 +25,7 @@ void *new_rd_source(PyObject *obj) {
   rds->obj = obj;
   rds->buffer = NULL;
   rds->position = 0;
+  rds->view.obj = NULL;
 
   return (void *)rds;
 }
@@ -36,6 +37,9 @@ void *new_rd_source(PyObject *obj) {
  */
 
 void del_rd_source(void *rds) {
+  if (RDS(rds)->view.obj != NULL) {
+    PyBuffer_Release(&RDS(rds)->view);
+  }
   Py_XDECREF(RDS(rds)->obj);
   Py_XDECREF(RDS(rds)->buffer);
   free(rds);
@@ -97,3 +101,61 @@ char *buffer_rd_bytes(void *source, size_t nbytes, size_t *bytes_read,
 
   return retval;
 }
+
+/*
+  Memory-mapped file, tokenized in place
+*/
+
+char *buffer_mmap_bytes(void *source, size_t nbytes, size_t *bytes_read,
+                        int *status, const char *encoding_errors) {
+  rd_source *src = RDS(source);
+  PyGILState_STATE state = PyGILState_Ensure();
+
+  /* The tokenizer keeps pointers into the mapping between calls, e.g. from
+     one chunk to the next, so the view stays exported until the source is
+     deleted. Closing the mmap object before then raises a BufferError. */
+  if (src->view.obj == NULL &&
+      PyObject_GetBuffer(src->obj, &src->view, PyBUF_SIMPLE) != 0) {
+    src->view.obj = NULL;
+    goto failed;
+  }
+  char *data = (char *)src->view.buf;
+  const Py_ssize_t length = src->view.len;
+
+  /* advance the position of the mmap object like read() would */
+  PyObject *result = PyObject_CallMethod(src->obj, "tell", NULL);
+  if (result == NULL) {
+    goto failed;
+  }
+  const Py_ssize_t position = PyLong_AsSsize_t(result);
+  Py_DECREF(result);
+  if (position == -1 && PyErr_Occurred()) {
+    goto failed;
+  }
+
+  const Py_ssize_t remaining = position < length ? length - position : 0;
+  const Py_ssize_t count =
+      (Py_ssize_t)nbytes < remaining ? (Py_ssize_t)nbytes : remaining;
+
+  result = PyObject_CallMethod(src->obj, "seek", "n", position + count);
+  if (result == NULL) {
+    goto failed;
+  }
+  Py_DECREF(result);
+  PyGILState_Release(state);
+
+  if (count == 0)
+    *status = REACHED_EOF;
+  else
+    *status = 0;
+
+  *bytes_read = (size_t)count;
+
+  return data + position;
+
+failed:
+  PyGILState_Release(state);
+  *bytes_read = 0;
+  *status = CALLING_READ_FAILED;
+  return NULL;
+}
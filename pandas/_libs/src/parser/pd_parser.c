@@ -112,6 +112,7 @@ static int pandas_parser_exec(PyObject *Py_UNUSED(module)) {
   capi->new_rd_source = new_rd_source;
   capi->del_rd_source = del_rd_source;
   capi->buffer_rd_bytes = buffer_rd_bytes;
+  capi->buffer_mmap_bytes = buffer_mmap_bytes;
   capi->uint_state_init = uint_state_init;
   capi->uint64_conflict = uint64_conflict;
   capi->coliter_setup = coliter_setup;
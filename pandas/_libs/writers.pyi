@@ -1,6 +1,9 @@
 import numpy as np
 
-from pandas._typing import ArrayLike
+from pandas._typing import (
+    ArrayLike,
+    npt,
+)
 
 def write_csv_rows(
     data: list[ArrayLike],
@@ -9,6 +12,14 @@ def write_csv_rows(
     cols: np.ndarray,
     writer: object,  # _csv.writer
 ) -> None: ...
+def format_float_array(
+    values: np.ndarray,  # const float64_t[:]
+    na_rep: str,
+    format_code: str,
+    precision: int,
+    decimal: str = ...,
+    leading_space: bool = ...,
+) -> npt.NDArray[np.object_]: ...
 def convert_json_to_lines(arr: str) -> str: ...
 def max_len_string_array(
     arr: np.ndarray,  # pandas_string[:]
@@ -6,11 +6,21 @@ from cpython cimport (
     PyBytes_GET_SIZE,
     PyUnicode_GET_LENGTH,
 )
+from cpython.mem cimport PyMem_Free
+from cpython.unicode cimport PyUnicode_FromString
 from numpy cimport (
+    float64_t,
     ndarray,
     uint8_t,
 )
 
+
+cdef extern from "Python.h":
+    char* PyOS_double_to_string(
+        double val, char format_code, int precision, int flags, int* ptype
+    ) except NULL
+    int Py_DTSF_ADD_DOT_0
+
 ctypedef fused pandas_string:
     str
     bytes
@@ -76,6 +86,74 @@ def write_csv_rows(
         writer.writerows(rows[:((j + 1) % N)])
 
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def format_float_array(
+    const float64_t[:] values,
+    str na_rep,
+    str format_code,
+    int precision,
+    str decimal=".",
+    bint leading_space=False,
+) -> ndarray:
+    """
+    Convert floats to strings without calling into Python for each value.
+
+    Each value is formatted as ``"%.{precision}{format_code}" % value`` would,
+    or as ``str(value)`` for ``format_code`` 'r'. NaN is replaced by
+    ``na_rep``.
+
+    Parameters
+    ----------
+    values : ndarray[float64_t, ndim=1]
+    na_rep : str
+    format_code : {'r', 'e', 'E', 'f', 'F', 'g', 'G'}
+    precision : int
+        Ignored for 'r'.
+    decimal : str, default '.'
+        Replaces the decimal point.
+    leading_space : bool, default False
+        Whether to prefix a space to values without a minus sign.
+
+    Returns
+    -------
+    ndarray[object]
+    """
+    cdef:
+        Py_ssize_t i, length = values.shape[0]
+        ndarray[object] result = np.empty(length, dtype=object)
+        char code = ord(format_code)
+        int flags = 0
+        bint replace_decimal = decimal != "."
+        char* buf
+        double val
+        str text
+
+    if code == b"r":
+        flags = Py_DTSF_ADD_DOT_0
+        precision = 0
+
+    for i in range(length):
+        val = values[i]
+        if val != val:
+            result[i] = na_rep
+            continue
+
+        buf = PyOS_double_to_string(val, code, precision, flags, NULL)
+        try:
+            text = PyUnicode_FromString(buf)
+        finally:
+            PyMem_Free(buf)
+
+        if replace_decimal:
+            text = text.replace(".", decimal, 1)
+        if leading_space and not text.startswith("-"):
+            text = " " + text
+        result[i] = text
+
+    return result
+
+
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def convert_json_to_lines(arr: str) -> str:
@@ -581,6 +581,16 @@ parquet_engine_doc = """
     'auto', 'pyarrow', 'fastparquet', the default is 'auto'
 """
 
+parquet_metadata_cache_size_doc = """
+: int
+    The number of parquet file footers kept in memory by ``read_parquet`` with
+    ``where`` and the 'pyarrow' engine, to avoid parsing the footer of a local
+    file again as long as the file is not modified. The cache is only used by
+    such reads of a single local file without ``filters``, ``num_threads`` or
+    ``iterator``; other reads parse the footer every time. 0 disables the
+    cache.
+"""
+
 with cf.config_prefix("io.parquet"):
     cf.register_option(
         "engine",
@@ -588,6 +598,12 @@ with cf.config_prefix("io.parquet"):
         parquet_engine_doc,
         validator=is_one_of_factory(["auto", "pyarrow", "fastparquet"]),
     )
+    cf.register_option(
+        "metadata_cache_size",
+        128,
+        parquet_metadata_cache_size_doc,
+        validator=is_nonnegative_int,
+    )
 
 
 # Set up the io.sql specific configuration.
@@ -2316,6 +2316,7 @@ class NDFrame(PandasObject, indexing.IndexingMixin):
         indent: int | None = None,
         storage_options: StorageOptions | None = None,
         mode: Literal["a", "w"] = "w",
+        chunksize: int | None = None,
     ) -> str | None:
         """
         Convert the object to a JSON string.
@@ -2403,6 +2404,16 @@ class NDFrame(PandasObject, indexing.IndexingMixin):
             Accepted args are 'w' (writing) and 'a' (append) only.
             mode='a' is only supported when lines is True and orient is 'records'.
 
+        chunksize : int, optional
+            Number of rows to serialize at a time when writing line-delimited
+            json, which bounds the memory needed for the json representation
+            when writing to a file. Can only be passed if ``lines=True`` and
+            is only supported for a DataFrame. See
+            :func:`pandas.io.json.iter_json_lines` to iterate over the encoded
+            chunks instead.
+
+            .. versionadded:: 3.0.0
+
         Returns
         -------
         None or str
@@ -2603,6 +2614,7 @@ class NDFrame(PandasObject, indexing.IndexingMixin):
             indent=indent,
             storage_options=storage_options,
             mode=mode,
+            chunksize=chunksize,
         )
 
     @final
@@ -3674,6 +3686,7 @@ class NDFrame(PandasObject, indexing.IndexingMixin):
         decimal: str = ...,
         errors: OpenFileErrors = ...,
         storage_options: StorageOptions = ...,
+        num_threads: int | None = ...,
     ) -> str: ...
 
     @overload
@@ -3701,6 +3714,7 @@ class NDFrame(PandasObject, indexing.IndexingMixin):
         decimal: str = ...,
         errors: OpenFileErrors = ...,
         storage_options: StorageOptions = ...,
+        num_threads: int | None = ...,
     ) -> None: ...
 
     @final
@@ -3732,6 +3746,7 @@ class NDFrame(PandasObject, indexing.IndexingMixin):
         decimal: str = ".",
         errors: OpenFileErrors = "strict",
         storage_options: StorageOptions | None = None,
+        num_threads: int | None = None,
     ) -> str | None:
         r"""
         Write object to a comma-separated values (csv) file.
@@ -3819,6 +3834,14 @@ class NDFrame(PandasObject, indexing.IndexingMixin):
 
         {storage_options}
 
+        num_threads : int, optional
+            Number of threads used to format the rows. When larger than 1, the
+            chunks of ``chunksize`` rows are converted to text concurrently and
+            written in order, the output is identical to the one written by a
+            single thread.
+
+            .. versionadded:: 3.0.0
+
         Returns
         -------
         None or str
@@ -3891,6 +3914,7 @@ class NDFrame(PandasObject, indexing.IndexingMixin):
             doublequote=doublequote,
             escapechar=escapechar,
             storage_options=storage_options,
+            num_threads=num_threads,
         )
 
     # ----------------------------------------------------------------------
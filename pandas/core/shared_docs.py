@@ -338,9 +338,17 @@ _shared_docs["compression_options"] = """compression : str or dict, default 'inf
     As an example, the following could be passed for faster compression and to create
     a reproducible gzip archive:
     ``compression={'method': 'gzip', 'compresslevel': 1, 'mtime': 1}``.
+    For 'gzip', 'bz2' and 'xz', the key ``'threads'`` compresses blocks of the
+    output on that number of threads, concurrently with the conversion of the
+    data; the blocks are written as consecutive gzip members or bz2/xz streams,
+    which decompress to the same data. For 'zstd', ``'threads'`` is forwarded to
+    ``zstandard.ZstdCompressor``, which compresses on worker threads itself.
 
     .. versionadded:: 1.5.0
-        Added support for `.tar` files."""
+        Added support for `.tar` files.
+
+    .. versionadded:: 3.0.0
+        Added the ``'threads'`` key for 'gzip', 'bz2' and 'xz'."""
 
 _shared_docs["decompression_options"] = """compression : str or dict, default 'infer'
     For on-the-fly decompression of on-disk data. If 'infer' and '%s' is
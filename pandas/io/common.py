@@ -7,12 +7,18 @@ from abc import (
     abstractmethod,
 )
 import codecs
-from collections import defaultdict
+from collections import (
+    defaultdict,
+    deque,
+)
 from collections.abc import (
+    Callable,
     Hashable,
+    Iterator,
     Mapping,
     Sequence,
 )
+from concurrent.futures import ThreadPoolExecutor
 import dataclasses
 import functools
 import gzip
@@ -27,8 +33,10 @@ from io import (
 import mmap
 import os
 from pathlib import Path
+import queue
 import re
 import tarfile
+import threading
 from typing import (
     IO,
     TYPE_CHECKING,
@@ -73,10 +81,17 @@ _VALID_URLS = set(uses_relative + uses_netloc + uses_params)
 _VALID_URLS.discard("")
 _RFC_3986_PATTERN = re.compile(r"^[A-Za-z][A-Za-z0-9+\-+.]*://")
 
+# compression methods that can be written with the 'threads' option
+_THREADED_COMPRESSIONS = {"gzip", "bz2", "xz"}
+# number of bytes compressed at once with the 'threads' option
+_COMPRESSION_BLOCKSIZE = 1 << 22
+
 BaseBufferT = TypeVar("BaseBufferT", bound=BaseBuffer)
+_T = TypeVar("_T")
 
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
     from types import TracebackType
 
     from pandas._typing import (
@@ -759,8 +774,30 @@ def get_handle(
             # compression libraries to use binary mode.
             ioargs.mode += "b"
 
+        threads = None
+        if compression in _THREADED_COMPRESSIONS:
+            threads = compression_args.pop("threads", None)
+
+        # Block-parallel compression
+        if threads is not None:
+            if "r" in ioargs.mode:
+                raise ValueError(
+                    "The 'threads' compression option is only supported for writing"
+                )
+            if not is_integer(threads) or threads < 1:
+                raise ValueError("'threads' must be an integer >=1")
+            if isinstance(handle, str):
+                handle = open(handle, ioargs.mode.replace("b", "") + "b")
+                handles.append(handle)
+            handle = _ParallelCompressionWriter(
+                handle,
+                _get_block_compressor(compression, compression_args),
+                threads,
+                _COMPRESSION_BLOCKSIZE,
+            )
+
         # GZ Compression
-        if compression == "gzip":
+        elif compression == "gzip":
             if isinstance(handle, str):
                 # error: Incompatible types in assignment (expression has type
                 # "GzipFile", variable has type "Union[str, BaseBuffer]")
@@ -1066,6 +1103,89 @@ class _BytesZipFile(_BufferedWriter):
         self.buffer.writestr(archive_name, self.getvalue())
 
 
+def _get_block_compressor(
+    compression: str, compression_args: dict[str, Any]
+) -> Callable[[bytes], bytes]:
+    """Function compressing a block into a complete gzip member, bz2 or xz stream."""
+    if compression == "gzip":
+        return functools.partial(gzip.compress, **compression_args)
+    elif compression == "bz2":
+        import bz2
+
+        return functools.partial(bz2.compress, **compression_args)
+    else:
+        import lzma
+
+        return functools.partial(lzma.compress, **compression_args)
+
+
+class _ParallelCompressionWriter(BufferedIOBase):
+    """
+    Write-only buffer compressing the written bytes on a thread pool.
+
+    The bytes are cut into blocks that are compressed independently, e.g. into
+    consecutive gzip members, which decompressors read back as a single stream.
+    The compressors release the GIL, so compression overlaps with the
+    formatting done by the writing thread. The compressed blocks are written
+    to ``buffer`` in order.
+    """
+
+    def __init__(
+        self,
+        buffer: BaseBuffer,
+        compress: Callable[[bytes], bytes],
+        threads: int,
+        blocksize: int = _COMPRESSION_BLOCKSIZE,
+    ) -> None:
+        super().__init__()
+        self.buffer = buffer
+        self.compress = compress
+        self.threads = threads
+        self.blocksize = blocksize
+        self._block = bytearray()
+        self._nblocks = 0
+        self._pending: deque[Future[bytes]] = deque()
+        self._executor = ThreadPoolExecutor(max_workers=threads)
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: bytes) -> int:  # type: ignore[override]
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+        self._block += data
+        if len(self._block) >= self.blocksize:
+            self._submit_block()
+        return memoryview(data).nbytes
+
+    def _submit_block(self) -> None:
+        # bound the number of blocks held in memory
+        while len(self._pending) >= 2 * self.threads:
+            self._write_compressed()
+        block = bytes(self._block)
+        self._block.clear()
+        self._pending.append(self._executor.submit(self.compress, block))
+        self._nblocks += 1
+
+    def _write_compressed(self) -> None:
+        compressed = self._pending.popleft().result()
+        # error: "BaseBuffer" has no attribute "write"
+        self.buffer.write(compressed)  # type: ignore[attr-defined]
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        try:
+            # an empty input still needs one (empty) member
+            if self._block or not self._nblocks:
+                self._submit_block()
+            while self._pending:
+                self._write_compressed()
+        finally:
+            self._executor.shutdown(cancel_futures=True)
+            super().close()
+
+
 class _IOWrapper:
     # TextIOWrapper is overly strict: it request that the buffer has seekable, readable,
     # and writable. If we have a read-only buffer, we shouldn't need writable and vice
@@ -1279,3 +1399,49 @@ def dedup_names(
         counts[col] = cur_count + 1
 
     return names
+
+
+def prefetch_iter(iterator: Iterator[_T], prefetch: int) -> Iterator[_T]:
+    """
+    Yield the items of ``iterator``, produced in a background thread.
+
+    At most ``prefetch`` items are produced ahead of the consumer and an
+    exception raised by ``iterator`` is re-raised in the consumer. Close the
+    returned generator (e.g. with ``contextlib.closing``) when it is not
+    exhausted, so that the background thread stops.
+    """
+    items: queue.Queue = queue.Queue(maxsize=prefetch)
+    stop = threading.Event()
+    end = object()
+
+    def produce() -> None:
+        try:
+            for item in iterator:
+                items.put((item, None))
+                if stop.is_set():
+                    return
+        except Exception as err:
+            items.put((end, err))
+        else:
+            items.put((end, None))
+
+    thread = threading.Thread(target=produce, daemon=True)
+    thread.start()
+    try:
+        while True:
+            item, err = items.get()
+            if err is not None:
+                raise err
+            if item is end:
+                break
+            yield item
+    finally:
+        # the producing thread puts at most one more item once stop is set,
+        # which fits in the emptied queue
+        stop.set()
+        while True:
+            try:
+                items.get_nowait()
+            except queue.Empty:
+                break
+        thread.join()
@@ -7,9 +7,12 @@ from collections.abc import (
     Mapping,
     Sequence,
 )
+from concurrent.futures import ProcessPoolExecutor
 import datetime
 from functools import partial
+from io import BytesIO
 import os
+import pickle
 from textwrap import fill
 from typing import (
     IO,
@@ -281,6 +284,19 @@ dtype_backend : {{'numpy_nullable', 'pyarrow'}}
 
 engine_kwargs : dict, optional
     Arbitrary keyword arguments passed to excel engine.
+num_workers : int, optional
+    Number of processes used to read the sheets when several sheets are
+    requested with ``sheet_name``. The content of the workbook is read into
+    memory once and each process opens its own handle to it, the sheets are
+    then parsed concurrently and the DataFrames sent back. The result is the
+    same as when reading the sheets one after the other. Starting the
+    processes has a cost, so this only pays off for large sheets. Where
+    processes are started with ``spawn``, e.g. on Windows, the calling
+    script has to be guarded by ``if __name__ == "__main__":``. Ignored when
+    ``io`` is a workbook object of the engine, e.g. an ``xlrd.Book``, or when
+    the options cannot be pickled, e.g. a lambda in ``converters``.
+
+    .. versionadded:: 3.0.0
 
 Returns
 -------
@@ -392,6 +408,7 @@ def read_excel(
     skipfooter: int = ...,
     storage_options: StorageOptions = ...,
     dtype_backend: DtypeBackend | lib.NoDefault = ...,
+    num_workers: int | None = ...,
 ) -> DataFrame: ...
 
 
@@ -429,6 +446,7 @@ def read_excel(
     skipfooter: int = ...,
     storage_options: StorageOptions = ...,
     dtype_backend: DtypeBackend | lib.NoDefault = ...,
+    num_workers: int | None = ...,
 ) -> dict[IntStrT, DataFrame]: ...
 
 
@@ -467,6 +485,7 @@ def read_excel(
     storage_options: StorageOptions | None = None,
     dtype_backend: DtypeBackend | lib.NoDefault = lib.no_default,
     engine_kwargs: dict | None = None,
+    num_workers: int | None = None,
 ) -> DataFrame | dict[IntStrT, DataFrame]:
     check_dtype_backend(dtype_backend)
     should_close = False
@@ -511,6 +530,7 @@ def read_excel(
             comment=comment,
             skipfooter=skipfooter,
             dtype_backend=dtype_backend,
+            num_workers=num_workers,
         )
     finally:
         # make sure to close opened file handles
@@ -522,8 +542,133 @@ def read_excel(
 _WorkbookT = TypeVar("_WorkbookT")
 
 
+class _CellSelection:
+    """
+    Track which cells of a sheet are used when parsing it.
+
+    Readers that support it convert only the cells of the rows kept by
+    ``skiprows`` and of the columns selected by ``usecols``, and keep a
+    cheap placeholder for the other cells so the shape of the sheet data is
+    unchanged. The rows up to the header are always converted in full,
+    since string ``usecols`` are resolved against the header.
+
+    Parameters
+    ----------
+    header : int or None
+        See read_excel docstring.
+    names : array-like or None
+        See read_excel docstring.
+    usecols : list-like, callable or None
+        The ``usecols`` argument after ``maybe_convert_usecols``.
+    skiprows : list-like, int, callable, or None
+        See read_excel docstring.
+    """
+
+    def __init__(
+        self,
+        header: int | None = None,
+        names: SequenceNotStr[Hashable] | range | None = None,
+        usecols=None,
+        skiprows: Sequence[int] | int | Callable[[int], object] | None = None,
+    ) -> None:
+        self._skiprows: Callable[[int], object] | None
+        if skiprows is None or callable(skiprows):
+            self._skiprows = skiprows
+        elif is_integer(skiprows):
+            self._skiprows = range(skiprows).__contains__
+        elif is_list_like(skiprows):
+            self._skiprows = set(skiprows).__contains__
+        else:
+            # invalid skiprows are reported by the parser
+            self._skiprows = None
+
+        self._header_rows = 0 if header is None else header + 1
+        self._rows_seen = 0
+        self._columns: set[int] | None = None
+        self._usecols_names: set[str] | None = None
+        if is_list_like(usecols) and not isinstance(usecols, dict) and len(usecols):
+            if all(is_integer(col) and col >= 0 for col in usecols):
+                self._columns = set(usecols)
+            elif (
+                header is not None
+                and names is None
+                and all(isinstance(col, str) for col in usecols)
+            ):
+                self._usecols_names = set(usecols)
+
+    def convert_row(
+        self,
+        row_number: int,
+        cells: Sequence,
+        convert: Callable[[Any], Any],
+        placeholder: Callable[[Any], Any] | None = None,
+    ) -> list:
+        """
+        Convert the cells of a row that are needed to parse the sheet.
+
+        Parameters
+        ----------
+        row_number : int
+            Position of the row in the sheet.
+        cells : sequence
+            The raw cells of the row.
+        convert : callable
+            Converts a raw cell to its value.
+        placeholder : callable, optional
+            Returns the value kept for a cell that is not needed. It must
+            return ``""`` for empty cells if the reader trims trailing empty
+            cells. By default, ``None`` is kept.
+
+        Returns
+        -------
+        list
+        """
+        if self._skiprows is not None and self._skiprows(row_number):
+            return self._placeholders(cells, placeholder, None)
+        if self._rows_seen < self._header_rows or self._columns is None:
+            converted = [convert(cell) for cell in cells]
+            if self._rows_seen < self._header_rows:
+                self._rows_seen += 1
+                if self._rows_seen == self._header_rows and self._usecols_names:
+                    self._resolve_usecols_names(converted)
+            return converted
+
+        converted = self._placeholders(cells, placeholder, self._columns)
+        for i in self._columns:
+            if i < len(cells):
+                converted[i] = convert(cells[i])
+        return converted
+
+    def _placeholders(
+        self,
+        cells: Sequence,
+        placeholder: Callable[[Any], Any] | None,
+        columns: set[int] | None,
+    ) -> list:
+        if placeholder is None:
+            return [None] * len(cells)
+        if columns is None:
+            return [placeholder(cell) for cell in cells]
+        return [
+            None if i in columns else placeholder(cell) for i, cell in enumerate(cells)
+        ]
+
+    def _resolve_usecols_names(self, header_row: list) -> None:
+        # Columns are only pruned if all the names are found in the header
+        columns = {
+            i
+            for i, name in enumerate(header_row)
+            if isinstance(name, str) and name in self._usecols_names
+        }
+        found = {header_row[i] for i in columns}
+        if found == self._usecols_names:
+            self._columns = columns
+
+
 class BaseExcelReader(Generic[_WorkbookT]):
     book: _WorkbookT
+    # Whether get_sheet_data accepts a _CellSelection of the cells to convert
+    _supports_cell_selection = False
 
     def __init__(
         self,
@@ -533,6 +678,7 @@ class BaseExcelReader(Generic[_WorkbookT]):
     ) -> None:
         if engine_kwargs is None:
             engine_kwargs = {}
+        self._engine_kwargs = engine_kwargs
 
         self.handles = IOHandles(
             handle=filepath_or_buffer, compression={"method": None}
@@ -715,10 +861,12 @@ class BaseExcelReader(Generic[_WorkbookT]):
         comment: str | None = None,
         skipfooter: int = 0,
         dtype_backend: DtypeBackend | lib.NoDefault = lib.no_default,
+        num_workers: int | None = None,
         **kwds,
     ):
         validate_header_arg(header)
         validate_integer("nrows", nrows)
+        num_workers = validate_integer("num_workers", num_workers, 1)
 
         ret_dict = False
 
@@ -738,61 +886,130 @@ class BaseExcelReader(Generic[_WorkbookT]):
         # handle same-type duplicates.
         sheets = cast(Union[list[int], list[str]], list(dict.fromkeys(sheets).keys()))
 
-        output = {}
-
-        last_sheetname = None
-        for asheetname in sheets:
-            last_sheetname = asheetname
-            if verbose:
-                print(f"Reading sheet {asheetname}")
-
-            if isinstance(asheetname, str):
-                sheet = self.get_sheet_by_name(asheetname)
-            else:  # assume an integer if not a string
-                sheet = self.get_sheet_by_index(asheetname)
+        file_rows_needed = self._calc_rows(header, index_col, skiprows, nrows)
+        usecols = maybe_convert_usecols(usecols)
+        use_cell_selection = (
+            self._supports_cell_selection
+            and (usecols is not None or skiprows is not None)
+            and comment is None
+            and not is_list_like(header)
+            and not is_list_like(index_col)
+        )
 
-            file_rows_needed = self._calc_rows(header, index_col, skiprows, nrows)
-            data = self.get_sheet_data(sheet, file_rows_needed)
-            if hasattr(sheet, "close"):
-                # pyxlsb opens two TemporaryFiles
-                sheet.close()
-            usecols = maybe_convert_usecols(usecols)
-
-            if not data:
-                output[asheetname] = DataFrame()
-                continue
-
-            output = self._parse_sheet(
-                data=data,
-                output=output,
-                asheetname=asheetname,
-                header=header,
-                names=names,
-                index_col=index_col,
-                usecols=usecols,
-                dtype=dtype,
-                skiprows=skiprows,
-                nrows=nrows,
-                true_values=true_values,
-                false_values=false_values,
-                na_values=na_values,
-                parse_dates=parse_dates,
-                date_format=date_format,
-                thousands=thousands,
-                decimal=decimal,
-                comment=comment,
-                skipfooter=skipfooter,
-                dtype_backend=dtype_backend,
-                **kwds,
-            )
+        parse_kwargs = {
+            "header": header,
+            "names": names,
+            "index_col": index_col,
+            "usecols": usecols,
+            "dtype": dtype,
+            "skiprows": skiprows,
+            "nrows": nrows,
+            "true_values": true_values,
+            "false_values": false_values,
+            "na_values": na_values,
+            "parse_dates": parse_dates,
+            "date_format": date_format,
+            "thousands": thousands,
+            "decimal": decimal,
+            "comment": comment,
+            "skipfooter": skipfooter,
+            "dtype_backend": dtype_backend,
+            **kwds,
+        }
+        sheet_kwargs = {
+            "file_rows_needed": file_rows_needed,
+            "use_cell_selection": use_cell_selection,
+            "parse_kwargs": parse_kwargs,
+        }
+
+        content = None
+        if num_workers is not None and num_workers > 1 and len(sheets) > 1:
+            content = self._read_workbook_content()
+            if content is not None:
+                try:
+                    # the options are sent to the worker processes
+                    pickle.dumps(sheet_kwargs)
+                except (pickle.PicklingError, AttributeError, TypeError):
+                    # e.g. a lambda in converters
+                    content = None
 
-        if last_sheetname is None:
+        output = {}
+        if content is None:
+            for asheetname in sheets:
+                if verbose:
+                    print(f"Reading sheet {asheetname}")
+                output[asheetname] = self._read_sheet(asheetname, **sheet_kwargs)
+        else:
+            # each worker process reads the sheets from its own handle to the
+            # workbook, as the engines parse the sheets holding the GIL
+            with ProcessPoolExecutor(
+                max_workers=min(num_workers, len(sheets)),
+                initializer=_open_worker_reader,
+                initargs=(type(self), content, self._engine_kwargs),
+            ) as executor:
+                futures = [
+                    executor.submit(_read_worker_sheet, asheetname, sheet_kwargs)
+                    for asheetname in sheets
+                ]
+                for asheetname, future in zip(sheets, futures):
+                    if verbose:
+                        print(f"Reading sheet {asheetname}")
+                    output[asheetname] = future.result()
+
+        if not sheets:
             raise ValueError("Sheet name is an empty list")
 
         if ret_dict:
             return output
         else:
-            return output[last_sheetname]
+            return output[sheets[-1]]
+
+    def _read_sheet(
+        self,
+        asheetname: str | int,
+        file_rows_needed: int | None,
+        use_cell_selection: bool,
+        parse_kwargs: dict[str, Any],
+    ) -> DataFrame:
+        if isinstance(asheetname, str):
+            sheet = self.get_sheet_by_name(asheetname)
+        else:  # assume an integer if not a string
+            sheet = self.get_sheet_by_index(asheetname)
+
+        if use_cell_selection:
+            selection = _CellSelection(
+                cast(Union[int, None], parse_kwargs["header"]),
+                parse_kwargs["names"],
+                parse_kwargs["usecols"],
+                parse_kwargs["skiprows"],
+            )
+            data = self.get_sheet_data(sheet, file_rows_needed, selection)
+        else:
+            data = self.get_sheet_data(sheet, file_rows_needed)
+        if hasattr(sheet, "close"):
+            # pyxlsb opens two TemporaryFiles
+            sheet.close()
+
+        if not data:
+            return DataFrame()
+
+        output = self._parse_sheet(
+            data=data, output={}, asheetname=asheetname, **parse_kwargs
+        )
+        return output[asheetname]
+
+    def _read_workbook_content(self) -> bytes | None:
+        """
+        Read the raw content of the workbook to open it again.
+
+        Returns None if the workbook was passed as a workbook object of the
+        engine, which cannot be opened again.
+        """
+        handle = self.handles.handle
+        if isinstance(handle, self._workbook_class) or not hasattr(handle, "read"):
+            return None
+        handle.seek(0)
+        return handle.read()
 
     def _parse_sheet(
         self,
@@ -949,6 +1166,25 @@ class BaseExcelReader(Generic[_WorkbookT]):
         return output
 
 
+# reader of the workbook in a worker process of BaseExcelReader.parse, closed
+# when the process exits
+_worker_reader: BaseExcelReader | None = None
+
+
+def _open_worker_reader(
+    reader_class: type[BaseExcelReader],
+    content: bytes,
+    engine_kwargs: dict | None,
+) -> None:
+    global _worker_reader
+    _worker_reader = reader_class(BytesIO(content), engine_kwargs=engine_kwargs)
+
+
+def _read_worker_sheet(asheetname: str | int, kwargs: dict[str, Any]) -> DataFrame:
+    assert _worker_reader is not None
+    return _worker_reader._read_sheet(asheetname, **kwargs)
+
+
 @doc(storage_options=_shared_docs["storage_options"])
 class ExcelWriter(Generic[_WorkbookT]):
     """
@@ -1230,6 +1466,42 @@ class ExcelWriter(Generic[_WorkbookT]):
         """
         raise NotImplementedError
 
+    def _write_rows(
+        self,
+        rows: Iterable[list],
+        sheet_name: str | None = None,
+        startrow: int = 0,
+        startcol: int = 0,
+        freeze_panes: tuple[int, int] | None = None,
+    ) -> None:
+        """
+        Write given rows of formatted values into an excel sheet
+
+        Engines can write the rows in order without creating a cell object
+        for each value. By default, the values are written with _write_cells.
+
+        Parameters
+        ----------
+        rows : iterable of lists
+            formatted values of the consecutive rows of the sheet, cells that
+            are not written are None
+        sheet_name : str, default None
+            Name of Excel sheet, if None, then use self.cur_sheet
+        startrow : upper left cell row to dump data frame
+        startcol : upper left cell column to dump data frame
+        freeze_panes: int tuple of length 2
+            contains the bottom-most row and right-most column to freeze
+        """
+        from pandas.io.formats.excel import ExcelCell
+
+        cells = (
+            ExcelCell(rownum, colnum, val)
+            for rownum, row in enumerate(rows)
+            for colnum, val in enumerate(row)
+            if val is not None
+        )
+        self._write_cells(cells, sheet_name, startrow, startcol, freeze_panes)
+
     def _save(self) -> None:
         """
         Save workbook to disk.
@@ -1631,6 +1903,7 @@ class ExcelFile:
         comment: str | None = None,
         skipfooter: int = 0,
         dtype_backend: DtypeBackend | lib.NoDefault = lib.no_default,
+        num_workers: int | None = None,
         **kwds,
     ) -> DataFrame | dict[str, DataFrame] | dict[int, DataFrame]:
         """
@@ -1740,6 +2013,11 @@ class ExcelFile:
               :class:`ArrowDtype` :class:`DataFrame`
 
             .. versionadded:: 2.0
+        num_workers : int, optional
+            Number of processes used to read the sheets when several sheets are
+            requested. See the read_excel docstring for more info.
+
+            .. versionadded:: 3.0.0
         **kwds : dict, optional
             Arbitrary keyword arguments passed to excel engine.
 
@@ -1779,6 +2057,7 @@ class ExcelFile:
             comment=comment,
             skipfooter=skipfooter,
             dtype_backend=dtype_backend,
+            num_workers=num_workers,
             **kwds,
         )
 
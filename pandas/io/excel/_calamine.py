@@ -6,6 +6,7 @@ from datetime import (
     time,
     timedelta,
 )
+from itertools import islice
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -21,6 +22,8 @@ from pandas.core.shared_docs import _shared_docs
 from pandas.io.excel._base import BaseExcelReader
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from python_calamine import (
         CalamineSheet,
         CalamineWorkbook,
@@ -34,10 +37,14 @@ if TYPE_CHECKING:
         StorageOptions,
     )
 
+    from pandas.io.excel._base import _CellSelection
+
 _CellValue = Union[int, float, str, bool, time, date, datetime, timedelta]
 
 
 class CalamineReader(BaseExcelReader["CalamineWorkbook"]):
+    _supports_cell_selection = True
+
     @doc(storage_options=_shared_docs["storage_options"])
     def __init__(
         self,
@@ -98,7 +105,10 @@ class CalamineReader(BaseExcelReader["CalamineWorkbook"]):
         return self.book.get_sheet_by_index(index)
 
     def get_sheet_data(
-        self, sheet: CalamineSheet, file_rows_needed: int | None = None
+        self,
+        sheet: CalamineSheet,
+        file_rows_needed: int | None = None,
+        selection: _CellSelection | None = None,
     ) -> list[list[Scalar | NaTType | time]]:
         def _convert_cell(value: _CellValue) -> Scalar | NaTType | time:
             if isinstance(value, float):
@@ -116,9 +126,25 @@ class CalamineReader(BaseExcelReader["CalamineWorkbook"]):
 
             return value
 
-        rows: list[list[_CellValue]] = sheet.to_python(
-            skip_empty_area=False, nrows=file_rows_needed
-        )
-        data = [[_convert_cell(cell) for cell in row] for row in rows]
-
-        return data
+        if selection is None:
+            rows: list[list[_CellValue]] = sheet.to_python(
+                skip_empty_area=False, nrows=file_rows_needed
+            )
+            return [[_convert_cell(cell) for cell in row] for row in rows]
+
+        if hasattr(sheet, "iter_rows"):
+            # Stream the rows rather than materializing the whole sheet first.
+            # iter_rows starts at the first row but at the first used column.
+            start_column = sheet.start[1] if sheet.start is not None else 0
+            row_iter: Iterable[list[_CellValue]] = islice(
+                sheet.iter_rows(), file_rows_needed
+            )
+            if start_column:
+                leading_cells: list[_CellValue] = [""] * start_column
+                row_iter = (leading_cells + row for row in row_iter)
+        else:
+            row_iter = sheet.to_python(skip_empty_area=False, nrows=file_rows_needed)
+        return [
+            selection.convert_row(row_number, row, _convert_cell)
+            for row_number, row in enumerate(row_iter)
+        ]
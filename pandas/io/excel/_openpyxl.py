@@ -37,6 +37,8 @@ if TYPE_CHECKING:
         WriteExcelBuffer,
     )
 
+    from pandas.io.excel._base import _CellSelection
+
 
 class OpenpyxlWriter(ExcelWriter):
     _engine = "openpyxl"
@@ -440,19 +442,11 @@ class OpenpyxlWriter(ExcelWriter):
 
         return Protection(**protection_dict)
 
-    def _write_cells(
-        self,
-        cells,
-        sheet_name: str | None = None,
-        startrow: int = 0,
-        startcol: int = 0,
-        freeze_panes: tuple[int, int] | None = None,
-    ) -> None:
-        # Write the frame cells using openpyxl.
+    def _get_worksheet(
+        self, sheet_name: str | None, freeze_panes: tuple[int, int] | None
+    ):
         sheet_name = self._get_sheet_name(sheet_name)
 
-        _style_cache: dict[str, dict[str, Serialisable]] = {}
-
         if sheet_name in self.sheets and self._if_sheet_exists != "new":
             if "r+" in self._mode:
                 if self._if_sheet_exists == "replace":
@@ -480,9 +474,69 @@ class OpenpyxlWriter(ExcelWriter):
 
         if validate_freeze_panes(freeze_panes):
             freeze_panes = cast(tuple[int, int], freeze_panes)
-            wks.freeze_panes = wks.cell(
-                row=freeze_panes[0] + 1, column=freeze_panes[1] + 1
-            )
+            if self.book.write_only:
+                from openpyxl.utils import get_column_letter
+
+                # cells cannot be accessed in a write-only worksheet
+                wks.freeze_panes = (
+                    f"{get_column_letter(freeze_panes[1] + 1)}{freeze_panes[0] + 1}"
+                )
+            else:
+                wks.freeze_panes = wks.cell(
+                    row=freeze_panes[0] + 1, column=freeze_panes[1] + 1
+                )
+        return wks
+
+    def _write_rows(
+        self,
+        rows,
+        sheet_name: str | None = None,
+        startrow: int = 0,
+        startcol: int = 0,
+        freeze_panes: tuple[int, int] | None = None,
+    ) -> None:
+        # Write the frame rows using openpyxl.
+        wks = self._get_worksheet(sheet_name, freeze_panes)
+
+        if not self.book.write_only:
+            for rownum, row in enumerate(rows, startrow + 1):
+                for colnum, val in enumerate(row, startcol + 1):
+                    if val is None:
+                        continue
+                    xcell = wks.cell(row=rownum, column=colnum)
+                    xcell.value, fmt = self._value_with_fmt(val)
+                    if fmt:
+                        xcell.number_format = fmt
+            return
+
+        # The rows of a write-only worksheet can only be appended
+        from openpyxl.cell import WriteOnlyCell
+
+        for _ in range(startrow):
+            wks.append([])
+        for row in rows:
+            values: list = [None] * startcol
+            for val in row:
+                if val is not None:
+                    val, fmt = self._value_with_fmt(val)
+                    if fmt:
+                        val = WriteOnlyCell(wks, value=val)
+                        val.number_format = fmt
+                values.append(val)
+            wks.append(values)
+
+    def _write_cells(
+        self,
+        cells,
+        sheet_name: str | None = None,
+        startrow: int = 0,
+        startcol: int = 0,
+        freeze_panes: tuple[int, int] | None = None,
+    ) -> None:
+        # Write the frame cells using openpyxl.
+        _style_cache: dict[str, dict[str, Serialisable]] = {}
+
+        wks = self._get_worksheet(sheet_name, freeze_panes)
 
         for cell in cells:
             xcell = wks.cell(
@@ -532,6 +586,8 @@ class OpenpyxlWriter(ExcelWriter):
 
 
 class OpenpyxlReader(BaseExcelReader["Workbook"]):
+    _supports_cell_selection = True
+
     @doc(storage_options=_shared_docs["storage_options"])
     def __init__(
         self,
@@ -605,8 +661,18 @@ class OpenpyxlReader(BaseExcelReader["Workbook"]):
 
         return cell.value
 
+    @staticmethod
+    def _cell_placeholder(cell) -> Scalar | None:
+        # Keep empty cells as "" so that trailing empty cells are still trimmed
+        if cell.value is None or cell.value == "":
+            return ""
+        return None
+
     def get_sheet_data(
-        self, sheet, file_rows_needed: int | None = None
+        self,
+        sheet,
+        file_rows_needed: int | None = None,
+        selection: _CellSelection | None = None,
     ) -> list[list[Scalar]]:
         if self.book.read_only:
             sheet.reset_dimensions()
@@ -614,7 +680,12 @@ class OpenpyxlReader(BaseExcelReader["Workbook"]):
         data: list[list[Scalar]] = []
         last_row_with_data = -1
         for row_number, row in enumerate(sheet.rows):
-            converted_row = [self._convert_cell(cell) for cell in row]
+            if selection is None:
+                converted_row = [self._convert_cell(cell) for cell in row]
+            else:
+                converted_row = selection.convert_row(
+                    row_number, row, self._convert_cell, self._cell_placeholder
+                )
             while converted_row and converted_row[-1] == "":
                 # trim trailing empty elements
                 converted_row.pop()
@@ -238,6 +238,47 @@ class XlsxWriter(ExcelWriter):
         """
         self.book.close()
 
+    def _get_worksheet(
+        self, sheet_name: str | None, freeze_panes: tuple[int, int] | None
+    ):
+        sheet_name = self._get_sheet_name(sheet_name)
+
+        wks = self.book.get_worksheet_by_name(sheet_name)
+        if wks is None:
+            wks = self.book.add_worksheet(sheet_name)
+
+        if validate_freeze_panes(freeze_panes):
+            wks.freeze_panes(*(freeze_panes))
+        return wks
+
+    def _write_rows(
+        self,
+        rows,
+        sheet_name: str | None = None,
+        startrow: int = 0,
+        startcol: int = 0,
+        freeze_panes: tuple[int, int] | None = None,
+    ) -> None:
+        # Write the rows in order, which is required by the constant_memory
+        # option of xlsxwriter.
+        wks = self._get_worksheet(sheet_name, freeze_panes)
+
+        # formats by number format, which is only set for dates and times
+        formats: dict[str, Any] = {}
+
+        for rownum, row in enumerate(rows, startrow):
+            for colnum, val in enumerate(row, startcol):
+                if val is None:
+                    continue
+                val, fmt = self._value_with_fmt(val)
+                style = None
+                if fmt:
+                    style = formats.get(fmt)
+                    if style is None:
+                        style = self.book.add_format(_XlsxStyler.convert(None, fmt))
+                        formats[fmt] = style
+                wks.write(rownum, colnum, val, style)
+
     def _write_cells(
         self,
         cells,
@@ -247,17 +288,10 @@ class XlsxWriter(ExcelWriter):
         freeze_panes: tuple[int, int] | None = None,
     ) -> None:
         # Write the frame cells using xlsxwriter.
-        sheet_name = self._get_sheet_name(sheet_name)
-
-        wks = self.book.get_worksheet_by_name(sheet_name)
-        if wks is None:
-            wks = self.book.add_worksheet(sheet_name)
+        wks = self._get_worksheet(sheet_name, freeze_panes)
 
         style_dict = {"null": None}
 
-        if validate_freeze_panes(freeze_panes):
-            wks.freeze_panes(*(freeze_panes))
-
         for cell in cells:
             val, fmt = self._value_with_fmt(cell.val)
 
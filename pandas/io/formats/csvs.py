@@ -4,13 +4,16 @@ Module for formatting output data into CSV files.
 
 from __future__ import annotations
 
+from collections import deque
 from collections.abc import (
     Hashable,
     Iterable,
     Iterator,
     Sequence,
 )
+from concurrent.futures import ThreadPoolExecutor
 import csv as csvlib
+from io import StringIO
 import os
 from typing import (
     TYPE_CHECKING,
@@ -24,6 +27,7 @@ from pandas._libs import writers as libwriters
 from pandas._typing import SequenceNotStr
 from pandas.util._decorators import cache_readonly
 
+from pandas.core.dtypes.common import is_integer
 from pandas.core.dtypes.generic import (
     ABCDatetimeIndex,
     ABCIndex,
@@ -37,6 +41,8 @@ from pandas.core.indexes.api import Index
 from pandas.io.common import get_handle
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
+
     from pandas._typing import (
         CompressionOptions,
         FilePath,
@@ -47,6 +53,8 @@ if TYPE_CHECKING:
         npt,
     )
 
+    from pandas import DataFrame
+
     from pandas.io.formats.format import DataFrameFormatter
 
 
@@ -75,6 +83,7 @@ class CSVFormatter:
         doublequote: bool = True,
         escapechar: str | None = None,
         storage_options: StorageOptions | None = None,
+        num_threads: int | None = None,
     ) -> None:
         self.fmt = formatter
 
@@ -97,6 +106,7 @@ class CSVFormatter:
         self.date_format = date_format
         self.cols = self._initialize_columns(cols)
         self.chunksize = self._initialize_chunksize(chunksize)
+        self.num_threads = self._initialize_num_threads(num_threads)
 
     @property
     def na_rep(self) -> str:
@@ -176,6 +186,13 @@ class CSVFormatter:
             return (_DEFAULT_CHUNKSIZE_CELLS // (len(self.cols) or 1)) or 1
         return int(chunksize)
 
+    def _initialize_num_threads(self, num_threads: int | None) -> int:
+        if num_threads is None:
+            return 1
+        if not is_integer(num_threads) or num_threads < 1:
+            raise ValueError("'num_threads' must be an integer >=1")
+        return int(num_threads)
+
     @property
     def _number_format(self) -> dict[str, Any]:
         """Dictionary used for storing number formatting settings."""
@@ -257,18 +274,22 @@ class CSVFormatter:
             storage_options=self.storage_options,
         ) as handles:
             # Note: self.encoding is irrelevant here
-            self.writer = csvlib.writer(
-                handles.handle,
-                lineterminator=self.lineterminator,
-                delimiter=self.sep,
-                quoting=self.quoting,
-                doublequote=self.doublequote,
-                escapechar=self.escapechar,
-                quotechar=self.quotechar,
-            )
+            self.handle = handles.handle
+            self.writer = self._make_writer(handles.handle)
 
             self._save()
 
+    def _make_writer(self, handle: Any) -> Any:
+        return csvlib.writer(
+            handle,
+            lineterminator=self.lineterminator,
+            delimiter=self.sep,
+            quoting=self.quoting,
+            doublequote=self.doublequote,
+            escapechar=self.escapechar,
+            quotechar=self.quotechar,
+        )
+
     def _save(self) -> None:
         if self._need_to_save_header:
             self._save_header()
@@ -305,6 +326,9 @@ class CSVFormatter:
     def _save_body(self) -> None:
         nrows = len(self.data_index)
         chunks = (nrows // self.chunksize) + 1
+        if self.num_threads > 1 and nrows > self.chunksize:
+            self._save_body_parallel(nrows)
+            return
         for i in range(chunks):
             start_i = i * self.chunksize
             end_i = min(start_i + self.chunksize, nrows)
@@ -312,23 +336,58 @@ class CSVFormatter:
                 break
             self._save_chunk(start_i, end_i)
 
+    def _save_body_parallel(self, nrows: int) -> None:
+        """
+        Format the chunks on a thread pool and write them in order.
+
+        Each chunk is rendered into its own buffer by a writer with the same
+        dialect, so the output is identical to the serial path. At most two
+        chunks per thread are pending, which bounds the memory held by
+        formatted chunks that are waiting to be written.
+        """
+        pending: deque[Future[str]] = deque()
+        with ThreadPoolExecutor(max_workers=self.num_threads) as executor:
+            for start_i in range(0, nrows, self.chunksize):
+                end_i = min(start_i + self.chunksize, nrows)
+                if len(pending) >= 2 * self.num_threads:
+                    self.handle.write(pending.popleft().result())
+                # slice on this thread, the workers only format the slices
+                slicer = slice(start_i, end_i)
+                df = self.obj.iloc[slicer]
+                index = self.data_index[slicer] if self.nlevels != 0 else None
+                pending.append(
+                    executor.submit(self._format_chunk, df, index, end_i - start_i)
+                )
+            while pending:
+                self.handle.write(pending.popleft().result())
+
+    def _format_chunk(self, df: DataFrame, index: Index | None, nrows: int) -> str:
+        buffer = StringIO()
+        self._write_rows(df, index, nrows, self._make_writer(buffer))
+        return buffer.getvalue()
+
     def _save_chunk(self, start_i: int, end_i: int) -> None:
         # create the data for a chunk
         slicer = slice(start_i, end_i)
         df = self.obj.iloc[slicer]
+        index = self.data_index[slicer] if self.nlevels != 0 else None
+        self._write_rows(df, index, end_i - start_i, self.writer)
 
+    def _write_rows(
+        self, df: DataFrame, index: Index | None, nrows: int, writer: Any
+    ) -> None:
         res = df._get_values_for_csv(**self._number_format)
         data = list(res._iter_column_arrays())
 
         ix = (
-            self.data_index[slicer]._get_values_for_csv(**self._number_format)
-            if self.nlevels != 0
-            else np.empty(end_i - start_i)
+            index._get_values_for_csv(**self._number_format)
+            if index is not None
+            else np.empty(nrows)
         )
         libwriters.write_csv_rows(
             data,
             ix,
             self.nlevels,
             self.cols,
-            self.writer,
+            writer,
         )
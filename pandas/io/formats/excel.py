@@ -8,6 +8,7 @@ from collections.abc import (
     Callable,
     Hashable,
     Iterable,
+    Iterator,
     Mapping,
     Sequence,
 )
@@ -59,7 +60,13 @@ if TYPE_CHECKING:
         WriteExcelBuffer,
     )
 
-    from pandas import ExcelWriter
+    from pandas import (
+        ExcelWriter,
+        Series,
+    )
+
+# number of cells formatted at once when writing rows
+_DEFAULT_CHUNKSIZE_CELLS = 100_000
 
 
 class ExcelCell:
@@ -737,29 +744,9 @@ class ExcelFormatter:
             return self._format_regular_rows()
 
     def _format_regular_rows(self) -> Iterable[ExcelCell]:
-        if self._has_aliases or self.header:
-            self.rowcounter += 1
+        yield from self._format_index_label()
 
-        # output index and index_label?
         if self.index:
-            # check aliases
-            # if list only take first as this is not a MultiIndex
-            if self.index_label and isinstance(
-                self.index_label, (list, tuple, np.ndarray, Index)
-            ):
-                index_label = self.index_label[0]
-            # if string good to go
-            elif self.index_label and isinstance(self.index_label, str):
-                index_label = self.index_label
-            else:
-                index_label = self.df.index.names[0]
-
-            if isinstance(self.columns, MultiIndex):
-                self.rowcounter += 1
-
-            if index_label and self.header is not False:
-                yield ExcelCell(self.rowcounter - 1, 0, index_label, None)
-
             # write index_values
             index_values = self.df.index
             if isinstance(self.df.index, PeriodIndex):
@@ -782,6 +769,30 @@ class ExcelFormatter:
 
         yield from self._generate_body(coloffset)
 
+    def _format_index_label(self) -> Iterable[ExcelCell]:
+        if self._has_aliases or self.header:
+            self.rowcounter += 1
+
+        # output index and index_label?
+        if self.index:
+            # check aliases
+            # if list only take first as this is not a MultiIndex
+            if self.index_label and isinstance(
+                self.index_label, (list, tuple, np.ndarray, Index)
+            ):
+                index_label = self.index_label[0]
+            # if string good to go
+            elif self.index_label and isinstance(self.index_label, str):
+                index_label = self.index_label
+            else:
+                index_label = self.df.index.names[0]
+
+            if isinstance(self.columns, MultiIndex):
+                self.rowcounter += 1
+
+            if index_label and self.header is not False:
+                yield ExcelCell(self.rowcounter - 1, 0, index_label, None)
+
     def _format_hierarchical_rows(self) -> Iterable[ExcelCell]:
         if self._has_aliases or self.header:
             self.rowcounter += 1
@@ -889,6 +900,83 @@ class ExcelFormatter:
             cell.val = self._format_value(cell.val)
             yield cell
 
+    def _can_write_rows(self) -> bool:
+        # Styles and the merged cells of a MultiIndex are written cell by cell
+        return (
+            self.styler is None
+            and not isinstance(self.df.index, MultiIndex)
+            and not isinstance(self.columns, MultiIndex)
+        )
+
+    def _format_values(self, values: Series | Index) -> list:
+        # Same as applying _format_value to each value, with fast paths for
+        # numpy numeric dtypes
+        arr = values._values
+        if isinstance(arr, np.ndarray) and arr.dtype.kind in "iub":
+            return arr.tolist()
+        if isinstance(arr, np.ndarray) and arr.dtype.kind == "f":
+            result = arr.tolist()
+            if self.float_format is not None:
+                for i in np.flatnonzero(np.isfinite(arr)):
+                    result[i] = float(self.float_format % result[i])
+            for i in np.flatnonzero(np.isnan(arr)):
+                result[i] = self.na_rep
+            for i in np.flatnonzero(np.isposinf(arr)):
+                result[i] = self.inf_rep
+            for i in np.flatnonzero(np.isneginf(arr)):
+                result[i] = f"-{self.inf_rep}"
+            return result
+        return [self._format_value(val) for val in values]
+
+    def _generate_rows(self) -> Iterator[list]:
+        # Format the index and the body column by column, a batch of rows at a
+        # time, and yield them row by row.
+        index = self.df.index
+        if isinstance(index, PeriodIndex):
+            index = index.to_timestamp()
+        ncols = len(self.columns)
+        chunksize = max(_DEFAULT_CHUNKSIZE_CELLS // (ncols + 1), 1)
+        for start in range(0, len(self.df), chunksize):
+            stop = start + chunksize
+            columns = [
+                self._format_values(self.df.iloc[start:stop, colidx])
+                for colidx in range(ncols)
+            ]
+            if self.index:
+                columns.insert(0, self._format_values(index[start:stop]))
+            yield from map(list, zip(*columns))
+
+    def get_formatted_rows(self) -> Iterator[list]:
+        """
+        Yield the formatted values of the sheet row by row.
+
+        Only valid for frames that can be written without styles or merged
+        cells. A ``None`` value is a cell that is not written.
+        """
+        header_rows: dict[int, list] = {}
+        for cell in itertools.chain(self._format_header(), self._format_index_label()):
+            header_row = header_rows.setdefault(cell.row, [])
+            if len(header_row) <= cell.col:
+                header_row.extend([None] * (cell.col + 1 - len(header_row)))
+            header_row[cell.col] = self._format_value(cell.val)
+
+        for rownum in range(self.rowcounter):
+            yield header_rows.pop(rownum, [])
+        rownum = self.rowcounter
+        for row in self._generate_rows():
+            header_row = header_rows.pop(rownum, None)
+            if header_row is not None:
+                # the body overwrites the header, as when writing cells
+                row = row + header_row[len(row) :]
+            yield row
+            rownum += 1
+        for header_rownum in sorted(header_rows):
+            while rownum < header_rownum:
+                yield []
+                rownum += 1
+            yield header_rows[header_rownum]
+            rownum += 1
+
     @doc(storage_options=_shared_docs["storage_options"])
     def write(
         self,
@@ -935,7 +1023,6 @@ class ExcelFormatter:
         if engine_kwargs is None:
             engine_kwargs = {}
 
-        formatted_cells = self.get_formatted_cells()
         if isinstance(writer, ExcelWriter):
             need_save = False
         else:
@@ -948,13 +1035,22 @@ class ExcelFormatter:
             need_save = True
 
         try:
-            writer._write_cells(
-                formatted_cells,
-                sheet_name,
-                startrow=startrow,
-                startcol=startcol,
-                freeze_panes=freeze_panes,
-            )
+            if self._can_write_rows():
+                writer._write_rows(
+                    self.get_formatted_rows(),
+                    sheet_name,
+                    startrow=startrow,
+                    startcol=startcol,
+                    freeze_panes=freeze_panes,
+                )
+            else:
+                writer._write_cells(
+                    self.get_formatted_cells(),
+                    sheet_name,
+                    startrow=startrow,
+                    startcol=startcol,
+                    freeze_panes=freeze_panes,
+                )
         finally:
             # make sure to close opened file handles
             if need_save:
@@ -34,7 +34,10 @@ from pandas._config.config import (
     set_option,
 )
 
-from pandas._libs import lib
+from pandas._libs import (
+    lib,
+    writers,
+)
 from pandas._libs.missing import NA
 from pandas._libs.tslibs import (
     NaT,
@@ -963,6 +966,7 @@ class DataFrameRenderer:
         escapechar: str | None = None,
         errors: str = "strict",
         storage_options: StorageOptions | None = None,
+        num_threads: int | None = None,
     ) -> str | None:
         """
         Render dataframe as comma-separated file.
@@ -992,6 +996,7 @@ class DataFrameRenderer:
             doublequote=doublequote,
             escapechar=escapechar,
             storage_options=storage_options,
+            num_threads=num_threads,
             formatter=self.fmt,
         )
         csv_formatter.save()
@@ -1375,7 +1380,7 @@ class FloatArrayFormatter(_GenericArrayFormatter):
             threshold = None
 
         # if we have a fixed_width, we'll need to try different float_format
-        def format_values_with(float_format):
+        def format_values_with(float_format, native_spec=None):
             formatter = self._value_formatter(float_format, threshold)
 
             # default formatter leaves a space to the left when formatting
@@ -1390,6 +1395,19 @@ class FloatArrayFormatter(_GenericArrayFormatter):
             # separate the wheat from the chaff
             if is_complex:
                 values = format_complex_with_na_rep(values, formatter, na_rep)
+            elif native_spec is not None and _can_format_natively(
+                values, native_spec[0], threshold
+            ):
+                # same strings as the formatter, without a call per value
+                format_code, precision, leading_space = native_spec
+                values = writers.format_float_array(
+                    values.astype(np.float64, copy=False).ravel(),
+                    na_rep,
+                    format_code,
+                    precision,
+                    self.decimal,
+                    leading_space,
+                ).reshape(values.shape)
             else:
                 values = format_with_na_rep(values, formatter, na_rep)
 
@@ -1405,6 +1423,7 @@ class FloatArrayFormatter(_GenericArrayFormatter):
         # There is a special default string when we are fixed-width
         # The default is otherwise to use str instead of a formatting string
         float_format: FloatFormatType | None
+        native_spec: tuple[str, int, bool] | None
         if self.float_format is None:
             if self.fixed_width:
                 if self.leading_space is True:
@@ -1412,12 +1431,15 @@ class FloatArrayFormatter(_GenericArrayFormatter):
                 else:
                     fmt_str = "{value:.{digits:d}f}"
                 float_format = partial(fmt_str.format, digits=self.digits)
+                native_spec = ("f", self.digits, self.leading_space is True)
             else:
                 float_format = self.float_format
+                native_spec = ("r", 0, False)
         else:
             float_format = lambda value: self.float_format % value
+            native_spec = _native_float_spec(self.float_format)
 
-        formatted_values = format_values_with(float_format)
+        formatted_values = format_values_with(float_format, native_spec)
 
         if not self.fixed_width:
             return formatted_values
@@ -1445,7 +1467,8 @@ class FloatArrayFormatter(_GenericArrayFormatter):
             else:
                 fmt_str = "{value:.{digits:d}e}"
             float_format = partial(fmt_str.format, digits=self.digits)
-            formatted_values = format_values_with(float_format)
+            native_spec = ("e", self.digits, self.leading_space is True)
+            formatted_values = format_values_with(float_format, native_spec)
 
         return formatted_values
 
@@ -1783,6 +1806,34 @@ def _trim_zeros_single_float(str_float: str) -> str:
     return str_float
 
 
+# printf-style float formats that writers.format_float_array reproduces
+_NATIVE_FLOAT_FORMAT = re.compile(r"%\.(\d+)([eEfFgG])")
+
+
+def _native_float_spec(float_format: FloatFormatType) -> tuple[str, int, bool] | None:
+    """
+    Format code, precision and leading space for writers.format_float_array,
+    or None if ``float_format`` has to be applied value by value.
+    """
+    if not isinstance(float_format, str):
+        return None
+    match = _NATIVE_FLOAT_FORMAT.fullmatch(float_format)
+    if match is None:
+        return None
+    return match.group(2), int(match.group(1)), False
+
+
+def _can_format_natively(
+    values: ArrayLike, format_code: str, threshold: float | None
+) -> bool:
+    if threshold is not None or not isinstance(values, np.ndarray):
+        return False
+    if values.dtype == np.float64:
+        return True
+    # str() of a float32 is its shortest float32 repr, not the float64 one
+    return values.dtype == np.float32 and format_code != "r"
+
+
 def _trim_zeros_float(
     str_floats: ArrayLike | list[str], decimal: str = "."
 ) -> list[str]:
@@ -1,4 +1,5 @@
 from pandas.io.json._json import (
+    iter_json_lines,
     read_json,
     to_json,
     ujson_dumps,
@@ -12,4 +13,5 @@ __all__ = [
     "read_json",
     "to_json",
     "build_table_schema",
+    "iter_json_lines",
 ]
@@ -45,6 +45,8 @@ from pandas import (
     notna,
     to_datetime,
 )
+from pandas.core.indexes.api import default_index
+from pandas.core.internals.construction import convert_object_array
 from pandas.core.reshape.concat import concat
 from pandas.core.shared_docs import _shared_docs
 
@@ -67,6 +69,7 @@ if TYPE_CHECKING:
     from collections.abc import (
         Callable,
         Hashable,
+        Iterator,
         Mapping,
     )
     from types import TracebackType
@@ -89,6 +92,9 @@ if TYPE_CHECKING:
 
 FrameSeriesStrT = TypeVar("FrameSeriesStrT", bound=Literal["frame", "series"])
 
+# number of characters of line-delimited JSON decoded at once into columns
+_LINES_BATCH_CHARS = 1 << 18
+
 
 # interface to/from
 @overload
@@ -107,6 +113,7 @@ def to_json(
     indent: int = ...,
     storage_options: StorageOptions = ...,
     mode: Literal["a", "w"] = ...,
+    chunksize: int | None = ...,
 ) -> None: ...
 
 
@@ -126,6 +133,7 @@ def to_json(
     indent: int = ...,
     storage_options: StorageOptions = ...,
     mode: Literal["a", "w"] = ...,
+    chunksize: int | None = ...,
 ) -> str: ...
 
 
@@ -144,6 +152,7 @@ def to_json(
     indent: int = 0,
     storage_options: StorageOptions | None = None,
     mode: Literal["a", "w"] = "w",
+    chunksize: int | None = None,
 ) -> str | None:
     if orient in ["records", "values"] and index is True:
         raise ValueError(
@@ -162,6 +171,15 @@ def to_json(
     if lines and orient != "records":
         raise ValueError("'lines' keyword only valid when 'orient' is records")
 
+    if chunksize is not None:
+        chunksize = validate_integer("chunksize", chunksize, 1)
+        if not lines:
+            raise ValueError("chunksize can only be passed if lines=True")
+        if not isinstance(obj, DataFrame):
+            raise NotImplementedError(
+                "chunksize is only supported when writing a DataFrame"
+            )
+
     if mode not in ["a", "w"]:
         msg = (
             f"mode={mode} is not a valid option."
@@ -189,32 +207,127 @@ def to_json(
     else:
         raise NotImplementedError("'obj' should be a Series or a DataFrame")
 
-    s = writer(
-        obj,
-        orient=orient,
-        date_format=date_format,
-        double_precision=double_precision,
-        ensure_ascii=force_ascii,
-        date_unit=date_unit,
-        default_handler=default_handler,
-        index=index,
-        indent=indent,
-    ).write()
-
-    if lines:
-        s = convert_to_line_delimits(s)
+    writer_kwargs = {
+        "orient": orient,
+        "date_format": date_format,
+        "double_precision": double_precision,
+        "ensure_ascii": force_ascii,
+        "date_unit": date_unit,
+        "default_handler": default_handler,
+        "index": index,
+        "indent": indent,
+    }
+    chunks: Iterator[str]
+    if chunksize is not None:
+        chunks = _iter_lines(writer, obj, chunksize, writer_kwargs)
+    else:
+        s = writer(obj, **writer_kwargs).write()
+        if lines:
+            s = convert_to_line_delimits(s)
+        chunks = iter([s])
 
     if path_or_buf is not None:
         # apply compression and byte/text conversion
         with get_handle(
             path_or_buf, mode, compression=compression, storage_options=storage_options
         ) as handles:
-            handles.handle.write(s)
+            for chunk in chunks:
+                handles.handle.write(chunk)
     else:
-        return s
+        return "".join(chunks)
     return None
 
 
+def _iter_lines(
+    writer: type[Writer],
+    obj: NDFrame,
+    chunksize: int,
+    writer_kwargs: dict[str, Any],
+) -> Iterator[str]:
+    """
+    Serialize ``obj`` to line-delimited JSON, ``chunksize`` rows at a time.
+    """
+    # an empty object is written in one go, as without chunksize
+    for start in range(0, max(len(obj), 1), chunksize):
+        chunk = obj.iloc[start : start + chunksize]
+        yield convert_to_line_delimits(writer(chunk, **writer_kwargs).write())
+
+
+def iter_json_lines(
+    obj: DataFrame,
+    chunksize: int,
+    *,
+    date_format: str = "iso",
+    double_precision: int = 10,
+    force_ascii: bool = True,
+    date_unit: str = "ms",
+    default_handler: Callable[[Any], JSONSerializable] | None = None,
+    encoding: str = "utf-8",
+) -> Iterator[bytes]:
+    """
+    Serialize a DataFrame to line-delimited JSON, one chunk of rows at a time.
+
+    Only ``chunksize`` rows are serialized at any time, which allows streaming
+    a large object, e.g. to a socket or an HTTP response, without holding its
+    whole JSON representation in memory. Joining the chunks gives the output
+    of ``obj.to_json(orient="records", lines=True)`` called with the same
+    options. Unlike :meth:`DataFrame.to_json`, whose default 'epoch' date
+    format is deprecated, dates are written in ISO format by default.
+
+    .. versionadded:: 3.0.0
+
+    Parameters
+    ----------
+    obj : DataFrame
+        DataFrame to serialize.
+    chunksize : int
+        Number of rows serialized into each chunk.
+    date_format : {'iso', 'epoch'}, default 'iso'
+        Type of date conversion, see :meth:`DataFrame.to_json`.
+    double_precision : int, default 10
+        The number of decimal places to use when encoding floating point values.
+    force_ascii : bool, default True
+        Force encoded string to be ASCII.
+    date_unit : str, default 'ms' (milliseconds)
+        The time unit to encode to, one of 's', 'ms', 'us', 'ns'.
+    default_handler : callable, default None
+        Handler to call if object cannot otherwise be converted to a
+        suitable format for JSON.
+    encoding : str, default 'utf-8'
+        Encoding of the chunks.
+
+    Yields
+    ------
+    bytes
+        The encoded lines of ``chunksize`` rows.
+
+    See Also
+    --------
+    DataFrame.to_json : Convert the object to a JSON string.
+    read_json : Convert a JSON string to pandas object.
+
+    Examples
+    --------
+    >>> df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+    >>> list(pd.io.json.iter_json_lines(df, chunksize=2))
+    [b'{"a":1,"b":"x"}\\n{"a":2,"b":"y"}\\n', b'{"a":3,"b":"z"}\\n']
+    """
+    chunksize = validate_integer("chunksize", chunksize, 1)
+    if not isinstance(obj, DataFrame):
+        raise NotImplementedError("'obj' should be a DataFrame")
+    writer_kwargs = {
+        "orient": "records",
+        "date_format": date_format,
+        "double_precision": double_precision,
+        "ensure_ascii": force_ascii,
+        "date_unit": date_unit,
+        "default_handler": default_handler,
+        "index": True,
+    }
+    for chunk in _iter_lines(FrameWriter, obj, chunksize, writer_kwargs):
+        yield chunk.encode(encoding)
+
+
 class Writer(ABC):
     _default_orient: str
 
@@ -918,9 +1031,7 @@ class JsonReader(abc.Iterator, Generic[FrameSeriesStrT]):
         """
         Combines a list of JSON objects into one JSON object.
         """
-        return (
-            f'[{",".join([line for line in (line.strip() for line in lines) if line])}]'
-        )
+        return _combine_lines(lines)
 
     @overload
     def read(self: JsonReader[Literal["frame"]]) -> DataFrame: ...
@@ -958,12 +1069,9 @@ class JsonReader(abc.Iterator, Generic[FrameSeriesStrT]):
                         obj = concat(self)
                     elif self.nrows:
                         lines = list(islice(self.data, self.nrows))
-                        lines_json = self._combine_lines(lines)
-                        obj = self._get_object_parser(lines_json)
+                        obj = self._get_lines_parser("\n".join(lines))
                     else:
-                        data = ensure_str(self.data)
-                        data_lines = data.split("\n")
-                        obj = self._get_object_parser(self._combine_lines(data_lines))
+                        obj = self._get_lines_parser(ensure_str(self.data))
                 else:
                     obj = self._get_object_parser(self.data)
                 if self.dtype_backend is not lib.no_default:
@@ -998,6 +1106,24 @@ class JsonReader(abc.Iterator, Generic[FrameSeriesStrT]):
         else:
             raise ValueError(f"{typ=} must be 'frame' or 'series'.")
 
+    def _get_lines_parser(self, json: str) -> DataFrame | Series:
+        """
+        Parses line-delimited JSON records into a pandas object.
+        """
+        if self.typ != "frame" or self.orient not in (None, "columns", "records"):
+            return self._get_object_parser(self._combine_lines(json.split("\n")))
+        return _LinesFrameParser(
+            json,
+            orient=self.orient,
+            dtype=self.dtype,
+            convert_axes=self.convert_axes,
+            convert_dates=self.convert_dates,
+            keep_default_dates=self.keep_default_dates,
+            precise_float=self.precise_float,
+            date_unit=self.date_unit,
+            dtype_backend=self.dtype_backend,
+        ).parse()
+
     def close(self) -> None:
         """
         If we opened a stream earlier, in _get_data_from_filepath, we should
@@ -1362,6 +1488,153 @@ class FrameParser(Parser):
         )
 
 
+class _LinesFrameParser(FrameParser):
+    """
+    Parses line-delimited JSON records into columns, one batch at a time.
+
+    Only the records of the current batch are held as dicts. The values of a
+    column are kept as int64, float64 or bool arrays for the batches in which
+    they are all of that type, and as object arrays otherwise. The columns are
+    assembled with the same type inference as the DataFrame constructor
+    applies to a list of records, so the result does not depend on the
+    batching.
+    """
+
+    def _parse(self) -> DataFrame:
+        json = self.json
+        columns: dict[str, _ColumnChunks] = {}
+        nrows = 0
+        for batch in _iter_line_batches(json, _LINES_BATCH_CHARS):
+            records = ujson_loads(
+                _combine_lines(batch.split("\n")), precise_float=self.precise_float
+            )
+            if not all(type(record) is dict for record in records):
+                # e.g. arrays instead of objects, handled by the constructor
+                self.json = _combine_lines(json.split("\n"))
+                return super()._parse()
+
+            keys = lib.fast_unique_multiple_list_gen(
+                (list(record) for record in records), sort=False
+            )
+            for key in keys:
+                if key not in columns:
+                    # missing in all previous records
+                    columns[key] = _ColumnChunks()
+                    columns[key].append_missing(nrows)
+            content = lib.dicts_to_array(records, list(columns))
+            for i, chunks in enumerate(columns.values()):
+                chunks.append(content[:, i])
+            nrows += len(records)
+
+        if not columns:
+            self.json = _combine_lines(json.split("\n"))
+            return super()._parse()
+
+        arrays = [chunks.to_array() for chunks in columns.values()]
+        return DataFrame._from_arrays(
+            arrays, Index(list(columns)), default_index(nrows), verify_integrity=True
+        )
+
+
+class _ColumnChunks:
+    """
+    Decoded values of a column, as typed arrays where possible.
+
+    A float64 chunk records which of its values were JSON nulls and integers,
+    so that the decoded objects can be restored exactly when the column turns
+    out to hold other types in another batch.
+    """
+
+    def __init__(self) -> None:
+        self.chunks: list[np.ndarray] = []
+        # positions of JSON nulls and integers within float64 chunks
+        self.nulls: list[np.ndarray | None] = []
+        self.ints: list[np.ndarray | None] = []
+
+    def append_missing(self, length: int) -> None:
+        if length:
+            self.chunks.append(np.full(length, np.nan))
+            self.nulls.append(None)
+            self.ints.append(None)
+
+    def append(self, values: np.ndarray) -> None:
+        converted = lib.maybe_convert_objects(values)
+        nulls = ints = None
+        if converted.dtype == np.float64 and _is_exact_float(converted):
+            missing = np.flatnonzero(np.isnan(converted))
+            nulls = missing[np.array([values[i] is None for i in missing], dtype=bool)]
+            integral = np.flatnonzero(converted == np.trunc(converted))
+            ints = integral[
+                np.array([type(values[i]) is int for i in integral], dtype=bool)
+            ]
+            self.chunks.append(converted)
+        elif converted.dtype in (np.int64, np.bool_):
+            self.chunks.append(converted)
+        else:
+            # values is a view on the array of the whole batch
+            self.chunks.append(values.copy())
+        self.nulls.append(nulls)
+        self.ints.append(ints)
+
+    def to_array(self) -> np.ndarray:
+        kinds = {chunk.dtype.kind for chunk in self.chunks}
+        if kinds == {"b"} or kinds == {"i"}:
+            return np.concatenate(self.chunks)
+        elif kinds == {"i", "f"} or kinds == {"f"}:
+            return np.concatenate(self.chunks, dtype=np.float64)
+
+        # mixed types, restore the decoded objects and infer as a whole
+        values = np.concatenate(
+            [
+                self._as_object(chunk, nulls, ints)
+                for chunk, nulls, ints in zip(self.chunks, self.nulls, self.ints)
+            ]
+        )
+        return convert_object_array([values], dtype=None)[0]
+
+    @staticmethod
+    def _as_object(
+        chunk: np.ndarray, nulls: np.ndarray | None, ints: np.ndarray | None
+    ) -> np.ndarray:
+        if chunk.dtype == object:
+            return chunk
+        values = chunk.astype(object)
+        if ints is not None and len(ints):
+            values[ints] = chunk[ints].astype(np.int64).astype(object)
+        if nulls is not None and len(nulls):
+            values[nulls] = None
+        return values
+
+
+def _is_exact_float(values: np.ndarray) -> bool:
+    """
+    Whether integers converted to ``values`` are represented exactly.
+    """
+    finite = np.abs(values[~np.isnan(values)])
+    return not len(finite) or finite.max() <= 2**53
+
+
+def _iter_line_batches(json: str, batch_chars: int) -> Iterator[str]:
+    """
+    Yield consecutive slices of ``json`` of about ``batch_chars`` characters
+    that end at line breaks.
+    """
+    start = 0
+    while start < len(json):
+        end = json.find("\n", start + batch_chars)
+        if end == -1:
+            end = len(json)
+        yield json[start:end]
+        start = end + 1
+
+
+def _combine_lines(lines) -> str:
+    """
+    Combines a list of JSON objects into one JSON array.
+    """
+    return f'[{",".join([line for line in (line.strip() for line in lines) if line])}]'
+
+
 def _should_convert_dates(
     convert_dates: bool | list[str],
     keep_default_dates: bool,
@@ -18,14 +18,22 @@ import numpy as np
 
 from pandas._libs.writers import convert_json_to_lines
 
+from pandas.core.dtypes.cast import construct_1d_object_array_from_listlike
+
 import pandas as pd
 from pandas import (
     DataFrame,
+    Index,
     Series,
 )
+from pandas.core.indexes.api import default_index
+from pandas.core.internals.construction import convert_object_array
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import (
+        Hashable,
+        Iterable,
+    )
 
     from pandas._typing import (
         IgnoreRaise,
@@ -266,6 +274,105 @@ def _simple_json_normalize(
     return normalised_json_object
 
 
+class _RecordColumns:
+    """
+    Flatten records into one list of values per column.
+
+    The records are walked once and their leaf values are appended to the
+    column of their key path, so that no flattened copy of the records is
+    created. Columns are ordered as ``DataFrame`` orders the keys of the
+    records ``nested_to_record`` would produce: by first appearance, with the
+    top level values of a record before its nested ones.
+
+    Parameters
+    ----------
+    sep : str
+        Separator of the levels in the names of nested keys.
+    max_level : int or None
+        The max depth to normalize, None normalizes all levels.
+    """
+
+    def __init__(self, sep: str, max_level: int | None) -> None:
+        self.sep = sep
+        self.max_level = max_level
+        self.columns: dict[Hashable, list] = {}
+        self.nrows = 0
+
+    def _set(self, key: Hashable, row: int, value: Any) -> None:
+        column = self.columns.get(key)
+        if column is None:
+            column = self.columns[key] = []
+        missing = row - len(column)
+        if missing < 0:
+            # the key was already set for this row, e.g. "a.b" and {"a": {"b"}}
+            column[row] = value
+            return
+        if missing:
+            column.extend([np.nan] * missing)
+        column.append(value)
+
+    def _add_nested(self, prefix: str, obj: dict, row: int, level: int) -> None:
+        flatten = self.max_level is None or level < self.max_level
+        for key, value in obj.items():
+            name = f"{prefix}{self.sep}{key}"
+            if flatten and isinstance(value, dict):
+                self._add_nested(name, value, row, level + 1)
+            else:
+                self._set(name, row, value)
+
+    def add(self, record: dict) -> None:
+        """Append the values of ``record`` as a new row."""
+        row = self.nrows
+        flatten = self.max_level is None or self.max_level > 0
+        nested = []
+        for key, value in record.items():
+            if flatten and isinstance(value, dict):
+                nested.append((key, value))
+            else:
+                self._set(key, row, value)
+        for key, value in nested:
+            self._add_nested(str(key), value, row, 1)
+        self.nrows += 1
+
+    def to_frame(self, index: Index | None = None) -> DataFrame:
+        """Convert the columns to a DataFrame, inferring their dtypes."""
+        nrows = self.nrows
+        names = list(self.columns)
+        arrays = []
+        for name in names:
+            # release the values of each column once converted
+            column = self.columns.pop(name)
+            if len(column) < nrows:
+                column.extend([np.nan] * (nrows - len(column)))
+            values = construct_1d_object_array_from_listlike(column)
+            del column
+            arrays.append(convert_object_array([values], dtype=None)[0])
+        if index is None:
+            index = default_index(nrows)
+        return DataFrame._from_arrays(
+            arrays, Index(names), index, verify_integrity=True
+        )
+
+
+def _records_to_frame(
+    records: list,
+    sep: str,
+    max_level: int | None,
+    index: Index | None = None,
+) -> DataFrame | None:
+    """
+    Flatten a list of dicts into a DataFrame column by column.
+
+    Returns None if not all records are dicts.
+    """
+    if not all(isinstance(record, dict) for record in records):
+        return None
+    columns = _RecordColumns(sep, max_level)
+    for record in records:
+        columns.add(record)
+    return columns.to_frame(index)
+
+
 def json_normalize(
     data: dict | list[dict] | Series,
     record_path: str | list | None = None,
@@ -501,8 +608,12 @@ def json_normalize(
         and meta is None
         and meta_prefix is None
         and record_prefix is None
-        and max_level is None
     ):
+        result = _records_to_frame(data, sep, max_level, index)
+        if result is not None:
+            return result
+
+    if record_path is None and max_level is None:
         return DataFrame(_simple_json_normalize(data, sep=sep), index=index)
 
     if record_path is None:
@@ -546,12 +657,6 @@ def json_normalize(
         else:
             for obj in data:
                 recs = _pull_records(obj, path[0])
-                recs = [
-                    nested_to_record(r, sep=sep, max_level=max_level)
-                    if isinstance(r, dict)
-                    else r
-                    for r in recs
-                ]
 
                 # For repeating the metadata later
                 lengths.append(len(recs))
@@ -565,7 +670,15 @@ def json_normalize(
 
     _recursive_extract(data, record_path, {}, level=0)
 
-    result = DataFrame(records)
+    result = _records_to_frame(records, sep, max_level)
+    if result is None:
+        records = [
+            nested_to_record(r, sep=sep, max_level=max_level)
+            if isinstance(r, dict)
+            else r
+            for r in records
+        ]
+        result = DataFrame(records)
 
     if record_prefix is not None:
         result = result.rename(columns=lambda x: f"{record_prefix}{x}")
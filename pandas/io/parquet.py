@@ -2,13 +2,24 @@
 
 from __future__ import annotations
 
+import ast
+from collections import (
+    OrderedDict,
+    deque,
+)
+from concurrent.futures import ThreadPoolExecutor
+import functools
 import io
 import json
+import operator
 import os
+import threading
+import tokenize
 from typing import (
     TYPE_CHECKING,
     Any,
     Literal,
+    overload,
 )
 from warnings import (
     catch_warnings,
@@ -23,11 +34,23 @@ from pandas.errors import AbstractMethodError
 from pandas.util._decorators import doc
 from pandas.util._validators import check_dtype_backend
 
+from pandas.core.dtypes.common import is_integer
+from pandas.core.dtypes.concat import (
+    concat_compat,
+    union_categoricals,
+)
+from pandas.core.dtypes.dtypes import CategoricalDtype
+
 import pandas as pd
 from pandas import (
     DataFrame,
     get_option,
 )
+from pandas.core.computation.expr import (
+    _preparse,
+    _replace_booleans,
+)
+from pandas.core.internals.construction import arrays_to_mgr
 from pandas.core.shared_docs import _shared_docs
 
 from pandas.io._util import arrow_string_types_mapper
@@ -40,11 +63,23 @@ from pandas.io.common import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import (
+        Callable,
+        Iterator,
+    )
+    from concurrent.futures import Future
+    from types import TracebackType
+
+    from pandas import Index
+
     from pandas._typing import (
+        ArrayLike,
         DtypeBackend,
         FilePath,
         ReadBuffer,
+        Self,
         StorageOptions,
+        T,
         WriteBuffer,
     )
 
@@ -146,6 +181,264 @@ def _get_path_or_handle(
     return path_or_handle, handles, fs
 
 
+# pyarrow compute functions of the comparison operators of ``where``
+_WHERE_COMPARISONS = {
+    "==": "equal",
+    "!=": "not_equal",
+    "<": "less",
+    "<=": "less_equal",
+    ">": "greater",
+    ">=": "greater_equal",
+}
+_WHERE_OPS: dict[type[ast.cmpop], str] = {
+    ast.Eq: "==",
+    ast.NotEq: "!=",
+    ast.Lt: "<",
+    ast.LtE: "<=",
+    ast.Gt: ">",
+    ast.GtE: ">=",
+    ast.In: "in",
+    ast.NotIn: "not in",
+}
+# operators with the operands swapped, for a literal on the left-hand side
+_WHERE_SWAPPED_OPS = {
+    "==": "==",
+    "!=": "!=",
+    "<": ">",
+    "<=": ">=",
+    ">": "<",
+    ">=": "<=",
+}
+
+# local path -> (mtime_ns, size, FileMetaData), least recently used first
+_METADATA_CACHE: OrderedDict[str, tuple[int, int, Any]] = OrderedDict()
+_METADATA_CACHE_LOCK = threading.Lock()
+
+
+def _parse_where(where: str) -> tuple:
+    """
+    Parse a ``where`` expression into a tree of nested tuples.
+
+    Nodes are ``("and", [nodes])``, ``("or", [nodes])``, ``("not", node)`` and
+    comparisons of a column with a literal, ``("cmp", column, op, value)``.
+    """
+    try:
+        # & and | bind less tightly than comparisons, as in DataFrame.query
+        source = _preparse(where.strip(), f=_replace_booleans)
+        tree = ast.parse(source, mode="eval")
+    except (SyntaxError, tokenize.TokenError) as err:
+        raise ValueError(f"Invalid where expression: {where!r}") from err
+    return _parse_where_node(tree.body, where)
+
+
+def _parse_where_node(node: ast.expr, where: str) -> tuple:
+    if isinstance(node, ast.BoolOp):
+        kind = "and" if isinstance(node.op, ast.And) else "or"
+        return (kind, [_parse_where_node(value, where) for value in node.values])
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.Not, ast.Invert)):
+        return ("not", _parse_where_node(node.operand, where))
+    if isinstance(node, ast.Compare):
+        # a chained comparison like 1 < a <= 5 is a conjunction
+        comparisons = []
+        left = node.left
+        for cmpop, right in zip(node.ops, node.comparators):
+            comparisons.append(_parse_comparison(left, cmpop, right, where))
+            left = right
+        if len(comparisons) == 1:
+            return comparisons[0]
+        return ("and", comparisons)
+    raise ValueError(f"Invalid where expression: {where!r}")
+
+
+def _parse_comparison(
+    left: ast.expr, cmpop: ast.cmpop, right: ast.expr, where: str
+) -> tuple:
+    op = _WHERE_OPS.get(type(cmpop))
+    if op is None:
+        raise ValueError(f"Invalid where expression: {where!r}")
+    if isinstance(left, ast.Name) and not isinstance(right, ast.Name):
+        column, literal = left.id, right
+    elif isinstance(right, ast.Name) and op in _WHERE_SWAPPED_OPS:
+        column, literal, op = right.id, left, _WHERE_SWAPPED_OPS[op]
+    else:
+        raise ValueError(f"Invalid where expression: {where!r}")
+    try:
+        value = ast.literal_eval(literal)
+    except ValueError as err:
+        raise ValueError(f"Invalid where expression: {where!r}") from err
+    if op in ("in", "not in"):
+        if not isinstance(value, (list, tuple, set)):
+            raise ValueError(f"Invalid where expression: {where!r}")
+        value = list(value)
+    return ("cmp", column, op, value)
+
+
+def _where_columns(node: tuple) -> list[str]:
+    """Columns referenced by a parsed ``where`` expression."""
+    if node[0] == "cmp":
+        return [node[1]]
+    children = [node[1]] if node[0] == "not" else node[1]
+    return list(dict.fromkeys(c for child in children for c in _where_columns(child)))
+
+
+def _bind_where(pa: Any, node: tuple, schema: Any) -> tuple:
+    """Convert the literals of a parsed ``where`` to the types of the columns."""
+    if node[0] in ("and", "or"):
+        return (node[0], [_bind_where(pa, child, schema) for child in node[1]])
+    if node[0] == "not":
+        return ("not", _bind_where(pa, node[1], schema))
+
+    _, column, op, value = node
+    if column not in schema.names:
+        raise ValueError(f"Column {column!r} of the where expression not found")
+    pa_type = schema.field(column).type
+    if pa.types.is_dictionary(pa_type):
+        pa_type = pa_type.value_type
+
+    def to_scalar(value: Any) -> Any:
+        if pa.types.is_integer(pa_type) and type(value) in (int, float):
+            scalar = pa.scalar(value)
+            try:
+                # a safe cast, raising on truncation and overflow
+                return scalar.cast(pa_type)
+            except pa.ArrowInvalid:
+                # e.g. 5.5 for an integer column, compared as float64
+                return scalar
+        try:
+            return pa.scalar(value, type=pa_type)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # e.g. a date given as string
+            return pa.scalar(value).cast(pa_type)
+
+    if op in ("in", "not in"):
+        scalars = [to_scalar(val) for val in value]
+        if len({scalar.type for scalar in scalars}) > 1:
+            # an integer column with some literals compared as float64
+            scalars = list(pa.array(value))
+        return ("cmp", column, op, scalars)
+    return ("cmp", column, op, to_scalar(value))
+
+
+def _where_to_expression(pc: Any, node: tuple) -> Any:
+    """Convert a bound ``where`` to a pyarrow compute expression."""
+    if node[0] in ("and", "or"):
+        combine = operator.and_ if node[0] == "and" else operator.or_
+        return functools.reduce(
+            combine, (_where_to_expression(pc, child) for child in node[1])
+        )
+    if node[0] == "not":
+        return ~_where_to_expression(pc, node[1])
+
+    _, column, op, value = node
+    field = pc.field(column)
+    if op == "in":
+        return field.isin(value)
+    elif op == "not in":
+        return ~field.isin(value)
+    result = getattr(pc, _WHERE_COMPARISONS[op])(field, value)
+    # as in DataFrame.query, missing values are unequal to any value
+    if op == "!=":
+        return result | field.is_null()
+    return result & field.is_valid()
+
+
+def _row_group_may_match(
+    pa: Any, node: tuple, row_group: Any, column_index: dict[str, int]
+) -> bool:
+    """
+    Whether rows of a row group can match a bound ``where``.
+
+    Uses the min/max statistics of the row group and is conservative, i.e.
+    returns True when the statistics do not allow to decide.
+    """
+    if node[0] == "and":
+        return all(
+            _row_group_may_match(pa, child, row_group, column_index)
+            for child in node[1]
+        )
+    if node[0] == "or":
+        return any(
+            _row_group_may_match(pa, child, row_group, column_index)
+            for child in node[1]
+        )
+    if node[0] == "not":
+        return True
+
+    _, column, op, value = node
+    index = column_index.get(column)
+    if index is None:
+        return True
+    stats = row_group.column(index).statistics
+    if stats is None or not stats.has_min_max:
+        return True
+    pa_type = value[0].type if isinstance(value, list) else value.type
+    if op in ("!=", "not in") and (
+        pa.types.is_floating(pa_type)
+        or not stats.has_null_count
+        or stats.null_count > 0
+    ):
+        # NaN and missing values are not part of the statistics but compare
+        # unequal to any value
+        return True
+    try:
+        low = pa.scalar(stats.min, type=pa_type)
+        high = pa.scalar(stats.max, type=pa_type)
+    except (pa.ArrowException, TypeError, ValueError):
+        return True
+
+    def compare(func: str, left: Any, right: Any) -> bool:
+        # undecidable comparisons keep the row group
+        result = pa.compute.call_function(func, [left, right]).as_py()
+        return result is not False
+
+    def contains(val: Any) -> bool:
+        return compare("less_equal", low, val) and compare("less_equal", val, high)
+
+    def single(val: Any) -> bool:
+        # whether all the non-null values are equal to val
+        return not (compare("not_equal", low, high) or compare("not_equal", low, val))
+
+    if op == "==":
+        return contains(value)
+    elif op == "!=":
+        return not single(value)
+    elif op == "in":
+        return any(contains(val) for val in value)
+    elif op == "not in":
+        return not any(single(val) for val in value)
+    elif op in ("<", "<="):
+        return compare(_WHERE_COMPARISONS[op], low, value)
+    return compare(_WHERE_COMPARISONS[op], high, value)
+
+
+def _read_metadata_cached(pq: Any, path: str) -> Any:
+    """
+    Read the footer of a local parquet file, caching it while not modified.
+
+    The number of cached footers is bounded by the option
+    ``io.parquet.metadata_cache_size``.
+    """
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    with _METADATA_CACHE_LOCK:
+        entry = _METADATA_CACHE.get(path)
+        if entry is not None and entry[:2] == (stat.st_mtime_ns, stat.st_size):
+            _METADATA_CACHE.move_to_end(path)
+            return entry[2]
+
+    metadata = pq.read_metadata(path)
+    size = get_option("io.parquet.metadata_cache_size")
+    with _METADATA_CACHE_LOCK:
+        if size:
+            _METADATA_CACHE[path] = (stat.st_mtime_ns, stat.st_size, metadata)
+            _METADATA_CACHE.move_to_end(path)
+        else:
+            _METADATA_CACHE.pop(path, None)
+        while len(_METADATA_CACHE) > size:
+            _METADATA_CACHE.popitem(last=False)
+    return metadata
+
+
 class BaseImpl:
     @staticmethod
     def validate_dataframe(df: DataFrame) -> None:
@@ -245,8 +538,11 @@ class PyArrowImpl(BaseImpl):
         dtype_backend: DtypeBackend | lib.NoDefault = lib.no_default,
         storage_options: StorageOptions | None = None,
         filesystem=None,
+        where: str | None = None,
+        num_threads: int | None = None,
+        iterator: bool = False,
         **kwargs,
-    ) -> DataFrame:
+    ) -> DataFrame | Iterator[DataFrame]:
         kwargs["use_pandas_metadata"] = True
 
         to_pandas_kwargs = {}
@@ -260,6 +556,26 @@ class PyArrowImpl(BaseImpl):
         elif using_string_dtype():
             to_pandas_kwargs["types_mapper"] = arrow_string_types_mapper()
 
+        if num_threads is not None or iterator:
+            reader = _ParquetBatchReader(
+                self.api,
+                path,
+                columns=columns,
+                filters=filters,
+                where=where,
+                to_pandas_kwargs=to_pandas_kwargs,
+                storage_options=storage_options,
+                filesystem=filesystem,
+                num_threads=1 if num_threads is None else num_threads,
+                **kwargs,
+            )
+            if iterator:
+                return reader.iterate()
+            try:
+                return reader.read()
+            finally:
+                reader.close()
+
         path_or_handle, handles, filesystem = _get_path_or_handle(
             path,
             filesystem,
@@ -267,13 +583,31 @@ class PyArrowImpl(BaseImpl):
             mode="rb",
         )
         try:
-            pa_table = self.api.parquet.read_table(
-                path_or_handle,
-                columns=columns,
-                filesystem=filesystem,
-                filters=filters,
-                **kwargs,
-            )
+            if where is not None:
+                local_path = stringify_path(path)
+                if not (
+                    handles is not None
+                    and isinstance(local_path, str)
+                    and os.path.isfile(local_path)
+                ):
+                    local_path = None
+                pa_table = self._read_where(
+                    path_or_handle,
+                    local_path,
+                    where,
+                    columns=columns,
+                    filesystem=filesystem,
+                    filters=filters,
+                    **kwargs,
+                )
+            else:
+                pa_table = self.api.parquet.read_table(
+                    path_or_handle,
+                    columns=columns,
+                    filesystem=filesystem,
+                    filters=filters,
+                    **kwargs,
+                )
             with catch_warnings():
                 filterwarnings(
                     "ignore",
@@ -291,6 +625,307 @@ class PyArrowImpl(BaseImpl):
             if handles is not None:
                 handles.close()
 
+    def _read_where(
+        self,
+        path_or_handle,
+        local_path: str | None,
+        where: str,
+        columns=None,
+        filesystem=None,
+        filters=None,
+        **kwargs,
+    ):
+        """
+        Read the rows of a parquet source matching ``where`` into a Table.
+
+        The row groups of a local file that cannot contain matching rows are
+        skipped based on the statistics of its footer, which is cached. Other
+        sources are read with ``where`` as filter of ``read_table``.
+        """
+        pq = self.api.parquet
+        predicate = _parse_where(where)
+        read_kwargs = {
+            key: val
+            for key, val in kwargs.items()
+            if key not in ("use_threads", "use_pandas_metadata")
+        }
+        if local_path is None or filters is not None or read_kwargs:
+            dataset = pq.ParquetDataset(
+                path_or_handle,
+                filesystem=filesystem,
+                partitioning=kwargs.get("partitioning", "hive"),
+            )
+            predicate = _bind_where(self.api, predicate, dataset.schema)
+            expression = _where_to_expression(self.api.compute, predicate)
+            if filters is not None:
+                expression = expression & pq.filters_to_expression(filters)
+            return pq.read_table(
+                path_or_handle,
+                columns=columns,
+                filesystem=filesystem,
+                filters=expression,
+                **kwargs,
+            )
+
+        metadata = _read_metadata_cached(pq, local_path)
+        parquet_file = pq.ParquetFile(path_or_handle, metadata=metadata)
+        schema = parquet_file.schema_arrow
+        predicate = _bind_where(self.api, predicate, schema)
+
+        column_index = {
+            metadata.schema.column(i).path: i for i in range(metadata.num_columns)
+        }
+        row_groups = [
+            i
+            for i in range(metadata.num_row_groups)
+            if _row_group_may_match(
+                self.api, predicate, metadata.row_group(i), column_index
+            )
+        ]
+        # columns needed only to evaluate where, index columns are always read
+        extra_columns = []
+        if columns is not None:
+            index_columns = (schema.pandas_metadata or {}).get("index_columns", [])
+            extra_columns = [
+                col
+                for col in _where_columns(predicate)
+                if col not in columns and col not in index_columns
+            ]
+            columns = list(columns) + extra_columns
+        table = parquet_file.read_row_groups(
+            row_groups,
+            columns=columns,
+            use_threads=kwargs.get("use_threads", True),
+            use_pandas_metadata=True,
+        )
+        table = table.filter(_where_to_expression(self.api.compute, predicate))
+        if extra_columns:
+            table = table.drop_columns(extra_columns)
+        return table
+
+
+class _ParquetBatchReader:
+    """
+    Read a parquet file or dataset as one DataFrame per row group.
+
+    The row groups, of all the files of a dataset, are read and converted on a
+    thread pool, with at most ``num_threads`` of them in flight, and returned
+    in order. The Arrow Table of a row group only lives until its conversion.
+    When reading everything, the columns of the converted row groups are
+    concatenated one at a time, so the peak memory is about the size of the
+    result rather than that of the whole Table plus the result.
+    """
+
+    def __init__(
+        self,
+        api: Any,
+        path,
+        columns: list[str] | None,
+        filters,
+        where: str | None,
+        to_pandas_kwargs: dict[str, Any],
+        storage_options: StorageOptions | None,
+        filesystem,
+        num_threads: int,
+        **kwargs,
+    ) -> None:
+        if not is_integer(num_threads) or num_threads < 1:
+            raise ValueError("'num_threads' must be an integer >=1")
+        self.api = api
+        self.to_pandas_kwargs = to_pandas_kwargs
+        self.num_threads = num_threads
+        self.use_threads = kwargs.pop("use_threads", True)
+        kwargs.pop("use_pandas_metadata", None)
+
+        pq = api.parquet
+        path_or_handle, self.handles, filesystem = _get_path_or_handle(
+            path,
+            filesystem,
+            storage_options=storage_options,
+            mode="rb",
+        )
+        try:
+            dataset = pq.ParquetDataset(path_or_handle, filesystem=filesystem, **kwargs)
+            self.schema = dataset.schema
+            expression = None
+            if filters is not None:
+                expression = pq.filters_to_expression(filters)
+            if where is not None:
+                predicate = _bind_where(api, _parse_where(where), self.schema)
+                where_expression = _where_to_expression(api.compute, predicate)
+                if expression is None:
+                    expression = where_expression
+                else:
+                    expression = expression & where_expression
+            self.filter = expression
+
+            # row groups that cannot match the filter, based on the partition
+            # of their file or their statistics, are skipped
+            self.dataset_fragments = list(dataset.fragments)
+            self.fragments = [
+                row_group
+                for fragment in self.dataset_fragments
+                for row_group in fragment.split_by_row_group(
+                    expression, schema=self.schema
+                )
+            ]
+        except Exception:
+            self.close()
+            raise
+
+        pandas_metadata = self.schema.pandas_metadata or {}
+        self.index_columns = pandas_metadata.get("index_columns", [])
+        if columns is not None:
+            # the index columns are always read, as by read_table
+            columns = list(columns) + [
+                col
+                for col in self.index_columns
+                if isinstance(col, str) and col not in columns
+            ]
+        self.columns = columns
+        self.attrs = None
+        if self.schema.metadata and b"PANDAS_ATTRS" in self.schema.metadata:
+            self.attrs = json.loads(self.schema.metadata[b"PANDAS_ATTRS"])
+
+    def _read_table(self, fragment) -> Any:
+        return fragment.to_table(
+            schema=self.schema,
+            columns=self.columns,
+            filter=self.filter,
+            use_threads=self.use_threads,
+        )
+
+    def _read_fragment(self, fragment) -> DataFrame:
+        return self._to_pandas(self._read_table(fragment))
+
+    def _read_arrays(self, fragment) -> tuple[list[ArrayLike], Index, Index]:
+        # one block per column, so that each is freed once concatenated
+        frame = self._to_pandas(self._read_table(fragment), split_blocks=True)
+        return list(frame._iter_column_arrays()), frame.columns, frame.index
+
+    def _to_pandas(self, table, **kwargs) -> DataFrame:
+        with catch_warnings():
+            filterwarnings(
+                "ignore",
+                "make_block is deprecated",
+                DeprecationWarning,
+            )
+            return table.to_pandas(**{**kwargs, **self.to_pandas_kwargs})
+
+    def _read_empty(self) -> DataFrame:
+        if self.dataset_fragments:
+            # read from a file, which gives the categories of the partitions
+            return self._read_fragment(self.dataset_fragments[0])
+        table = self.schema.empty_table()
+        if self.columns is not None:
+            table = table.select(self.columns)
+        return self._to_pandas(table)
+
+    def _iter_row_groups(self, read: Callable[[Any], T]) -> Iterator[T]:
+        """Read the row groups in order, keeping num_threads in flight."""
+        if self.num_threads == 1:
+            yield from map(read, self.fragments)
+            return
+        with ThreadPoolExecutor(max_workers=self.num_threads) as executor:
+            pending: deque[Future[T]] = deque()
+            fragments = iter(self.fragments)
+            try:
+                for fragment in fragments:
+                    pending.append(executor.submit(read, fragment))
+                    if len(pending) >= self.num_threads:
+                        yield pending.popleft().result()
+                while pending:
+                    yield pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    @property
+    def _has_row_index(self) -> bool:
+        # the index is not stored as columns, it is rebuilt by position
+        return all(not isinstance(col, str) for col in self.index_columns)
+
+    def iterate(self) -> Iterator[DataFrame]:
+        """
+        Yield one DataFrame per row group.
+
+        Without index columns in the file, the index of the DataFrames
+        continues from one DataFrame to the next.
+        """
+        try:
+            nrows = 0
+            for frame in self._iter_row_groups(self._read_fragment):
+                if self._has_row_index:
+                    frame.index = pd.RangeIndex(nrows, nrows + len(frame))
+                    nrows += len(frame)
+                if self.attrs is not None:
+                    frame.attrs = self.attrs
+                yield frame
+        finally:
+            self.close()
+
+    def read(self) -> DataFrame:
+        """Read all the row groups into one DataFrame, as read_table would."""
+        chunks = list(self._iter_row_groups(self._read_arrays))
+        if not chunks:
+            return self._read_empty()
+        columns = chunks[0][1]
+        indexes = [index for _, _, index in chunks]
+        arrays: list[list[ArrayLike | None]] = [list(arrs) for arrs, _, _ in chunks]
+        del chunks
+
+        pool = self.api.default_memory_pool()
+        data = []
+        for i in range(len(columns)):
+            data.append(_concat_arrays([arrs[i] for arrs in arrays]))
+            for arrs in arrays:
+                arrs[i] = None
+            # the converted row groups are held by the Arrow memory pool,
+            # which otherwise retains the memory freed here
+            pool.release_unused()
+
+        nrows = sum(len(index) for index in indexes)
+        if self._has_row_index:
+            index = self._range_index(nrows)
+        else:
+            index = indexes[0].append(indexes[1:])
+        # not consolidated, which would copy the columns once more
+        mgr = arrays_to_mgr(
+            data, columns, index, verify_integrity=False, consolidate=False
+        )
+        result = DataFrame._from_mgr(mgr, axes=mgr.axes)
+        if self.attrs is not None:
+            result.attrs = self.attrs
+        return result
+
+    def _range_index(self, nrows: int) -> pd.RangeIndex:
+        # as pyarrow, which ignores a stored range of another length
+        if len(self.index_columns) == 1:
+            descr = self.index_columns[0]
+            index = pd.RangeIndex(
+                descr["start"], descr["stop"], descr["step"], name=descr["name"]
+            )
+            if len(index) == nrows:
+                return index
+        return pd.RangeIndex(nrows)
+
+    def close(self) -> None:
+        if self.handles is not None:
+            self.handles.close()
+            self.handles = None
+
+
+def _concat_arrays(arrays: list[Any]) -> ArrayLike:
+    """
+    Concatenate the arrays of a column converted from several row groups.
+
+    The dtypes can differ between row groups, e.g. float64 for integers with
+    missing values, and are combined as the conversion of a single Table would.
+    """
+    if isinstance(arrays[0].dtype, CategoricalDtype):
+        return union_categoricals(arrays)
+    return concat_compat(arrays)
+
 
 class FastParquetImpl(BaseImpl):
     def __init__(self) -> None:
@@ -361,6 +996,9 @@ class FastParquetImpl(BaseImpl):
         filters=None,
         storage_options: StorageOptions | None = None,
         filesystem=None,
+        where: str | None = None,
+        num_threads: int | None = None,
+        iterator: bool = False,
         **kwargs,
     ) -> DataFrame:
         parquet_kwargs: dict[str, Any] = {}
@@ -376,6 +1014,15 @@ class FastParquetImpl(BaseImpl):
             raise NotImplementedError(
                 "filesystem is not implemented for the fastparquet engine."
             )
+        if where is not None:
+            raise NotImplementedError(
+                "where is not implemented for the fastparquet engine."
+            )
+        if num_threads is not None or iterator:
+            raise NotImplementedError(
+                "num_threads and iterator are not implemented for the "
+                "fastparquet engine."
+            )
         path = stringify_path(path)
         handles = None
         if is_fsspec_url(path):
@@ -496,6 +1143,39 @@ def to_parquet(
         return None
 
 
+@overload
+def read_parquet(
+    path: FilePath | ReadBuffer[bytes],
+    engine: str = ...,
+    columns: list[str] | None = ...,
+    storage_options: StorageOptions | None = ...,
+    dtype_backend: DtypeBackend | lib.NoDefault = ...,
+    filesystem: Any = ...,
+    filters: list[tuple] | list[list[tuple]] | None = ...,
+    where: str | None = ...,
+    num_threads: int | None = ...,
+    *,
+    iterator: Literal[True],
+    **kwargs,
+) -> Iterator[DataFrame]: ...
+
+
+@overload
+def read_parquet(
+    path: FilePath | ReadBuffer[bytes],
+    engine: str = ...,
+    columns: list[str] | None = ...,
+    storage_options: StorageOptions | None = ...,
+    dtype_backend: DtypeBackend | lib.NoDefault = ...,
+    filesystem: Any = ...,
+    filters: list[tuple] | list[list[tuple]] | None = ...,
+    where: str | None = ...,
+    num_threads: int | None = ...,
+    iterator: Literal[False] = ...,
+    **kwargs,
+) -> DataFrame: ...
+
+
 @doc(storage_options=_shared_docs["storage_options"])
 def read_parquet(
     path: FilePath | ReadBuffer[bytes],
@@ -505,8 +1185,11 @@ def read_parquet(
     dtype_backend: DtypeBackend | lib.NoDefault = lib.no_default,
     filesystem: Any = None,
     filters: list[tuple] | list[list[tuple]] | None = None,
+    where: str | None = None,
+    num_threads: int | None = None,
+    iterator: bool = False,
     **kwargs,
-) -> DataFrame:
+) -> DataFrame | Iterator[DataFrame]:
     """
     Load a parquet object from the file path, returning a DataFrame.
 
@@ -578,13 +1261,49 @@ def read_parquet(
 
         .. versionadded:: 2.1.0
 
+    where : str, optional
+        Boolean expression selecting the rows to read, e.g.
+        ``"ts >= '2024-01-01' & region == 'EU'"``. Columns are compared with
+        literals, which are converted to the type of the column, using
+        ``==, !=, <, <=, >, >=, in, not in``, and comparisons are combined with
+        ``&`` (or ``and``), ``|`` (or ``or``) and ``~`` (or ``not``). As in
+        :meth:`DataFrame.query`, missing values are unequal to any value, so
+        ``a != 5`` selects the rows where ``a`` is missing, unlike ``filters``.
+        Can be combined with ``filters``. Only implemented for
+        ``engine="pyarrow"``.
+
+        For a local file, the row groups which cannot contain matching rows
+        according to the statistics in the file footer are not read. Unless
+        ``filters``, ``num_threads`` or ``iterator`` are passed, the footer is
+        cached as long as the file is not modified, see the option
+        ``io.parquet.metadata_cache_size``.
+
+        .. versionadded:: 3.0.0
+
+    num_threads : int, optional
+        Read the row groups of the file, or of all the files of a directory,
+        on ``num_threads`` threads. Each row group is converted to pandas as
+        soon as it is read, so the data of the whole file is never held in
+        Arrow and pandas format at once. Only implemented for ``engine="pyarrow"``.
+
+        .. versionadded:: 3.0.0
+
+    iterator : bool, default False
+        Return an iterator yielding one DataFrame per row group instead of a
+        single DataFrame, using ``num_threads`` threads to read ahead. Without
+        index columns in the file, the index continues from one DataFrame to
+        the next. Only implemented for ``engine="pyarrow"``.
+
+        .. versionadded:: 3.0.0
+
     **kwargs
         Any additional kwargs are passed to the engine.
 
     Returns
     -------
-    DataFrame
-        DataFrame based on parquet file.
+    DataFrame or Iterator[DataFrame]
+        DataFrame based on parquet file, or an iterator of DataFrames if
+        ``iterator=True``.
 
     See Also
     --------
@@ -638,6 +1357,13 @@ def read_parquet(
         foo  bar
     0    3    8
     1    4    9
+
+    The same rows can be selected with a ``where`` expression.
+
+    >>> pd.read_parquet(BytesIO(df_parquet_bytes), where="foo > 2")
+        foo  bar
+    0    3    8
+    1    4    9
     """
 
     impl = get_engine(engine)
@@ -650,5 +1376,175 @@ def read_parquet(
         storage_options=storage_options,
         dtype_backend=dtype_backend,
         filesystem=filesystem,
+        where=where,
+        num_threads=num_threads,
+        iterator=iterator,
         **kwargs,
     )
+
+
+@doc(storage_options=_shared_docs["storage_options"])
+class ParquetWriter:
+    """
+    Write a sequence of DataFrames with the same columns to one parquet file.
+
+    Each DataFrame passed to :meth:`write` is converted and written as one or
+    more row groups, so only one DataFrame needs to be in memory at a time.
+    The file footer is written by :meth:`close`, which is called when leaving
+    the context manager. Requires the ``pyarrow`` engine.
+
+    .. versionadded:: 3.0.0
+
+    Parameters
+    ----------
+    path : str, path object or file-like object
+        String, path object (implementing ``os.PathLike[str]``), or file-like
+        object implementing a binary ``write()`` function.
+    compression : {{'snappy', 'gzip', 'brotli', 'lz4', 'zstd', None}}, \
+default 'snappy'
+        Name of the compression to use. Use ``None`` for no compression.
+    index : bool, default None
+        If ``True``, include the index of the DataFrames in the file output. If
+        ``False``, they will not be written to the file. If ``None``, the index
+        is written unless the first DataFrame has an unnamed ``RangeIndex``, in
+        which case the file is read back with a default index.
+    row_group_size : int, optional
+        Maximum number of rows in each row group, a DataFrame with more rows is
+        split into several row groups. Defaults to the pyarrow default.
+    schema : pyarrow.Schema, optional
+        Schema of the file. By default it is inferred from the first DataFrame,
+        the following DataFrames are converted to it. Passing a schema is
+        useful when the first DataFrame does not determine the types, e.g. for
+        a column with only missing values.
+    {storage_options}
+
+    filesystem : fsspec or pyarrow filesystem, default None
+        Filesystem object to use when writing the parquet file.
+    **kwargs
+        Additional keyword arguments passed to ``pyarrow.parquet.ParquetWriter``.
+
+    See Also
+    --------
+    DataFrame.to_parquet : Write a DataFrame to the binary parquet format.
+    read_parquet : Load a parquet object from the file path, returning a DataFrame.
+
+    Examples
+    --------
+    >>> with pd.io.parquet.ParquetWriter("out.parquet") as writer:  # doctest: +SKIP
+    ...     for chunk in pd.read_csv("data.csv", chunksize=1_000_000):
+    ...         writer.write(chunk)
+    """
+
+    def __init__(
+        self,
+        path: FilePath | WriteBuffer[bytes],
+        compression: str | None = "snappy",
+        index: bool | None = None,
+        row_group_size: int | None = None,
+        schema: Any = None,
+        storage_options: StorageOptions | None = None,
+        filesystem: Any = None,
+        **kwargs,
+    ) -> None:
+        self.api = PyArrowImpl().api
+        self.path = path
+        self.compression = compression
+        self.index = index
+        self.row_group_size = row_group_size
+        self.schema = schema
+        self.storage_options = storage_options
+        self.filesystem = filesystem
+        self.kwargs = kwargs
+        self._writer = None
+        self._handles: IOHandles[bytes] | None = None
+        self._columns: list | None = None
+        self._closed = False
+
+    def _open(self, df: DataFrame):
+        """Open the file with the schema of the first DataFrame, return its Table."""
+        if self.index is None:
+            self.index = not (
+                isinstance(df.index, pd.RangeIndex) and df.index.name is None
+            )
+        table = self.api.Table.from_pandas(
+            df, schema=self.schema, preserve_index=self.index
+        )
+        schema = table.schema
+        if df.attrs:
+            schema = schema.with_metadata(
+                {**schema.metadata, "PANDAS_ATTRS": json.dumps(df.attrs)}
+            )
+
+        path_or_handle, self._handles, filesystem = _get_path_or_handle(
+            self.path,
+            self.filesystem,
+            storage_options=self.storage_options,
+            mode="wb",
+        )
+        if (
+            isinstance(path_or_handle, io.BufferedWriter)
+            and hasattr(path_or_handle, "name")
+            and isinstance(path_or_handle.name, (str, bytes))
+        ):
+            if isinstance(path_or_handle.name, bytes):
+                path_or_handle = path_or_handle.name.decode()
+            else:
+                path_or_handle = path_or_handle.name
+        self._writer = self.api.parquet.ParquetWriter(
+            path_or_handle,
+            schema,
+            filesystem=filesystem,
+            compression=self.compression,
+            **self.kwargs,
+        )
+        self.schema = schema
+        self._columns = list(df.columns)
+        return table
+
+    def write(self, df: DataFrame) -> None:
+        """
+        Write the rows of a DataFrame to the file.
+
+        Parameters
+        ----------
+        df : DataFrame
+            DataFrame with the same columns as the first one written.
+        """
+        BaseImpl.validate_dataframe(df)
+        if self._closed:
+            raise ValueError("I/O operation on closed ParquetWriter.")
+        if self._writer is None:
+            table = self._open(df)
+        elif list(df.columns) != self._columns:
+            raise ValueError(
+                "The columns of the DataFrame differ from the columns of the "
+                "first DataFrame written"
+            )
+        else:
+            table = self.api.Table.from_pandas(
+                df, schema=self.schema, preserve_index=self.index
+            )
+        self._writer.write_table(table, row_group_size=self.row_group_size)
+
+    def close(self) -> None:
+        """Write the file footer and close the file."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            if self._writer is not None:
+                self._writer.close()
+        finally:
+            if self._handles is not None:
+                self._handles.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
@@ -5,5 +5,13 @@ from pandas.io.parsers.readers import (
     read_fwf,
     read_table,
 )
+from pandas.io.parsers.row_index import build_row_index
 
-__all__ = ["TextFileReader", "TextParser", "read_csv", "read_fwf", "read_table"]
+__all__ = [
+    "TextFileReader",
+    "TextParser",
+    "build_row_index",
+    "read_csv",
+    "read_fwf",
+    "read_table",
+]
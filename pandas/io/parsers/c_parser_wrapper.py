@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
+import mmap
 from typing import TYPE_CHECKING
 import warnings
 
@@ -24,6 +25,7 @@ from pandas.core.dtypes.dtypes import CategoricalDtype
 from pandas.core.indexes.api import ensure_index_from_sequences
 
 from pandas.io.common import (
+    _IOWrapper,
     dedup_names,
     is_potential_multi_index,
 )
@@ -95,8 +97,19 @@ class CParserWrapper(ParserBase):
         if kwds["dtype_backend"] == "pyarrow":
             # Fail here loudly instead of in cython after reading
             import_optional_dependency("pyarrow")
+        if isinstance(src, _IOWrapper) and isinstance(src.buffer, mmap.mmap):
+            # memory_map=True: let the C parser tokenize the mapped pages in
+            # place rather than copying them through read()
+            src = src.buffer
         self._reader = parsers.TextReader(src, **kwds)
+        try:
+            self._set_names_from_reader()
+        except Exception:
+            # release the source, e.g. the buffer exported by a memory map
+            self.close()
+            raise
 
+    def _set_names_from_reader(self) -> None:
         self.unnamed_cols = self._reader.unnamed_cols
 
         # error: Cannot determine type of 'names'
@@ -352,13 +365,16 @@ def _filter_usecols(usecols, names: SequenceT) -> SequenceT | list[Hashable]:
 
 
 def _concatenate_chunks(
-    chunks: list[dict[int, ArrayLike]], column_names: list[str]
+    chunks: list[dict[int, ArrayLike]],
+    column_names: list[str],
+    sort_categories: bool = False,
 ) -> dict:
     """
     Concatenate chunks of data read with low_memory=True.
 
     The tricky part is handling Categoricals, where different chunks
-    may have different inferred categories.
+    may have different inferred categories. With ``sort_categories``, those
+    are sorted like the categories inferred from a single chunk.
     """
     names = list(chunks[0].keys())
     warning_columns = []
@@ -370,9 +386,12 @@ def _concatenate_chunks(
         dtypes = {a.dtype for a in arrs}
         non_cat_dtypes = {x for x in dtypes if not isinstance(x, CategoricalDtype)}
 
+        inferred = len(dtypes) > 1
         dtype = dtypes.pop()
         if isinstance(dtype, CategoricalDtype):
-            result[name] = union_categoricals(arrs, sort_categories=False)
+            result[name] = union_categoricals(
+                arrs, sort_categories=sort_categories and inferred
+            )
         else:
             result[name] = concat_compat(arrs)
             if len(non_cat_dtypes) > 1 and result[name].dtype == np.dtype(object):
@@ -6,11 +6,14 @@ GH#48849 provides a convenient way of deprecating keyword arguments
 
 from __future__ import annotations
 
+import codecs
 from collections import (
     abc,
     defaultdict,
 )
+from concurrent.futures import ThreadPoolExecutor
 import csv
+import os
 import sys
 from textwrap import fill
 from typing import (
@@ -52,6 +55,7 @@ from pandas.core.shared_docs import _shared_docs
 from pandas.io.common import (
     IOHandles,
     get_handle,
+    infer_compression,
     stringify_path,
     validate_header_arg,
 )
@@ -61,11 +65,20 @@ from pandas.io.parsers.base_parser import (
     is_index_col,
     parser_defaults,
 )
-from pandas.io.parsers.c_parser_wrapper import CParserWrapper
+from pandas.io.parsers.c_parser_wrapper import (
+    CParserWrapper,
+    _concatenate_chunks,
+)
 from pandas.io.parsers.python_parser import (
     FixedWidthFieldParser,
     PythonParser,
 )
+from pandas.io.parsers.row_index import (
+    _AmbiguousQuotesError,
+    _field_bounds,
+    _get_row_index,
+    _quotes_at_field_bounds,
+)
 
 if TYPE_CHECKING:
     from collections.abc import (
@@ -136,6 +149,8 @@ if TYPE_CHECKING:
         low_memory: bool
         memory_map: bool
         float_precision: Literal["high", "legacy", "round_trip"] | None
+        num_threads: int | None
+        row_range: tuple[int, int] | None
         storage_options: StorageOptions | None
         dtype_backend: DtypeBackend | lib.NoDefault
 else:
@@ -241,8 +256,8 @@ dtype : dtype or dict of {{Hashable : dtype}}, optional
         listed.
 engine : {{'c', 'python', 'pyarrow'}}, optional
     Parser engine to use. The C and pyarrow engines are faster, while the python engine
-    is currently more feature-complete. Multithreading is currently only supported by
-    the pyarrow engine.
+    is currently more feature-complete. Multithreading is supported by the pyarrow
+    engine and, through ``num_threads``, by the C engine.
 
     .. versionadded:: 1.4.0
 
@@ -442,11 +457,40 @@ memory_map : bool, default False
     If a filepath is provided for ``filepath_or_buffer``, map the file object
     directly onto memory and access the data directly from there. Using this
     option can improve performance because there is no longer any I/O overhead.
+    The C engine tokenizes the mapped pages of UTF-8 encoded files in place,
+    without copying them into intermediate buffers.
 float_precision : {{'high', 'legacy', 'round_trip'}}, optional
     Specifies which converter the C engine should use for floating-point
     values. The options are ``None`` or ``'high'`` for the ordinary converter,
     ``'legacy'`` for the original lower precision pandas converter, and
     ``'round_trip'`` for the round-trip converter.
+num_threads : int, optional
+    Number of threads the C engine uses to parse the file. When larger than 1,
+    a local, uncompressed, UTF-8 encoded file is split into byte ranges at
+    record boundaries (taking quoted fields into account), the ranges are
+    tokenized and converted concurrently and the resulting columns are
+    concatenated in file order. As with ``low_memory=True``, types are inferred
+    per range, so specify ``dtype`` for columns of mixed type. The file is
+    parsed on a single thread if it cannot be split safely, e.g. for buffers,
+    compressed or small files, a list-like ``header``, ``skiprows`` or when
+    ``escapechar`` or ``comment`` are combined with quoting. Cannot be combined
+    with ``chunksize`` or ``iterator`` (Only valid with C parser).
+
+    .. versionadded:: 3.0.0
+row_range : tuple of (int, int), optional
+    Read only the data rows ``start`` (inclusive) to ``stop`` (exclusive),
+    numbered from 0 after the header like the rows of the returned
+    :class:`~pandas.DataFrame`. The parser seeks directly to the first
+    requested row using the row index written by
+    :func:`pandas.io.parsers.build_row_index` if it is up to date, otherwise the
+    row offsets are scanned first. A default index starts at ``start``.
+    Requires a local, uncompressed file and cannot be combined with
+    ``skiprows``, ``nrows``, ``chunksize``, ``iterator``, ``num_threads``,
+    ``comment``, ``escapechar``, a list-like ``header`` or, with
+    ``skip_blank_lines``, a space or tab delimiter. Files whose lines end with
+    a bare carriage return are not supported (Only valid with C parser).
+
+    .. versionadded:: 3.0.0
 
 {storage_options}
 
@@ -680,6 +724,8 @@ def _read(
     # Extract some of the arguments (pass chunksize on).
     iterator = kwds.get("iterator", False)
     chunksize = kwds.get("chunksize", None)
+    num_threads = validate_integer("num_threads", kwds.pop("num_threads", None), 1)
+    row_range = kwds.pop("row_range", None)
 
     # Check type of encoding_errors
     errors = kwds.get("encoding_errors", "strict")
@@ -701,6 +747,44 @@ def _read(
     else:
         chunksize = validate_integer("chunksize", chunksize, 1)
 
+    if num_threads is not None:
+        if kwds.get("engine") != "c":
+            raise ValueError(
+                "The 'num_threads' option is only supported with the 'c' engine"
+            )
+        if chunksize is not None or iterator:
+            raise ValueError(
+                "The 'num_threads' option cannot be used together with "
+                "'chunksize' or 'iterator'"
+            )
+
+    if row_range is not None:
+        if not (
+            isinstance(row_range, tuple)
+            and len(row_range) == 2
+            and all(is_integer(x) for x in row_range)
+            and 0 <= row_range[0] <= row_range[1]
+        ):
+            raise ValueError(
+                "'row_range' must be a tuple of two integers (start, stop) "
+                "with 0 <= start <= stop"
+            )
+        if kwds.get("engine") != "c":
+            raise ValueError(
+                "The 'row_range' option is only supported with the 'c' engine"
+            )
+        for name, used in (
+            ("skiprows", kwds.get("skiprows") is not None),
+            ("nrows", kwds.get("nrows") is not None),
+            ("chunksize", chunksize is not None),
+            ("iterator", iterator),
+            ("num_threads", num_threads is not None),
+        ):
+            if used:
+                raise ValueError(
+                    f"The 'row_range' option cannot be used together with {name!r}"
+                )
+
     nrows = kwds.get("nrows", None)
 
     # Check for duplicates in names.
@@ -713,9 +797,331 @@ def _read(
         return parser
 
     with parser:
+        if row_range is not None:
+            return _read_row_range(parser, filepath_or_buffer, row_range)
+        if num_threads is not None and num_threads > 1:
+            df = _read_parallel(parser, filepath_or_buffer, nrows, num_threads)
+            if df is not None:
+                return df
         return parser.read(nrows)
 
 
+# Ranges smaller than this are not worth the per-thread parser setup; it also
+# keeps the header region within the first range.
+_PARALLEL_MIN_RANGE_SIZE = 1 << 20
+
+
+class _ByteRangeReader:
+    """
+    Binary reader over the ``[start, stop)`` byte range of a local file.
+
+    Only exposes ``read`` so that the C parser consumes the raw bytes directly
+    instead of going through the text wrapper applied to other buffers.
+    """
+
+    def __init__(self, path: str, start: int, stop: int) -> None:
+        self._handle = open(path, "rb")
+        self._handle.seek(start)
+        self._remaining = stop - start
+
+    def read(self, size: int = -1) -> bytes:
+        if size < 0 or size > self._remaining:
+            size = self._remaining
+        data = self._handle.read(size)
+        self._remaining -= len(data)
+        return data
+
+    def close(self) -> None:
+        self._handle.close()
+
+
+def _find_record_boundaries(
+    path: str,
+    num_ranges: int,
+    lineterminator: str,
+    quotechar: str | None,
+    delimiter: str | None,
+    blocksize: int = 1 << 24,
+) -> list[int] | None:
+    """
+    Split a file into roughly equal byte ranges starting at record boundaries.
+
+    A boundary is placed right after the first line terminator at or past each
+    target offset that is not enclosed in quotes, which is the case when the
+    number of quote characters preceding it is even.
+
+    Returns
+    -------
+    list of int or None
+        Sorted offsets, starting with 0 and ending with the file size. None if
+        a quote character before the last boundary does not open or close a
+        field, in which case quotes cannot be paired without tokenizing.
+    """
+    size = os.path.getsize(path)
+    targets = [size * i // num_ranges for i in range(1, num_ranges)]
+    boundaries = [0]
+    term = lineterminator.encode()
+    bounds = _field_bounds(delimiter, lineterminator)
+    # last byte before the current block
+    prev_byte = term[0]
+    # number of quote characters before the current block
+    quotes = 0
+    offset = 0
+    with open(path, "rb") as handle:
+        while targets:
+            block = handle.read(blocksize)
+            if not block:
+                break
+            if quotechar is not None:
+                arr = np.frombuffer(block, dtype=np.uint8)
+                following = handle.peek(1)[:1] or term
+                if not _quotes_at_field_bounds(
+                    arr,
+                    np.flatnonzero(arr == ord(quotechar)),
+                    bool(quotes % 2),
+                    prev_byte,
+                    following[0],
+                    ord(quotechar),
+                    bounds,
+                ):
+                    return None
+            pos = max(targets[0], boundaries[-1]) - offset
+            while targets and pos < len(block):
+                idx = block.find(term, max(pos, 0))
+                if idx == -1:
+                    break
+                if quotechar is not None and (
+                    quotes + block.count(quotechar.encode(), 0, idx)
+                ) % 2:
+                    pos = idx + 1
+                    continue
+                boundary = offset + idx + 1
+                if boundary < size:
+                    boundaries.append(boundary)
+                while targets and targets[0] < boundary:
+                    targets.pop(0)
+                if targets:
+                    pos = targets[0] - offset
+            if quotechar is not None:
+                quotes += block.count(quotechar.encode())
+            offset += len(block)
+            prev_byte = block[-1]
+    boundaries.append(size)
+    return boundaries
+
+
+def _read_byte_range(
+    path: str, start: int, stop: int, kwds: dict[str, Any], nrows: int | None
+) -> DataFrame:
+    """Parse the ``[start, stop)`` byte range of a file with the C engine."""
+    source = _ByteRangeReader(path, start, stop)
+    try:
+        with TextFileReader(source, engine="c", **kwds) as parser:
+            return parser.read(nrows)
+    finally:
+        source.close()
+
+
+def _is_local_utf8_file(
+    parser: TextFileReader,
+    path: FilePath | ReadCsvBuffer[bytes] | ReadCsvBuffer[str],
+) -> bool:
+    """Whether ``path`` is a local, uncompressed file the C parser reads as bytes."""
+    options = parser.options
+    return (
+        parser.engine == "c"
+        and isinstance(path, str)
+        and os.path.isfile(path)
+        and infer_compression(path, options.get("compression")) is None
+        and codecs.lookup(options.get("encoding") or "utf-8").name == "utf-8"
+    )
+
+
+def _range_kwds(parser: TextFileReader) -> dict[str, Any]:
+    """Options to parse a byte range of the file that starts after its header."""
+    kwds = dict(parser.orig_options, dialect=None, memory_map=False, skiprows=None)
+    if kwds.get("header") is not None:
+        # the range carries no header row, pass on the names it resolved to
+        kwds.update(header=None, names=list(parser._engine._reader.header[0]))
+    return kwds
+
+
+def _has_default_index(parser: TextFileReader) -> bool:
+    """Whether the parsed frames get a RangeIndex rather than index columns."""
+    return not (
+        is_index_col(parser.options["index_col"]) or parser._engine._implicit_index
+    )
+
+
+def _read_parallel(
+    parser: TextFileReader,
+    filepath_or_buffer: FilePath | ReadCsvBuffer[bytes] | ReadCsvBuffer[str],
+    nrows: int | None,
+    num_threads: int,
+) -> DataFrame | None:
+    """
+    Read a local file by parsing byte ranges of it on several threads.
+
+    ``parser`` has already resolved the options and the header of the file.
+    Each range is parsed by its own ``TextReader``, which releases the GIL
+    while tokenizing and converting, and the columns of the ranges are then
+    concatenated like the chunks of ``low_memory=True``.
+
+    Returns None if the file cannot be split safely, in which case ``parser``
+    is left untouched for a single-threaded read.
+    """
+    path = stringify_path(filepath_or_buffer)
+    options = parser.options
+    kwds = parser.orig_options
+    quoting = options["quoting"]
+    # the rows skipped by skiprows can extend past the first range and are
+    # counted by the tokenizer with rules a byte scan does not reproduce
+    if (
+        not _is_local_utf8_file(parser, path)
+        or is_list_like(kwds.get("header"))
+        or kwds.get("skiprows") is not None
+        or (
+            quoting != csv.QUOTE_NONE
+            and (
+                options["escapechar"] is not None
+                or options["comment"] is not None
+                or not options["doublequote"]
+            )
+        )
+    ):
+        return None
+
+    num_ranges = min(num_threads, os.path.getsize(path) // _PARALLEL_MIN_RANGE_SIZE)
+    if num_ranges < 2:
+        return None
+
+    quotechar = options["quotechar"]
+    boundaries = _find_record_boundaries(
+        path,
+        num_ranges,
+        options["lineterminator"] or "\n",
+        None if quoting == csv.QUOTE_NONE or not quotechar else quotechar,
+        options.get("delimiter"),
+    )
+    if boundaries is None or len(boundaries) < 3:
+        return None
+
+    range_kwds = dict(kwds, dialect=None, memory_map=False)
+    tail_kwds = _range_kwds(parser)
+
+    with ThreadPoolExecutor(max_workers=num_threads) as executor:
+        futures = [
+            executor.submit(
+                _read_byte_range,
+                path,
+                start,
+                stop,
+                range_kwds if i == 0 else tail_kwds,
+                nrows,
+            )
+            for i, (start, stop) in enumerate(zip(boundaries[:-1], boundaries[1:]))
+        ]
+        frames = [future.result() for future in futures]
+
+    first = frames[0]
+    frames = [frame for frame in frames if len(frame)] or [first]
+    chunks = [
+        {i: frame.iloc[:, i]._values for i in range(frame.shape[1])}
+        for frame in frames
+    ]
+    data = _concatenate_chunks(chunks, list(first.columns), sort_categories=True)
+
+    if _has_default_index(parser):
+        index = RangeIndex(sum(len(frame) for frame in frames))
+    else:
+        index = first.index.append([frame.index for frame in frames[1:]])
+        # ranges parsed with explicit names do not name their index
+        index = index.set_names(first.index.names)
+
+    df = DataFrame(data, index=index, copy=False)
+    df.columns = first.columns
+    if nrows is not None:
+        df = df.iloc[:nrows]
+    return df
+
+
+def _read_row_range(
+    parser: TextFileReader,
+    filepath_or_buffer: FilePath | ReadCsvBuffer[bytes] | ReadCsvBuffer[str],
+    row_range: tuple[int, int],
+) -> DataFrame:
+    """
+    Read the data rows ``[start, stop)`` of a file without parsing those before.
+
+    The byte offsets of the rows are looked up in the row index of the file,
+    see :func:`pandas.io.parsers.build_row_index`. Files whose records cannot
+    be located without tokenizing them are read serially up to ``stop``.
+    """
+    path = stringify_path(filepath_or_buffer)
+    options = parser.options
+    header = parser.orig_options.get("header")
+    if not _is_local_utf8_file(parser, path):
+        raise ValueError(
+            "The 'row_range' option requires a local, uncompressed file read "
+            "with the 'c' engine"
+        )
+    if is_list_like(header) or options["comment"] is not None:
+        raise ValueError(
+            "The 'row_range' option is not supported with a list-like 'header' "
+            "or 'comment'"
+        )
+    if options["escapechar"] is not None:
+        raise ValueError("The 'row_range' option is not supported with 'escapechar'")
+    delimiter = options.get("delimiter")
+    if options["skip_blank_lines"] and delimiter in (" ", "\t"):
+        # a line of delimiters is a row of empty fields, not a blank line
+        raise ValueError(
+            "The 'row_range' option is not supported with a space or tab "
+            "delimiter and 'skip_blank_lines'"
+        )
+
+    first_record = 0 if header is None else header + 1
+    start, stop = row_range
+    offsets = None
+    if options["doublequote"]:
+        try:
+            index = _get_row_index(
+                path,
+                options["quotechar"],
+                options["quoting"],
+                delimiter,
+                options["lineterminator"],
+                options["skip_blank_lines"],
+            )
+            offsets = (
+                index.record_offset(path, first_record + start),
+                index.record_offset(path, first_record + stop),
+            )
+        except _AmbiguousQuotesError:
+            pass
+
+    if offsets is None:
+        df = parser.read(stop).iloc[start:]
+        if _has_default_index(parser):
+            df.index = RangeIndex(start, start + len(df))
+        return df
+
+    start_offset, stop_offset = offsets
+    # empty frame carrying the columns and index names derived from the header
+    meta = parser.read(0)
+    if start_offset >= stop_offset:
+        df = meta
+    else:
+        df = _read_byte_range(
+            path, start_offset, stop_offset, _range_kwds(parser), None
+        )
+        df.columns = meta.columns
+        df.index = df.index.set_names(meta.index.names)
+    if _has_default_index(parser):
+        df.index = RangeIndex(start, start + len(df))
+    return df
+
+
 @overload
 def read_csv(
     filepath_or_buffer: FilePath | ReadCsvBuffer[bytes] | ReadCsvBuffer[str],
@@ -826,6 +1232,8 @@ def read_csv(
     low_memory: bool = _c_parser_defaults["low_memory"],
     memory_map: bool = False,
     float_precision: Literal["high", "legacy", "round_trip"] | None = None,
+    num_threads: int | None = None,
+    row_range: tuple[int, int] | None = None,
     storage_options: StorageOptions | None = None,
     dtype_backend: DtypeBackend | lib.NoDefault = lib.no_default,
 ) -> DataFrame | TextFileReader:
@@ -961,6 +1369,8 @@ def read_table(
     low_memory: bool = _c_parser_defaults["low_memory"],
     memory_map: bool = False,
     float_precision: Literal["high", "legacy", "round_trip"] | None = None,
+    num_threads: int | None = None,
+    row_range: tuple[int, int] | None = None,
     storage_options: StorageOptions | None = None,
     dtype_backend: DtypeBackend | lib.NoDefault = lib.no_default,
 ) -> DataFrame | TextFileReader:
@@ -1192,9 +1602,10 @@ class TextFileReader(abc.Iterator):
         self._engine = self._make_engine(f, self.engine)
 
     def close(self) -> None:
+        # the engine may still reference the handles, e.g. a memory map
+        self._engine.close()
         if self.handles is not None:
             self.handles.close()
-        self._engine.close()
 
     def _get_options_with_defaults(self, engine: CSVEngine) -> dict[str, Any]:
         kwds = self.orig_options
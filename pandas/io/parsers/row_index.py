@@ -0,0 +1,418 @@
+"""
+Sparse row-offset index for random access into delimited text files.
+
+The index stores the byte offset of every ``stride``-th record of a file. A
+record ends at a line terminator that is not enclosed in quotes, which makes
+the offsets valid seek targets for the C parser. Blank lines, empty or made of
+whitespace only, are not counted as records when ``skip_blank_lines`` is set,
+matching how ``read_csv`` numbers the rows it returns.
+"""
+
+from __future__ import annotations
+
+import csv
+from dataclasses import (
+    asdict,
+    dataclass,
+)
+import json
+import os
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from pandas.io.common import stringify_path
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from pandas._typing import FilePath
+
+
+_ROW_INDEX_VERSION = 3
+_ROW_INDEX_SUFFIX = ".rowindex"
+# bytes of the lines that the C tokenizer skips as blank lines
+_WHITESPACE = np.array([ord(" "), ord("\t"), ord("\r")], dtype=np.uint8)
+
+
+@dataclass(frozen=True)
+class _RowIndex:
+    """
+    Byte offsets of every ``stride``-th record of a file.
+
+    ``size`` and ``mtime_ns`` identify the version of the file the index was
+    built for, the remaining attributes the options that define a record.
+    """
+
+    size: int
+    mtime_ns: int
+    stride: int
+    nrecords: int
+    offsets: list[int]
+    quotechar: str | None
+    delimiter: str | None
+    lineterminator: str
+    skip_blank_lines: bool
+
+    def matches(
+        self,
+        path: str,
+        quotechar: str | None,
+        delimiter: str | None,
+        lineterminator: str,
+        skip_blank_lines: bool,
+    ) -> bool:
+        """Whether the index is valid for the current state of ``path``."""
+        stat = os.stat(path)
+        return (
+            self.size == stat.st_size
+            and self.mtime_ns == stat.st_mtime_ns
+            and self.quotechar == quotechar
+            and self.delimiter == delimiter
+            and self.lineterminator == lineterminator
+            and self.skip_blank_lines == skip_blank_lines
+        )
+
+    def record_offset(self, path: str, record: int) -> int:
+        """
+        Byte offset at which ``record`` starts.
+
+        Seeks to the closest indexed record before it and scans forward, the
+        file size is returned for records past the end of the file.
+        """
+        if record >= self.nrecords:
+            return self.size
+        k, remainder = divmod(record, self.stride)
+        offset = self.offsets[k]
+        if remainder == 0:
+            return offset
+        for starts in _iter_record_starts(
+            path,
+            offset,
+            self.quotechar,
+            self.delimiter,
+            self.lineterminator,
+            self.skip_blank_lines,
+        ):
+            if remainder < len(starts):
+                return int(starts[remainder])
+            remainder -= len(starts)
+        raise ValueError(f"Row index is out of date for {path}")
+
+
+def _iter_record_starts(
+    path: str,
+    start: int,
+    quotechar: str | None,
+    delimiter: str | None,
+    lineterminator: str,
+    skip_blank_lines: bool,
+    blocksize: int = 1 << 24,
+) -> Iterator[np.ndarray]:
+    """
+    Yield the start offsets of the records of a file, block by block.
+
+    ``start`` has to be the offset of a record start, i.e. outside of quotes.
+    As in the C tokenizer, lines made of spaces, tabs and carriage returns only
+    are blank lines.
+
+    Raises
+    ------
+    ValueError
+        If ``lineterminator`` is ``'\\n'`` and a carriage return that is not
+        followed by it ends a record, as it does in the C tokenizer.
+    _AmbiguousQuotesError
+        If a quote character does not open or close a field, see
+        :func:`_quotes_at_field_bounds`.
+    """
+    term = ord(lineterminator)
+    quote = None if quotechar is None else ord(quotechar)
+    bounds = _field_bounds(delimiter, lineterminator)
+    # last byte before the current block
+    prev_byte = term
+    # offset of the last line terminator, blank lines included
+    last_term = start - 1
+    # whether the quote characters seen so far are unbalanced
+    in_quotes = False
+    # whether the previous block ended with a carriage return outside quotes
+    pending_cr = False
+    # number of non-whitespace bytes of the record ending in the next block
+    carry = 0
+    offset = start
+    with open(path, "rb") as handle:
+        handle.seek(start)
+        while True:
+            block = handle.read(blocksize)
+            if not block:
+                break
+            arr = np.frombuffer(block, dtype=np.uint8)
+            terms = np.flatnonzero(arr == term)
+            crs = np.flatnonzero(arr == ord("\r"))
+            if pending_cr and arr[0] != ord("\n"):
+                _raise_bare_carriage_return(path)
+            if quote is not None:
+                quotes = np.flatnonzero(arr == quote)
+                following = handle.peek(1)[:1] or lineterminator.encode()
+                if not _quotes_at_field_bounds(
+                    arr, quotes, in_quotes, prev_byte, following[0], quote, bounds
+                ):
+                    raise _AmbiguousQuotesError(
+                        f"{path} has quote characters within unquoted fields, "
+                        "which is not supported by the row index"
+                    )
+                before = np.searchsorted(quotes, terms) + in_quotes
+                terms = terms[before % 2 == 0]
+                before = np.searchsorted(quotes, crs) + in_quotes
+                crs = crs[before % 2 == 0]
+                in_quotes = bool((len(quotes) + in_quotes) % 2)
+            if term == ord("\n") and len(crs):
+                following = crs + 1
+                if (arr[following[following < len(arr)]] != term).any():
+                    _raise_bare_carriage_return(path)
+                pending_cr = crs[-1] == len(arr) - 1
+            else:
+                pending_cr = False
+
+            # each record starts right after the preceding line terminator
+            starts = np.concatenate([[last_term + 1], terms + offset + 1])[:-1]
+            # running count of the bytes that are not whitespace
+            nonblank = np.concatenate(
+                [[0], np.cumsum(~np.isin(arr, _WHITESPACE), dtype=np.int64)]
+            )
+            if skip_blank_lines:
+                first = np.maximum(starts - offset, 0)
+                length = nonblank[terms] - nonblank[first]
+                if len(length):
+                    # the first record started in a previous block
+                    length[0] += carry * (starts[0] < offset)
+                starts = starts[length > 0]
+            if len(terms):
+                last_term = int(terms[-1]) + offset
+                carry = int(nonblank[-1] - nonblank[terms[-1] + 1])
+            else:
+                carry += int(nonblank[-1])
+            offset += len(block)
+            prev_byte = int(arr[-1])
+            yield starts
+
+    if pending_cr:
+        _raise_bare_carriage_return(path)
+    if last_term + 1 < offset and not (skip_blank_lines and carry == 0):
+        # final record without a trailing line terminator
+        yield np.array([last_term + 1])
+
+
+class _AmbiguousQuotesError(ValueError):
+    """
+    Quote characters of a file cannot be paired without tokenizing it.
+    """
+
+
+def _field_bounds(delimiter: str | None, lineterminator: str) -> np.ndarray:
+    """
+    Bytes that can precede the start or follow the end of a field.
+    """
+    chars = [ord(lineterminator)]
+    if lineterminator == "\n":
+        chars.append(ord("\r"))
+    if delimiter is not None:
+        chars.append(ord(delimiter))
+    return np.array(chars, dtype=np.uint8)
+
+
+def _quotes_at_field_bounds(
+    arr: np.ndarray,
+    quotes: np.ndarray,
+    in_quotes: bool,
+    prev_byte: int,
+    next_byte: int,
+    quote: int,
+    bounds: np.ndarray,
+) -> bool:
+    """
+    Whether pairing the quotes of a block by parity matches the C tokenizer.
+
+    The tokenizer only opens a quoted field at the start of a field, a quote
+    character anywhere else is data. Parity pairing therefore agrees with it
+    if every opening quote follows a field bound and every closing quote
+    precedes one, a doubled quote within a quoted field being a closing quote
+    directly followed by an opening quote.
+
+    Parameters
+    ----------
+    arr : np.ndarray
+        Bytes of the block.
+    quotes : np.ndarray
+        Positions of the quote characters in ``arr``.
+    in_quotes : bool
+        Whether the block starts within a quoted field.
+    prev_byte, next_byte : int
+        Bytes before and after the block, a line terminator at the start and
+        end of the file.
+    quote : int
+        The quote character.
+    bounds : np.ndarray
+        Bytes ending a field, see :func:`_field_bounds`.
+    """
+    if not len(quotes):
+        return True
+    before = np.concatenate([[prev_byte], arr])[quotes]
+    after = np.concatenate([arr, [next_byte]])[quotes + 1]
+    opening = (np.arange(len(quotes)) + in_quotes) % 2 == 0
+    neighbor = np.where(opening, before, after)
+    return bool((np.isin(neighbor, bounds) | (neighbor == quote)).all())
+
+
+def _raise_bare_carriage_return(path: str) -> None:
+    raise ValueError(
+        f"{path} has records ending with a carriage return, which is not "
+        "supported by the row index"
+    )
+
+
+def _row_index_path(path: str) -> str:
+    return path + _ROW_INDEX_SUFFIX
+
+
+def _record_options(
+    quotechar: str | None, quoting: int, lineterminator: str | None
+) -> tuple[str | None, str]:
+    if quoting == csv.QUOTE_NONE or not quotechar:
+        quotechar = None
+    return quotechar, lineterminator or "\n"
+
+
+def _build_row_index(
+    path: str,
+    stride: int,
+    quotechar: str | None,
+    delimiter: str | None,
+    lineterminator: str,
+    skip_blank_lines: bool,
+) -> _RowIndex:
+    stat = os.stat(path)
+    offsets: list[int] = []
+    nrecords = 0
+    for starts in _iter_record_starts(
+        path, 0, quotechar, delimiter, lineterminator, skip_blank_lines
+    ):
+        # records at positions that are multiples of stride
+        first = -nrecords % stride
+        offsets.extend(starts[first::stride].tolist())
+        nrecords += len(starts)
+    return _RowIndex(
+        size=stat.st_size,
+        mtime_ns=stat.st_mtime_ns,
+        stride=stride,
+        nrecords=nrecords,
+        offsets=offsets,
+        quotechar=quotechar,
+        delimiter=delimiter,
+        lineterminator=lineterminator,
+        skip_blank_lines=skip_blank_lines,
+    )
+
+
+def _get_row_index(
+    path: str,
+    quotechar: str | None,
+    quoting: int,
+    delimiter: str | None,
+    lineterminator: str | None,
+    skip_blank_lines: bool,
+) -> _RowIndex:
+    """
+    Load the sidecar index of ``path`` if it is up to date, else build one.
+
+    An index built here is not written to disk.
+    """
+    quotechar, lineterminator = _record_options(quotechar, quoting, lineterminator)
+    sidecar = _row_index_path(path)
+    if os.path.exists(sidecar):
+        with open(sidecar, encoding="utf-8") as handle:
+            content = json.load(handle)
+        if content.pop("version", None) == _ROW_INDEX_VERSION:
+            index = _RowIndex(**content)
+            if index.matches(
+                path, quotechar, delimiter, lineterminator, skip_blank_lines
+            ):
+                return index
+    return _build_row_index(
+        path, 100_000, quotechar, delimiter, lineterminator, skip_blank_lines
+    )
+
+
+def build_row_index(
+    filepath: FilePath,
+    *,
+    stride: int = 100_000,
+    sep: str = ",",
+    quotechar: str = '"',
+    quoting: int = csv.QUOTE_MINIMAL,
+    lineterminator: str | None = None,
+    skip_blank_lines: bool = True,
+) -> str:
+    """
+    Build a sparse row-offset index for a delimited text file.
+
+    The index is written next to the file, with a ``.rowindex`` suffix, and is
+    used by :func:`read_csv` to seek directly to the rows requested through
+    ``row_range``. It is ignored once the file is modified.
+
+    .. versionadded:: 3.0.0
+
+    Parameters
+    ----------
+    filepath : str or path object
+        Path to a local, uncompressed file.
+    stride : int, default 100000
+        Number of records between two indexed offsets. Smaller values make
+        the index larger but reduce the scanning needed to reach a row.
+    sep : str, default ','
+        Character separating the fields of a record.
+    quotechar : str, default '"'
+        Character used to quote fields, line terminators within quoted fields
+        do not end a record.
+    quoting : int, default csv.QUOTE_MINIMAL
+        Quoting convention of the file; with ``csv.QUOTE_NONE`` quote
+        characters are ignored.
+    lineterminator : str, optional
+        Character ending a record, defaults to ``'\\n'``.
+    skip_blank_lines : bool, default True
+        Whether blank lines, empty or made of whitespace only, are excluded
+        from the row count, as in :func:`read_csv`.
+
+    Returns
+    -------
+    str
+        Path of the index file.
+
+    Raises
+    ------
+    ValueError
+        If records cannot be located without tokenizing the file, e.g. when
+        a quote character appears within an unquoted field.
+
+    See Also
+    --------
+    read_csv : Read a comma-separated values (csv) file into DataFrame.
+
+    Examples
+    --------
+    >>> pd.io.parsers.build_row_index("data.csv")  # doctest: +SKIP
+    'data.csv.rowindex'
+    >>> pd.read_csv("data.csv", row_range=(40_000_000, 41_000_000))  # doctest: +SKIP
+    """
+    path = stringify_path(filepath)
+    if not isinstance(path, str) or not os.path.isfile(path):
+        raise ValueError("A row index can only be built for a local file")
+    if stride < 1:
+        raise ValueError("'stride' must be an integer >=1")
+    quotechar_, lineterminator_ = _record_options(quotechar, quoting, lineterminator)
+    index = _build_row_index(
+        path, stride, quotechar_, sep, lineterminator_, skip_blank_lines
+    )
+    sidecar = _row_index_path(path)
+    with open(sidecar, "w", encoding="utf-8") as handle:
+        json.dump({"version": _ROW_INDEX_VERSION, **asdict(index)}, handle)
+    return sidecar
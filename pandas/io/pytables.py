@@ -5,7 +5,13 @@ to disk
 
 from __future__ import annotations
 
-from contextlib import suppress
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import (
+    closing,
+    contextmanager,
+    suppress,
+)
 import copy
 from datetime import (
     date,
@@ -15,6 +21,7 @@ import itertools
 import os
 import re
 from textwrap import dedent
+import threading
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -55,6 +62,7 @@ from pandas.core.dtypes.common import (
     ensure_object,
     is_bool_dtype,
     is_complex_dtype,
+    is_integer,
     is_list_like,
     is_string_dtype,
     needs_i8_conversion,
@@ -94,7 +102,10 @@ from pandas.core.computation.pytables import (
 from pandas.core.construction import extract_array
 from pandas.core.indexes.api import ensure_index
 
-from pandas.io.common import stringify_path
+from pandas.io.common import (
+    prefetch_iter,
+    stringify_path,
+)
 from pandas.io.formats.printing import (
     adjoin,
     pprint_thing,
@@ -159,6 +170,21 @@ def _ensure_str(name):
 Term = PyTablesExpr
 
 
+@contextmanager
+def _released(lock: threading.Lock | None) -> Iterator[None]:
+    """
+    Release a held lock for the duration of the block.
+    """
+    if lock is None:
+        yield
+        return
+    lock.release()
+    try:
+        yield
+    finally:
+        lock.acquire()
+
+
 def _ensure_term(where, scope_level: int):
     """
     Ensure that the where is a Term or a list of Term.
@@ -213,6 +239,16 @@ format_doc: Final = """
     put will default to 'fixed' and append will default to 'table'
 """
 
+coordinate_cache_size_doc: Final = """
+: int
+    number of where selections of tables whose matching row coordinates are
+    kept in memory by each HDFStore, so that repeating a selection reads the
+    coordinates directly. 0 disables the cache. The entries of a table are
+    dropped when it is written to through the store, writes from other
+    processes are only detected once they change the modification time or
+    size of the file
+"""
+
 with config.config_prefix("io.hdf"):
     config.register_option("dropna_table", False, dropna_doc, validator=config.is_bool)
     config.register_option(
@@ -221,6 +257,12 @@ with config.config_prefix("io.hdf"):
         format_doc,
         validator=config.is_one_of_factory(["fixed", "table", None]),
     )
+    config.register_option(
+        "coordinate_cache_size",
+        0,
+        coordinate_cache_size_doc,
+        validator=config.is_nonnegative_int,
+    )
 
 # oh the troubles to reduce import time
 _table_mod = None
@@ -316,6 +358,7 @@ def read_hdf(
     columns: list[str] | None = None,
     iterator: bool = False,
     chunksize: int | None = None,
+    prefetch: int = 0,
     **kwargs,
 ):
     """
@@ -365,6 +408,14 @@ def read_hdf(
         Return an iterator object.
     chunksize : int, optional
         Number of rows to include in an iteration when using an iterator.
+    prefetch : int, default 0
+        Number of chunks read ahead in a background thread, while the current
+        chunk is processed. Can only be passed together with ``iterator`` or
+        ``chunksize``. The store must not be used otherwise until the iterator
+        is exhausted or closed.
+
+        .. versionadded:: 3.0.0
+
     **kwargs
         Additional keyword arguments passed to HDFStore.
 
@@ -450,6 +501,7 @@ def read_hdf(
             iterator=iterator,
             chunksize=chunksize,
             auto_close=auto_close,
+            prefetch=prefetch,
         )
     except (ValueError, TypeError, LookupError):
         if not isinstance(path_or_buf, HDFStore):
@@ -542,6 +594,11 @@ class HDFStore:
 
     _handle: File | None
     _mode: str
+    # holds the lock of HDFStore.select_many in its worker threads only
+    _read_local: threading.local
+    # (pathname, condition, start, stop, nrows, file modification time and size)
+    # -> coordinates, least recently used first
+    _coordinate_cache: OrderedDict[tuple, np.ndarray]
 
     def __init__(
         self,
@@ -574,6 +631,8 @@ class HDFStore:
         self._complib = complib
         self._fletcher32 = fletcher32
         self._filters = None
+        self._read_local = threading.local()
+        self._coordinate_cache = OrderedDict()
         self.open(mode=mode, **kwargs)
 
     def __fspath__(self) -> str:
@@ -749,6 +808,7 @@ class HDFStore:
         if self._handle is not None:
             self._handle.close()
         self._handle = None
+        self._coordinate_cache.clear()
 
     @property
     def is_open(self) -> bool:
@@ -826,6 +886,7 @@ class HDFStore:
         iterator: bool = False,
         chunksize: int | None = None,
         auto_close: bool = False,
+        prefetch: int = 0,
     ):
         """
         Retrieve pandas object stored in file, optionally based on where criteria.
@@ -856,6 +917,13 @@ class HDFStore:
             Number or rows to include in iteration, return an iterator.
         auto_close : bool or False
             Should automatically close the store when finished.
+        prefetch : int, default 0
+            Number of chunks read ahead in a background thread, while the
+            current chunk is processed. Can only be passed together with
+            ``iterator`` or ``chunksize``. The store must not be used otherwise
+            until the iterator is exhausted or closed.
+
+            .. versionadded:: 3.0.0
 
         Returns
         -------
@@ -911,6 +979,7 @@ class HDFStore:
             iterator=iterator,
             chunksize=chunksize,
             auto_close=auto_close,
+            prefetch=prefetch,
         )
 
         return it.get_result()
@@ -998,6 +1067,7 @@ class HDFStore:
         iterator: bool = False,
         chunksize: int | None = None,
         auto_close: bool = False,
+        prefetch: int = 0,
     ):
         """
         Retrieve pandas objects from multiple tables.
@@ -1022,6 +1092,10 @@ class HDFStore:
         chunksize : nrows to include in iteration, return an iterator
         auto_close : bool, default False
             Should automatically close the store when finished.
+        prefetch : int, default 0
+            Number of chunks read ahead in a background thread when iterating.
+
+            .. versionadded:: 3.0.0
 
         Raises
         ------
@@ -1043,6 +1117,7 @@ class HDFStore:
                 iterator=iterator,
                 chunksize=chunksize,
                 auto_close=auto_close,
+                prefetch=prefetch,
             )
 
         if not isinstance(keys, (list, tuple)):
@@ -1104,10 +1179,117 @@ class HDFStore:
             iterator=iterator,
             chunksize=chunksize,
             auto_close=auto_close,
+            prefetch=prefetch,
         )
 
         return it.get_result(coordinates=True)
 
+    def select_many(
+        self,
+        keys,
+        where=None,
+        start=None,
+        stop=None,
+        columns=None,
+        max_workers: int | None = None,
+    ) -> dict[str, DataFrame | Series]:
+        """
+        Retrieve several pandas objects stored in file, reading them concurrently.
+
+        Reading from the file is serialized, as PyTables is not thread-safe, but
+        for keys stored in the table format the decoding of the values and the
+        construction of the objects overlap with the reading of the other keys.
+        Keys stored in the fixed format are read and converted in one go, so
+        they are read one after the other.
+
+        .. versionadded:: 3.0.0
+
+        .. warning::
+
+           Pandas uses PyTables for reading and writing HDF5 files, which allows
+           serializing object-dtype data with pickle when using the "fixed" format.
+           Loading pickled data received from untrusted sources can be unsafe.
+
+           See: https://docs.python.org/3/library/pickle.html for more.
+
+        Parameters
+        ----------
+        keys : list of str
+            Objects being retrieved from file.
+        where : list, dict or None
+            List of Term (or convertible) objects applied to every key, or a dict
+            mapping keys to their own criteria, optional.
+        start : int or None
+            Row number to start selection.
+        stop : int, default None
+            Row number to stop selection.
+        columns : list or None
+            A list of columns that if not None, will limit the return columns.
+        max_workers : int, optional
+            Maximum number of threads used, defaults to the default of
+            :class:`concurrent.futures.ThreadPoolExecutor`.
+
+        Returns
+        -------
+        dict
+            Retrieved objects keyed by the passed keys.
+
+        See Also
+        --------
+        HDFStore.select : Retrieve pandas object stored in file.
+        HDFStore.select_as_multiple : Retrieves pandas objects from multiple tables.
+
+        Examples
+        --------
+        >>> df = pd.DataFrame([[1, 2], [3, 4]], columns=["A", "B"])
+        >>> store = pd.HDFStore("store.h5", "w")  # doctest: +SKIP
+        >>> store.put("data1", df, format="table")  # doctest: +SKIP
+        >>> store.put("data2", df, format="table")  # doctest: +SKIP
+        >>> result = store.select_many(
+        ...     ["data1", "data2"], where="index > 0"
+        ... )  # doctest: +SKIP
+        >>> result["data2"]  # doctest: +SKIP
+           A  B
+        1  3  4
+        >>> store.close()  # doctest: +SKIP
+        """
+        if isinstance(keys, str) or not is_list_like(keys):
+            raise TypeError("keys must be a list-like of keys")
+        if max_workers is not None and (not is_integer(max_workers) or max_workers < 1):
+            raise ValueError("'max_workers' must be an integer >=1")
+        self._check_if_open()
+
+        keys = list(dict.fromkeys(keys))
+        if isinstance(where, dict):
+            wheres = {}
+            for key, value in where.items():
+                wheres[key] = _ensure_term(value, scope_level=1)
+        else:
+            where = _ensure_term(where, scope_level=1)
+            wheres = dict.fromkeys(keys, where)
+
+        # the lock is held while accessing the file and released by the table
+        # storers while converting the values read, in the worker threads only
+        lock = threading.Lock()
+
+        def func(key):
+            with lock:
+                self._read_local.lock = lock
+                try:
+                    return self.select(
+                        key,
+                        where=wheres.get(key),
+                        columns=columns,
+                        start=start,
+                        stop=stop,
+                    )
+                finally:
+                    self._read_local.lock = None
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(func, key) for key in keys]
+            return {key: future.result() for key, future in zip(keys, futures)}
+
     def put(
         self,
         key: str,
@@ -1228,6 +1410,7 @@ class HDFStore:
 
         """
         where = _ensure_term(where, scope_level=1)
+        self._drop_cached_coordinates(key)
         try:
             s = self.get_storer(key)
         except KeyError:
@@ -1259,7 +1442,10 @@ class HDFStore:
         # delete from the table
         if not s.is_table:
             raise ValueError("can only remove with where on objects written as tables")
-        return s.delete(where=where, start=start, stop=stop)
+        nrows = s.delete(where=where, start=start, stop=stop)
+        # the selection of the deleted rows is cached as well
+        self._drop_cached_coordinates(key)
+        return nrows
 
     def append(
         self,
@@ -1649,6 +1835,15 @@ class HDFStore:
         assert isinstance(node, _table_mod.Node), type(node)
         return node
 
+    def _drop_cached_coordinates(self, key: str) -> None:
+        """remove the cached coordinates of the node with the key and its children"""
+        if not key.startswith("/"):
+            key = "/" + key
+        prefix = key.rstrip("/") + "/"
+        for entry in list(self._coordinate_cache):
+            if entry[0] == key or entry[0].startswith(prefix):
+                del self._coordinate_cache[entry]
+
     def get_storer(self, key: str) -> GenericFixed | Table:
         """return the storer object for a key, raise if not in the file"""
         group = self.get_node(key)
@@ -1912,6 +2107,7 @@ class HDFStore:
             return
 
         group = self._identify_group(key, append)
+        self._drop_cached_coordinates(group._v_pathname)
 
         s = self._create_storer(group, format, value, encoding=encoding, errors=errors)
         if append:
@@ -2010,6 +2206,8 @@ class TableIterator:
     chunksize : the passed chunking value (default is 100000)
     auto_close : bool, default False
         Whether to automatically close the store at the end of iteration.
+    prefetch : int, default 0
+        Number of chunks read ahead in a background thread when iterating.
     """
 
     chunksize: int | None
@@ -2028,6 +2226,7 @@ class TableIterator:
         iterator: bool = False,
         chunksize: int | None = None,
         auto_close: bool = False,
+        prefetch: int = 0,
     ) -> None:
         self.store = store
         self.s = s
@@ -2056,24 +2255,48 @@ class TableIterator:
         else:
             self.chunksize = None
 
+        if not is_integer(prefetch) or prefetch < 0:
+            raise ValueError("'prefetch' must be an integer >=0")
+        if prefetch and self.chunksize is None:
+            raise ValueError(
+                "'prefetch' can only be passed together with 'iterator' or "
+                "'chunksize'"
+            )
+        self.prefetch = prefetch
+
         self.auto_close = auto_close
 
     def __iter__(self) -> Iterator:
         # iterate
-        current = self.start
         if self.coordinates is None:
             raise ValueError("Cannot iterate until get_result is called.")
-        while current < self.stop:
-            stop = min(current + self.chunksize, self.stop)
-            value = self.func(None, None, self.coordinates[current:stop])
-            current = stop
-            if value is None or not len(value):
-                continue
+        with closing(self._read_chunks()) as chunks:
+            for value in chunks:
+                if value is None or not len(value):
+                    continue
 
-            yield value
+                yield value
 
         self.close()
 
+    def _read_chunks(self) -> Iterator:
+        """
+        Iterate over the result of func for each chunk of the coordinates.
+
+        With ``prefetch``, the chunks are read in a background thread, at most
+        ``prefetch`` of them ahead of the consumer.
+        """
+        assert self.chunksize is not None  # for mypy
+        assert self.coordinates is not None  # for mypy
+        slices = [
+            slice(current, min(current + self.chunksize, self.stop))
+            for current in range(self.start, self.stop, self.chunksize)
+        ]
+        chunks = (self.func(None, None, self.coordinates[slc]) for slc in slices)
+        if self.prefetch:
+            return prefetch_iter(chunks, self.prefetch)
+        return chunks
+
     def close(self) -> None:
         if self.auto_close:
             self.store.close()
@@ -3880,16 +4103,18 @@ class Table(Fixed):
         values = selection.select()
 
         results = []
-        # convert the data
-        for a in self.axes:
-            a.set_info(self.info)
-            res = a.convert(
-                values,
-                nan_rep=self.nan_rep,
-                encoding=self.encoding,
-                errors=self.errors,
-            )
-            results.append(res)
+        # convert the data, the conversion does not access the file so that
+        # HDFStore.select_many can read the next selection meanwhile
+        with _released(getattr(self.parent._read_local, "lock", None)):
+            for a in self.axes:
+                a.set_info(self.info)
+                res = a.convert(
+                    values,
+                    nan_rep=self.nan_rep,
+                    encoding=self.encoding,
+                    errors=self.errors,
+                )
+                results.append(res)
 
         return results
 
@@ -5420,6 +5645,9 @@ class Selection:
         generate the selection
         """
         if self.condition is not None:
+            coords = self._cached_coords(self.start, self.stop)
+            if coords is not None:
+                return self.table.table.read_coordinates(coords)
             return self.table.table.read_where(
                 self.condition.format(), start=self.start, stop=self.stop
             )
@@ -5443,6 +5671,9 @@ class Selection:
             stop += nrows
 
         if self.condition is not None:
+            coords = self._cached_coords(start, stop)
+            if coords is not None:
+                return coords
             return self.table.table.get_where_list(
                 self.condition.format(), start=start, stop=stop, sort=True
             )
@@ -5450,3 +5681,34 @@ class Selection:
             return self.coordinates
 
         return np.arange(start, stop)
+
+    def _cached_coords(self, start, stop) -> np.ndarray | None:
+        """
+        return the coordinates matching the condition through the coordinate
+        cache of the store, None if the cache is disabled
+        """
+        size = get_option("io.hdf.coordinate_cache_size")
+        cache = self.table.parent._coordinate_cache
+        if not size:
+            cache.clear()
+            return None
+
+        table = self.table.table
+        condition = self.condition.format()
+        try:
+            stat = os.stat(self.table.parent._path)
+            modified = (stat.st_mtime_ns, stat.st_size)
+        except (OSError, TypeError):
+            modified = None
+        # appending changes nrows and writing to the file outside of the store
+        # changes its modification time, the old entries are not hit again
+        key = (self.table.pathname, condition, start, stop, table.nrows, modified)
+        coords = cache.get(key)
+        if coords is None:
+            coords = table.get_where_list(condition, start=start, stop=stop, sort=True)
+            coords.flags.writeable = False
+            cache[key] = coords
+        cache.move_to_end(key)
+        while len(cache) > size:
+            cache.popitem(last=False)
+        return coords
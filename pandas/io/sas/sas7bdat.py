@@ -16,6 +16,9 @@ Reference for binary data compression:
 
 from __future__ import annotations
 
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import sys
 from typing import TYPE_CHECKING
@@ -31,11 +34,17 @@ from pandas._libs.byteswap import (
 )
 from pandas._libs.sas import (
     Parser,
+    decompress_page,
     get_subheader_index,
 )
 from pandas._libs.tslibs.conversion import cast_from_unit_vectorized
 from pandas.errors import EmptyDataError
 
+from pandas.core.dtypes.common import (
+    is_integer,
+    is_list_like,
+)
+
 import pandas as pd
 from pandas import (
     DataFrame,
@@ -47,6 +56,12 @@ import pandas.io.sas.sas_constants as const
 from pandas.io.sas.sasreader import SASReader
 
 if TYPE_CHECKING:
+    from collections.abc import (
+        Hashable,
+        Sequence,
+    )
+    from concurrent.futures import Future
+
     from pandas._typing import (
         CompressionOptions,
         FilePath,
@@ -54,6 +69,19 @@ if TYPE_CHECKING:
     )
 
 
+# The known subheader signatures, by length, as unsigned integers in native
+# byte order.
+_subheader_signatures = {
+    length: np.array(
+        [
+            np.frombuffer(signature, dtype=f"u{length}")[0]
+            for signature in const.subheader_signature_to_index
+            if len(signature) == length
+        ]
+    )
+    for length in (4, 8)
+}
+
 _unix_origin = Timestamp("1970-01-01")
 _sas_origin = Timestamp("1960-01-01")
 
@@ -144,10 +172,22 @@ class SAS7BDATReader(SASReader):
     convert_header_text : bool, defaults to True
         If False, header text, including column names, are left as raw
         bytes.
+    compression : str or dict, defaults to 'infer'
+        For on-the-fly decompression of the file.
+    usecols : list-like or callable, defaults to None
+        Names of the columns to read, or a callable evaluated against the
+        column names returning True for the columns to read. The values of
+        the other columns are not decoded.
+    num_threads : int, defaults to None
+        Number of threads used to decompress the pages of an RLE or RDC
+        compressed file. The next pages are decompressed without holding the
+        GIL while the rows of the current page are converted. Uncompressed
+        files are not affected.
     """
 
     _int_length: int
     _cached_page: bytes | None
+    _current_page_decompressed: np.ndarray | None
 
     def __init__(
         self,
@@ -160,7 +200,12 @@ class SAS7BDATReader(SASReader):
         convert_text: bool = True,
         convert_header_text: bool = True,
         compression: CompressionOptions = "infer",
+        usecols: Sequence[Hashable] | Callable[[Hashable], bool] | None = None,
+        num_threads: int | None = None,
     ) -> None:
+        if num_threads is not None and (not is_integer(num_threads) or num_threads < 1):
+            raise ValueError("'num_threads' must be an integer >=1")
+
         self.index = index
         self.convert_dates = convert_dates
         self.blank_missing = blank_missing
@@ -177,6 +222,7 @@ class SAS7BDATReader(SASReader):
         self.columns: list[_Column] = []
 
         self._current_page_data_subheader_pointers: list[tuple[int, int]] = []
+        self._current_page_decompressed = None
         self._cached_page = None
         self._column_data_lengths: list[int] = []
         self._column_data_offsets: list[int] = []
@@ -191,6 +237,9 @@ class SAS7BDATReader(SASReader):
         )
 
         self._path_or_buf = self.handles.handle
+        self._num_threads = num_threads
+        self._page_executor: ThreadPoolExecutor | None = None
+        self._pending_pages: deque[tuple] = deque()
 
         # Same order as const.SASIndex
         self._subheader_processors = [
@@ -208,10 +257,14 @@ class SAS7BDATReader(SASReader):
         try:
             self._get_properties()
             self._parse_metadata()
+            self._column_selected = self._select_columns(usecols)
         except Exception:
             self.close()
             raise
 
+        if num_threads is not None and self.compression:
+            self._page_executor = ThreadPoolExecutor(max_workers=num_threads)
+
     def column_data_lengths(self) -> np.ndarray:
         """Return a numpy int64 array of the column data lengths"""
         return np.asarray(self._column_data_lengths, dtype=np.int64)
@@ -228,8 +281,29 @@ class SAS7BDATReader(SASReader):
         return np.asarray(self._column_types, dtype=np.dtype("S1"))
 
     def close(self) -> None:
+        if self._page_executor is not None:
+            self._page_executor.shutdown(cancel_futures=True)
+            self._pending_pages.clear()
         self.handles.close()
 
+    def _select_columns(self, usecols) -> list[bool]:
+        if usecols is None:
+            return [True] * len(self.column_names)
+        if callable(usecols):
+            return [bool(usecols(name)) for name in self.column_names]
+        if not is_list_like(usecols) or isinstance(usecols, dict):
+            raise ValueError(
+                "'usecols' must either be list-like of column names or a callable."
+            )
+        missing = [col for col in usecols if col not in self.column_names]
+        if missing:
+            raise ValueError(
+                "Usecols do not match columns, columns expected but not found: "
+                f"{missing}"
+            )
+        usecols = set(usecols)
+        return [name in usecols for name in self.column_names]
+
     def _get_properties(self) -> None:
         # Check magic number
         self._path_or_buf.seek(0)
@@ -302,7 +376,7 @@ class SAS7BDATReader(SASReader):
 
     def __next__(self) -> DataFrame:
         da = self.read(nrows=self.chunksize or 1)
-        if da.empty:
+        if len(da) == 0:
             self.close()
             raise StopIteration
         return da
@@ -387,37 +461,75 @@ class SAS7BDATReader(SASReader):
         )
 
     def _process_page_metadata(self) -> None:
-        bit_offset = self._page_bit_offset
-
-        for i in range(self._current_page_subheaders_count):
-            offset = const.subheader_pointers_offset + bit_offset
-            total_offset = offset + self._subheader_pointer_length * i
-
-            subheader_offset = self._read_uint(total_offset, self._int_length)
-            total_offset += self._int_length
-
-            subheader_length = self._read_uint(total_offset, self._int_length)
-            total_offset += self._int_length
-
-            subheader_compression = self._read_uint(total_offset, 1)
-            total_offset += 1
+        # The pointers are parsed at once, as pages of compressed files hold
+        # one data subheader per row. Only the other subheaders are processed
+        # one at a time.
+        int_len = self._int_length
+        page_length = len(self._cached_page)  # type: ignore[arg-type]
+        start = const.subheader_pointers_offset + self._page_bit_offset
+        count = self._current_page_subheaders_count
+        if start + count * self._subheader_pointer_length > page_length:
+            self.close()
+            raise ValueError("The cached page is too small.")
+        uint_dtype = f"{self.byte_order}u{int_len}"
+        pointers = np.frombuffer(
+            self._cached_page,  # type: ignore[arg-type]
+            dtype=np.dtype(
+                {
+                    "names": ["offset", "length", "compression", "type"],
+                    "formats": [uint_dtype, uint_dtype, "u1", "u1"],
+                    "offsets": [0, int_len, 2 * int_len, 2 * int_len + 1],
+                    "itemsize": self._subheader_pointer_length,
+                }
+            ),
+            count=count,
+            offset=start,
+        )
+        pointers = pointers[
+            (pointers["length"] != 0)
+            & (pointers["compression"] != const.truncated_subheader_id)
+        ]
+        if (pointers["offset"] > page_length - int_len).any():
+            self.close()
+            raise ValueError("The cached page is too small.")
 
-            subheader_type = self._read_uint(total_offset, 1)
+        subheader_offsets = pointers["offset"].astype(np.int64)
+        page = np.frombuffer(
+            self._cached_page,  # type: ignore[arg-type]
+            dtype=np.uint8,
+        )
+        signatures = page[subheader_offsets[:, None] + np.arange(int_len)]
+        is_data = ~np.isin(
+            signatures.view(f"u{int_len}").ravel(),
+            _subheader_signatures[int_len],
+        )
+        is_row = (
+            is_data
+            & np.isin(pointers["compression"], [const.compressed_subheader_id, 0])
+            & (pointers["type"] == const.compressed_subheader_type)
+        )
 
-            if (
-                subheader_length == 0
-                or subheader_compression == const.truncated_subheader_id
-            ):
-                continue
+        if self.compression:
+            self._current_page_data_subheader_pointers.extend(
+                zip(
+                    subheader_offsets[is_row].tolist(),
+                    pointers["length"][is_row].tolist(),
+                )
+            )
+            indices = np.flatnonzero(~is_row)
+        else:
+            # The compression is set by a subheader, possibly of this page
+            indices = np.arange(len(pointers))
 
-            subheader_signature = self._read_bytes(subheader_offset, self._int_length)
+        for i in indices:
+            subheader_offset = int(subheader_offsets[i])
+            subheader_length = int(pointers["length"][i])
+            subheader_signature = self._read_bytes(subheader_offset, int_len)
             subheader_index = get_subheader_index(subheader_signature)
             subheader_processor = self._subheader_processors[subheader_index]
 
             if subheader_processor is None:
-                f1 = subheader_compression in (const.compressed_subheader_id, 0)
-                f2 = subheader_type == const.compressed_subheader_type
-                if self.compression and f1 and f2:
+                if self.compression and is_row[i]:
                     self._current_page_data_subheader_pointers.append(
                         (subheader_offset, subheader_length)
                     )
@@ -651,8 +763,13 @@ class SAS7BDATReader(SASReader):
 
         nrows = min(nrows, self.row_count - self._current_row_in_file_index)
 
-        nd = self._column_types.count(b"d")
-        ns = self._column_types.count(b"s")
+        selected_types = [
+            ctype
+            for ctype, selected in zip(self._column_types, self._column_selected)
+            if selected
+        ]
+        nd = selected_types.count(b"d")
+        ns = selected_types.count(b"s")
 
         self._string_chunk = np.empty((ns, nrows), dtype=object)
         self._byte_chunk = np.zeros((nd, 8 * nrows), dtype=np.uint8)
@@ -667,7 +784,53 @@ class SAS7BDATReader(SASReader):
 
         return rslt
 
-    def _read_next_page(self):
+    def _read_next_page(self) -> bool:
+        if self._page_executor is None:
+            return self._read_page()
+
+        # Keep up to num_threads pages ahead of the page whose rows are
+        # converted, their rows are decompressed on the pool in the meantime.
+        while len(self._pending_pages) <= self._num_threads:
+            if self._read_page():
+                break
+            self._pending_pages.append(self._submit_page())
+        if not self._pending_pages:
+            return True
+
+        (
+            self._cached_page,
+            self._current_page_type,
+            self._current_page_block_count,
+            self._current_page_subheaders_count,
+            self._current_page_data_subheader_pointers,
+            future,
+        ) = self._pending_pages.popleft()
+        self._current_page_decompressed = None if future is None else future.result()
+        return False
+
+    def _submit_page(self) -> tuple:
+        assert self._page_executor is not None
+        pointers = self._current_page_data_subheader_pointers
+        future: Future | None = None
+        if self._current_page_type in const.page_meta_types and pointers:
+            future = self._page_executor.submit(
+                decompress_page,
+                self._cached_page,
+                np.array(pointers, dtype=np.int64).reshape(-1, 2),
+                self.row_length,
+                self.compression,
+            )
+        return (
+            self._cached_page,
+            self._current_page_type,
+            self._current_page_block_count,
+            self._current_page_subheaders_count,
+            pointers,
+            future,
+        )
+
+    def _read_page(self) -> bool:
+        self._current_page_decompressed = None
         self._current_page_data_subheader_pointers = []
         self._cached_page = self._path_or_buf.read(self._page_length)
         if len(self._cached_page) <= 0:
@@ -688,7 +851,7 @@ class SAS7BDATReader(SASReader):
             const.page_data_type,
             const.page_mix_type,
         ]:
-            return self._read_next_page()
+            return self._read_page()
 
         return False
 
@@ -700,6 +863,8 @@ class SAS7BDATReader(SASReader):
 
         js, jb = 0, 0
         for j in range(self.column_count):
+            if not self._column_selected[j]:
+                continue
             name = self.column_names[j]
 
             if self._column_types[j] == b"d":
@@ -720,7 +885,12 @@ class SAS7BDATReader(SASReader):
                 self.close()
                 raise ValueError(f"unknown column type {self._column_types[j]!r}")
 
-        df = DataFrame(rslt, columns=self.column_names, index=ix, copy=False)
+        columns = [
+            name
+            for name, selected in zip(self.column_names, self._column_selected)
+            if selected
+        ]
+        df = DataFrame(rslt, columns=columns, index=ix, copy=False)
         return df
 
     def _decode_string(self, b):
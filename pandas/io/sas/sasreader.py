@@ -8,7 +8,10 @@ from abc import (
     ABC,
     abstractmethod,
 )
-from collections.abc import Iterator
+from collections.abc import (
+    Callable,
+    Iterator,
+)
 from typing import (
     TYPE_CHECKING,
     overload,
@@ -21,7 +24,10 @@ from pandas.core.shared_docs import _shared_docs
 from pandas.io.common import stringify_path
 
 if TYPE_CHECKING:
-    from collections.abc import Hashable
+    from collections.abc import (
+        Hashable,
+        Sequence,
+    )
     from types import TracebackType
 
     from pandas._typing import (
@@ -67,6 +73,8 @@ def read_sas(
     chunksize: int = ...,
     iterator: bool = ...,
     compression: CompressionOptions = ...,
+    usecols: Sequence[Hashable] | Callable[[Hashable], bool] | None = ...,
+    num_threads: int | None = ...,
 ) -> SASReader: ...
 
 
@@ -80,6 +88,8 @@ def read_sas(
     chunksize: None = ...,
     iterator: bool = ...,
     compression: CompressionOptions = ...,
+    usecols: Sequence[Hashable] | Callable[[Hashable], bool] | None = ...,
+    num_threads: int | None = ...,
 ) -> DataFrame | SASReader: ...
 
 
@@ -93,6 +103,8 @@ def read_sas(
     chunksize: int | None = None,
     iterator: bool = False,
     compression: CompressionOptions = "infer",
+    usecols: Sequence[Hashable] | Callable[[Hashable], bool] | None = None,
+    num_threads: int | None = None,
 ) -> DataFrame | SASReader:
     """
     Read SAS files stored as either XPORT or SAS7BDAT format files.
@@ -117,6 +129,20 @@ def read_sas(
     iterator : bool, defaults to False
         If True, returns an iterator for reading the file incrementally.
     {decompression_options}
+    usecols : list-like or callable, optional
+        Subset of the columns of a SAS7BDAT file to read, given as column names
+        or as a callable evaluated against the column names, returning True for
+        the columns to read. The values of the other columns are not decoded.
+        Not supported for XPORT files.
+
+        .. versionadded:: 3.0.0
+    num_threads : int, optional
+        Number of threads used to decompress the pages of a compressed SAS7BDAT
+        file. The next pages are decompressed on the threads, without holding
+        the GIL, while the rows of the current page are converted. Has no effect
+        on uncompressed files and is not supported for XPORT files.
+
+        .. versionadded:: 3.0.0
 
     Returns
     -------
@@ -158,6 +184,12 @@ def read_sas(
     if format.lower() == "xport":
         from pandas.io.sas.sas_xport import XportReader
 
+        if usecols is not None or num_threads is not None:
+            raise ValueError(
+                "The 'usecols' and 'num_threads' options are only supported "
+                "for SAS7BDAT files"
+            )
+
         reader = XportReader(
             filepath_or_buffer,
             index=index,
@@ -174,6 +206,8 @@ def read_sas(
             encoding=encoding,
             chunksize=chunksize,
             compression=compression,
+            usecols=usecols,
+            num_threads=num_threads,
         )
     else:
         raise ValueError("unknown SAS format")
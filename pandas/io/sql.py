@@ -11,6 +11,7 @@ from abc import (
 )
 from contextlib import (
     ExitStack,
+    closing,
     contextmanager,
 )
 from datetime import (
@@ -44,6 +45,7 @@ from pandas.util._validators import check_dtype_backend
 
 from pandas.core.dtypes.common import (
     is_dict_like,
+    is_integer,
     is_list_like,
 )
 from pandas.core.dtypes.dtypes import (
@@ -57,13 +59,19 @@ from pandas.core.api import (
     DataFrame,
     Series,
 )
-from pandas.core.arrays import ArrowExtensionArray
+from pandas.core.arrays import (
+    ArrowExtensionArray,
+    IntegerArray,
+)
 from pandas.core.base import PandasObject
 import pandas.core.common as com
 from pandas.core.common import maybe_make_list
+from pandas.core.construction import array as pd_array
 from pandas.core.internals.construction import convert_object_array
 from pandas.core.tools.datetimes import to_datetime
 
+from pandas.io.common import prefetch_iter
+
 if TYPE_CHECKING:
     from collections.abc import (
         Callable,
@@ -79,6 +87,7 @@ if TYPE_CHECKING:
     )
 
     from pandas._typing import (
+        ArrayLike,
         DtypeArg,
         DtypeBackend,
         IndexLabel,
@@ -150,6 +159,47 @@ def _parse_date_columns(data_frame: DataFrame, parse_dates) -> DataFrame:
     return data_frame
 
 
+def _convert_int_column(
+    values: np.ndarray, dtype_backend: DtypeBackend | Literal["numpy"]
+) -> ArrayLike | None:
+    """
+    Convert a column of Python ints, possibly with None, without inference.
+
+    Checking the types of the values is several times faster than inferring
+    the dtype of integers, the result is the same. Returns None for other
+    columns.
+    """
+    # cheap check that stops at the first value that is not an integer
+    if not lib.is_integer_array(values, skipna=True):
+        return None
+    types = set(map(type, values))
+    if types == {int}:
+        mask = None
+    elif types == {int, type(None)}:
+        mask = isna(values)
+    else:
+        # numpy scalars keep their own dtype
+        return None
+
+    try:
+        if mask is None:
+            ints = values.astype(np.int64)
+        else:
+            ints = np.where(mask, 0, values).astype(np.int64)
+    except OverflowError:
+        return None
+
+    if mask is None:
+        if dtype_backend != "numpy":
+            return pd_array(ints, copy=False)
+        return ints
+    if dtype_backend != "numpy":
+        return IntegerArray(ints, mask)
+    result = ints.astype(np.float64)
+    result[mask] = np.nan
+    return result
+
+
 def _convert_arrays_to_dataframe(
     data,
     columns,
@@ -158,12 +208,19 @@ def _convert_arrays_to_dataframe(
 ) -> DataFrame:
     content = lib.to_object_array_tuples(data)
     idx_len = content.shape[0]
-    arrays = convert_object_array(
-        list(content.T),
+    arrays: list[ArrayLike | None] = [
+        _convert_int_column(values, dtype_backend) for values in content.T
+    ]
+    # the remaining columns are inferred
+    untyped = [i for i, arr in enumerate(arrays) if arr is None]
+    inferred = convert_object_array(
+        [content[:, i] for i in untyped],
         dtype=None,
         coerce_float=coerce_float,
         dtype_backend=dtype_backend,
     )
+    for i, arr in zip(untyped, inferred):
+        arrays[i] = arr
     if dtype_backend == "pyarrow":
         pa = import_optional_dependency("pyarrow")
 
@@ -228,6 +285,33 @@ def _wrap_result_adbc(
     return df
 
 
+def _validate_prefetch(prefetch: int, chunksize: int | None) -> None:
+    if not is_integer(prefetch) or prefetch < 0:
+        raise ValueError("'prefetch' must be an integer >=0")
+    if prefetch and chunksize is None:
+        raise ValueError("'prefetch' can only be passed together with 'chunksize'")
+
+
+def _fetch_chunks(result, chunksize: int, prefetch: int = 0) -> Iterator:
+    """
+    Yield the batches of ``result.fetchmany(chunksize)`` until it is exhausted.
+
+    With ``prefetch``, the batches are fetched in a background thread, at most
+    ``prefetch`` of them ahead of the consumer.
+    """
+
+    def fetch() -> Iterator:
+        while True:
+            data = result.fetchmany(chunksize)
+            if not data:
+                return
+            yield data
+
+    if prefetch:
+        return prefetch_iter(fetch(), prefetch)
+    return fetch()
+
+
 # -----------------------------------------------------------------------------
 # -- Read and write to DataFrames
 
@@ -243,6 +327,7 @@ def read_sql_table(
     columns: list[str] | None = ...,
     chunksize: None = ...,
     dtype_backend: DtypeBackend | lib.NoDefault = ...,
+    prefetch: int = ...,
 ) -> DataFrame: ...
 
 
@@ -257,6 +342,7 @@ def read_sql_table(
     columns: list[str] | None = ...,
     chunksize: int = ...,
     dtype_backend: DtypeBackend | lib.NoDefault = ...,
+    prefetch: int = ...,
 ) -> Iterator[DataFrame]: ...
 
 
@@ -270,6 +356,7 @@ def read_sql_table(
     columns: list[str] | None = None,
     chunksize: int | None = None,
     dtype_backend: DtypeBackend | lib.NoDefault = lib.no_default,
+    prefetch: int = 0,
 ) -> DataFrame | Iterator[DataFrame]:
     """
     Read SQL database table into a DataFrame.
@@ -317,6 +404,14 @@ def read_sql_table(
           :class:`ArrowDtype` :class:`DataFrame`
 
         .. versionadded:: 2.0
+    prefetch : int, default 0
+        Number of chunks fetched ahead from the database in a background
+        thread, while the current chunk is processed. Can only be passed
+        together with ``chunksize``. The connection must not be used otherwise
+        until the iterator is exhausted or closed, and a sqlite3 connection
+        has to be created with ``check_same_thread=False``.
+
+        .. versionadded:: 3.0.0
 
     Returns
     -------
@@ -342,6 +437,7 @@ def read_sql_table(
     if dtype_backend is lib.no_default:
         dtype_backend = "numpy"  # type: ignore[assignment]
     assert dtype_backend is not lib.no_default
+    _validate_prefetch(prefetch, chunksize)
 
     with pandasSQL_builder(con, schema=schema, need_transaction=True) as pandas_sql:
         if not pandas_sql.has_table(table_name):
@@ -355,6 +451,7 @@ def read_sql_table(
             columns=columns,
             chunksize=chunksize,
             dtype_backend=dtype_backend,
+            prefetch=prefetch,
         )
 
     if table is not None:
@@ -374,6 +471,7 @@ def read_sql_query(
     chunksize: None = ...,
     dtype: DtypeArg | None = ...,
     dtype_backend: DtypeBackend | lib.NoDefault = ...,
+    prefetch: int = ...,
 ) -> DataFrame: ...
 
 
@@ -388,6 +486,7 @@ def read_sql_query(
     chunksize: int = ...,
     dtype: DtypeArg | None = ...,
     dtype_backend: DtypeBackend | lib.NoDefault = ...,
+    prefetch: int = ...,
 ) -> Iterator[DataFrame]: ...
 
 
@@ -401,6 +500,7 @@ def read_sql_query(
     chunksize: int | None = None,
     dtype: DtypeArg | None = None,
     dtype_backend: DtypeBackend | lib.NoDefault = lib.no_default,
+    prefetch: int = 0,
 ) -> DataFrame | Iterator[DataFrame]:
     """
     Read SQL query into a DataFrame.
@@ -455,6 +555,14 @@ def read_sql_query(
           :class:`ArrowDtype` :class:`DataFrame`
 
         .. versionadded:: 2.0
+    prefetch : int, default 0
+        Number of chunks fetched ahead from the database in a background
+        thread, while the current chunk is processed. Can only be passed
+        together with ``chunksize``. The connection must not be used otherwise
+        until the iterator is exhausted or closed, and a sqlite3 connection
+        has to be created with ``check_same_thread=False``.
+
+        .. versionadded:: 3.0.0
 
     Returns
     -------
@@ -485,6 +593,7 @@ def read_sql_query(
     if dtype_backend is lib.no_default:
         dtype_backend = "numpy"  # type: ignore[assignment]
     assert dtype_backend is not lib.no_default
+    _validate_prefetch(prefetch, chunksize)
 
     with pandasSQL_builder(con) as pandas_sql:
         return pandas_sql.read_query(
@@ -496,6 +605,7 @@ def read_sql_query(
             chunksize=chunksize,
             dtype=dtype,
             dtype_backend=dtype_backend,
+            prefetch=prefetch,
         )
 
 
@@ -511,6 +621,7 @@ def read_sql(
     chunksize: None = ...,
     dtype_backend: DtypeBackend | lib.NoDefault = ...,
     dtype: DtypeArg | None = None,
+    prefetch: int = ...,
 ) -> DataFrame: ...
 
 
@@ -526,6 +637,7 @@ def read_sql(
     chunksize: int = ...,
     dtype_backend: DtypeBackend | lib.NoDefault = ...,
     dtype: DtypeArg | None = None,
+    prefetch: int = ...,
 ) -> Iterator[DataFrame]: ...
 
 
@@ -540,6 +652,7 @@ def read_sql(
     chunksize: int | None = None,
     dtype_backend: DtypeBackend | lib.NoDefault = lib.no_default,
     dtype: DtypeArg | None = None,
+    prefetch: int = 0,
 ) -> DataFrame | Iterator[DataFrame]:
     """
     Read SQL query or database table into a DataFrame.
@@ -605,6 +718,14 @@ def read_sql(
         The argument is ignored if a table is passed instead of a query.
 
         .. versionadded:: 2.0.0
+    prefetch : int, default 0
+        Number of chunks fetched ahead from the database in a background
+        thread, while the current chunk is processed. Can only be passed
+        together with ``chunksize``. The connection must not be used otherwise
+        until the iterator is exhausted or closed, and a sqlite3 connection
+        has to be created with ``check_same_thread=False``.
+
+        .. versionadded:: 3.0.0
 
     Returns
     -------
@@ -688,6 +809,7 @@ def read_sql(
     if dtype_backend is lib.no_default:
         dtype_backend = "numpy"  # type: ignore[assignment]
     assert dtype_backend is not lib.no_default
+    _validate_prefetch(prefetch, chunksize)
 
     with pandasSQL_builder(con) as pandas_sql:
         if isinstance(pandas_sql, SQLiteDatabase):
@@ -700,6 +822,7 @@ def read_sql(
                 chunksize=chunksize,
                 dtype_backend=dtype_backend,
                 dtype=dtype,
+                prefetch=prefetch,
             )
 
         try:
@@ -717,6 +840,7 @@ def read_sql(
                 columns=columns,
                 chunksize=chunksize,
                 dtype_backend=dtype_backend,
+                prefetch=prefetch,
             )
         else:
             return pandas_sql.read_query(
@@ -728,6 +852,7 @@ def read_sql(
                 chunksize=chunksize,
                 dtype_backend=dtype_backend,
                 dtype=dtype,
+                prefetch=prefetch,
             )
 
 
@@ -918,6 +1043,9 @@ class SQLTable(PandasObject):
 
     # TODO: support for multiIndex
 
+    # number of rows converted to driver values at once when inserting
+    _insert_blocksize = 100_000
+
     def __init__(
         self,
         name: str,
@@ -1015,7 +1143,8 @@ class SQLTable(PandasObject):
         result = conn.execute(stmt)
         return result.rowcount
 
-    def insert_data(self) -> tuple[list[str], list[np.ndarray]]:
+    def _insert_frame(self) -> DataFrame:
+        """Return the frame to insert, with the index as columns if written."""
         if self.index is not None:
             temp = self.frame.copy(deep=False)
             temp.index.names = self.index
@@ -1025,45 +1154,59 @@ class SQLTable(PandasObject):
                 raise ValueError(f"duplicate name in index/columns: {err}") from err
         else:
             temp = self.frame
+        return temp
 
-        column_names = list(map(str, temp.columns))
-        ncols = len(column_names)
-        # this just pre-allocates the list: None's will be replaced with ndarrays
-        # error: List item 0 has incompatible type "None"; expected "ndarray"
-        data_list: list[np.ndarray] = [None] * ncols  # type: ignore[list-item]
-
-        for i, (_, ser) in enumerate(temp.items()):
-            if ser.dtype.kind == "M":
-                if isinstance(ser._values, ArrowExtensionArray):
-                    import pyarrow as pa
-
-                    if pa.types.is_date(ser.dtype.pyarrow_dtype):
-                        # GH#53854 to_pydatetime not supported for pyarrow date dtypes
-                        d = ser._values.to_numpy(dtype=object)
-                    else:
-                        d = ser.dt.to_pydatetime()._values
+    def _insert_column(self, ser: Series) -> np.ndarray | list:
+        """Convert a column to the values passed to the driver."""
+        if ser.dtype.kind == "M":
+            if isinstance(ser._values, ArrowExtensionArray):
+                import pyarrow as pa
+
+                if pa.types.is_date(ser.dtype.pyarrow_dtype):
+                    # GH#53854 to_pydatetime not supported for pyarrow date dtypes
+                    d = ser._values.to_numpy(dtype=object)
                 else:
-                    d = ser._values.to_pydatetime()
-            elif ser.dtype.kind == "m":
-                vals = ser._values
-                if isinstance(vals, ArrowExtensionArray):
-                    vals = vals.to_numpy(dtype=np.dtype("m8[ns]"))
-                # store as integers, see GH#6921, GH#7076
-                d = vals.view("i8").astype(object)
+                    d = ser.dt.to_pydatetime()._values
             else:
-                d = ser._values.astype(object)
+                d = ser._values.to_pydatetime()
+        elif ser.dtype.kind == "m":
+            vals = ser._values
+            if isinstance(vals, ArrowExtensionArray):
+                vals = vals.to_numpy(dtype=np.dtype("m8[ns]"))
+            # store as integers, see GH#6921, GH#7076
+            d = vals.view("i8").astype(object)
+        else:
+            d = ser._values.astype(object)
 
-            assert isinstance(d, np.ndarray), type(d)
+        assert isinstance(d, np.ndarray), type(d)
 
-            if ser._can_hold_na:
-                # Note: this will miss timedeltas since they are converted to int
-                mask = isna(d)
-                d[mask] = None
+        if ser._can_hold_na:
+            # Note: this will miss timedeltas since they are converted to int
+            mask = isna(d)
+            d[mask] = None
 
-            data_list[i] = d
+        return d
 
+    def insert_data(self) -> tuple[list[str], list[np.ndarray | list]]:
+        temp = self._insert_frame()
+        column_names = list(map(str, temp.columns))
+        data_list = [self._insert_column(ser) for _, ser in temp.items()]
         return column_names, data_list
 
+    def _iter_insert_rows(
+        self, frame: DataFrame, start: int, stop: int
+    ) -> Iterator[tuple]:
+        """
+        Yield the rows ``start:stop`` of ``frame`` as tuples of driver values.
+
+        The columns are converted in blocks of ``_insert_blocksize`` rows, so
+        that only the Python objects of one block exist at a time.
+        """
+        blocksize = self._insert_blocksize
+        for block_start in range(start, stop, blocksize):
+            block = frame.iloc[block_start : min(block_start + blocksize, stop)]
+            yield from zip(*(self._insert_column(ser) for _, ser in block.items()))
+
     def insert(
         self,
         chunksize: int | None = None,
@@ -1079,7 +1222,8 @@ class SQLTable(PandasObject):
         else:
             raise ValueError(f"Invalid parameter `method`: {method}")
 
-        keys, data_list = self.insert_data()
+        temp = self._insert_frame()
+        keys = list(map(str, temp.columns))
 
         nrows = len(self.frame)
 
@@ -1100,7 +1244,7 @@ class SQLTable(PandasObject):
                 if start_i >= end_i:
                     break
 
-                chunk_iter = zip(*(arr[start_i:end_i] for arr in data_list))
+                chunk_iter = self._iter_insert_rows(temp, start_i, end_i)
                 num_inserted = exec_insert(conn, keys, chunk_iter)
                 # GH 46891
                 if num_inserted is not None:
@@ -1119,19 +1263,15 @@ class SQLTable(PandasObject):
         coerce_float: bool = True,
         parse_dates=None,
         dtype_backend: DtypeBackend | Literal["numpy"] = "numpy",
+        prefetch: int = 0,
     ) -> Generator[DataFrame, None, None]:
         """Return generator through chunked result set."""
         has_read_data = False
         with exit_stack:
-            while True:
-                data = result.fetchmany(chunksize)
-                if not data:
-                    if not has_read_data:
-                        yield DataFrame.from_records(
-                            [], columns=columns, coerce_float=coerce_float
-                        )
-                    break
-
+            batches = exit_stack.enter_context(
+                closing(_fetch_chunks(result, chunksize, prefetch))
+            )
+            for data in batches:
                 has_read_data = True
                 self.frame = _convert_arrays_to_dataframe(
                     data, columns, coerce_float, dtype_backend
@@ -1146,6 +1286,11 @@ class SQLTable(PandasObject):
 
                 yield self.frame
 
+            if not has_read_data:
+                yield DataFrame.from_records(
+                    [], columns=columns, coerce_float=coerce_float
+                )
+
     def read(
         self,
         exit_stack: ExitStack,
@@ -1154,6 +1299,7 @@ class SQLTable(PandasObject):
         columns=None,
         chunksize: int | None = None,
         dtype_backend: DtypeBackend | Literal["numpy"] = "numpy",
+        prefetch: int = 0,
     ) -> DataFrame | Iterator[DataFrame]:
         from sqlalchemy import select
 
@@ -1177,6 +1323,7 @@ class SQLTable(PandasObject):
                 coerce_float=coerce_float,
                 parse_dates=parse_dates,
                 dtype_backend=dtype_backend,
+                prefetch=prefetch,
             )
         else:
             data = result.fetchall()
@@ -1446,6 +1593,7 @@ class PandasSQL(PandasObject, ABC):
         schema: str | None = None,
         chunksize: int | None = None,
         dtype_backend: DtypeBackend | Literal["numpy"] = "numpy",
+        prefetch: int = 0,
     ) -> DataFrame | Iterator[DataFrame]:
         raise NotImplementedError
 
@@ -1460,6 +1608,7 @@ class PandasSQL(PandasObject, ABC):
         chunksize: int | None = None,
         dtype: DtypeArg | None = None,
         dtype_backend: DtypeBackend | Literal["numpy"] = "numpy",
+        prefetch: int = 0,
     ) -> DataFrame | Iterator[DataFrame]:
         pass
 
@@ -1654,6 +1803,7 @@ class SQLDatabase(PandasSQL):
         schema: str | None = None,
         chunksize: int | None = None,
         dtype_backend: DtypeBackend | Literal["numpy"] = "numpy",
+        prefetch: int = 0,
     ) -> DataFrame | Iterator[DataFrame]:
         """
         Read SQL database table into a DataFrame.
@@ -1697,6 +1847,9 @@ class SQLDatabase(PandasSQL):
               :class:`ArrowDtype` :class:`DataFrame`
 
             .. versionadded:: 2.0
+        prefetch : int, default 0
+            Number of chunks fetched ahead in a background thread, only used
+            together with ``chunksize``.
 
         Returns
         -------
@@ -1719,6 +1872,7 @@ class SQLDatabase(PandasSQL):
             columns=columns,
             chunksize=chunksize,
             dtype_backend=dtype_backend,
+            prefetch=prefetch,
         )
 
     @staticmethod
@@ -1732,25 +1886,15 @@ class SQLDatabase(PandasSQL):
         parse_dates=None,
         dtype: DtypeArg | None = None,
         dtype_backend: DtypeBackend | Literal["numpy"] = "numpy",
+        prefetch: int = 0,
     ) -> Generator[DataFrame, None, None]:
         """Return generator through chunked result set"""
         has_read_data = False
         with exit_stack:
-            while True:
-                data = result.fetchmany(chunksize)
-                if not data:
-                    if not has_read_data:
-                        yield _wrap_result(
-                            [],
-                            columns,
-                            index_col=index_col,
-                            coerce_float=coerce_float,
-                            parse_dates=parse_dates,
-                            dtype=dtype,
-                            dtype_backend=dtype_backend,
-                        )
-                    break
-
+            batches = exit_stack.enter_context(
+                closing(_fetch_chunks(result, chunksize, prefetch))
+            )
+            for data in batches:
                 has_read_data = True
                 yield _wrap_result(
                     data,
@@ -1762,6 +1906,17 @@ class SQLDatabase(PandasSQL):
                     dtype_backend=dtype_backend,
                 )
 
+            if not has_read_data:
+                yield _wrap_result(
+                    [],
+                    columns,
+                    index_col=index_col,
+                    coerce_float=coerce_float,
+                    parse_dates=parse_dates,
+                    dtype=dtype,
+                    dtype_backend=dtype_backend,
+                )
+
     def read_query(
         self,
         sql: str,
@@ -1772,6 +1927,7 @@ class SQLDatabase(PandasSQL):
         chunksize: int | None = None,
         dtype: DtypeArg | None = None,
         dtype_backend: DtypeBackend | Literal["numpy"] = "numpy",
+        prefetch: int = 0,
     ) -> DataFrame | Iterator[DataFrame]:
         """
         Read SQL query into a DataFrame.
@@ -1808,6 +1964,9 @@ class SQLDatabase(PandasSQL):
             {'a': np.float64, 'b': np.int32, 'c': 'Int64'}
 
             .. versionadded:: 1.3.0
+        prefetch : int, default 0
+            Number of chunks fetched ahead in a background thread, only used
+            together with ``chunksize``.
 
         Returns
         -------
@@ -1834,6 +1993,7 @@ class SQLDatabase(PandasSQL):
                 parse_dates=parse_dates,
                 dtype=dtype,
                 dtype_backend=dtype_backend,
+                prefetch=prefetch,
             )
         else:
             data = result.fetchall()
@@ -2125,6 +2285,7 @@ class ADBCDatabase(PandasSQL):
         schema: str | None = None,
         chunksize: int | None = None,
         dtype_backend: DtypeBackend | Literal["numpy"] = "numpy",
+        prefetch: int = 0,
     ) -> DataFrame | Iterator[DataFrame]:
         """
         Read SQL database table into a DataFrame.
@@ -2229,6 +2390,7 @@ class ADBCDatabase(PandasSQL):
         chunksize: int | None = None,
         dtype: DtypeArg | None = None,
         dtype_backend: DtypeBackend | Literal["numpy"] = "numpy",
+        prefetch: int = 0,
     ) -> DataFrame | Iterator[DataFrame]:
         """
         Read SQL query into a DataFrame.
@@ -2337,7 +2499,8 @@ class ADBCDatabase(PandasSQL):
             supports this). If specified, this overwrites the default
             schema of the SQLDatabase object.
         chunksize : int, default None
-            Raises NotImplementedError
+            Number of rows converted to Arrow at a time, the chunks are
+            streamed to the driver in one ingestion.
         dtype : single type or dict of column name to SQL type, default None
             Raises NotImplementedError
         method : {None', 'multi', callable}, default None
@@ -2349,8 +2512,8 @@ class ADBCDatabase(PandasSQL):
             raise NotImplementedError(
                 "'index_label' is not implemented for ADBC drivers"
             )
-        if chunksize:
-            raise NotImplementedError("'chunksize' is not implemented for ADBC drivers")
+        if chunksize == 0:
+            raise ValueError("chunksize argument should be non-zero")
         if dtype:
             raise NotImplementedError("'dtype' is not implemented for ADBC drivers")
         if method:
@@ -2382,13 +2545,28 @@ class ADBCDatabase(PandasSQL):
         import pyarrow as pa
 
         try:
-            tbl = pa.Table.from_pandas(frame, preserve_index=index)
+            if chunksize is None:
+                data = pa.Table.from_pandas(frame, preserve_index=index)
+            else:
+                # convert one chunk at a time, with the types of the whole frame
+                arrow_schema = pa.Schema.from_pandas(frame, preserve_index=index)
+                data = pa.RecordBatchReader.from_batches(
+                    arrow_schema,
+                    (
+                        pa.RecordBatch.from_pandas(
+                            frame.iloc[i : i + chunksize],
+                            schema=arrow_schema,
+                            preserve_index=index,
+                        )
+                        for i in range(0, len(frame), chunksize)
+                    ),
+                )
         except pa.ArrowNotImplementedError as exc:
             raise ValueError("datatypes not supported") from exc
 
         with self.con.cursor() as cur:
             total_inserted = cur.adbc_ingest(
-                table_name=name, data=tbl, mode=mode, db_schema_name=schema
+                table_name=name, data=data, mode=mode, db_schema_name=schema
             )
 
         self.con.commit()
@@ -2462,6 +2640,31 @@ def _get_valid_sqlite_name(name: object) -> str:
     return '"' + uname.replace('"', '""') + '"'
 
 
+def _sqlite_datetime_strings(values: np.ndarray) -> np.ndarray | None:
+    """
+    Format datetime64 values as the sqlite3 adapter formats datetime objects.
+
+    Returns None if a value is outside of the range of ``datetime.datetime``.
+    """
+    mask = np.isnat(values)
+    days = values[~mask].astype("M8[D]")
+    if len(days) and (
+        days.min() < np.datetime64("0001-01-01")
+        or days.max() > np.datetime64("9999-12-31")
+    ):
+        return None
+
+    values = values.astype("M8[us]")
+    # "YYYY-MM-DDTHH:MM:SS.ffffff", with the years of datetime.datetime
+    strings = np.datetime_as_string(values, unit="us").astype("U26")
+    strings.view("U1").reshape(-1, 26)[:, 10] = " "
+    # datetime.isoformat omits the fraction of whole seconds
+    whole = values.view("i8") % 1_000_000 == 0
+    result = np.where(whole, strings.astype("U19"), strings).astype(object)
+    result[mask] = None
+    return result
+
+
 class SQLiteTable(SQLTable):
     """
     Patch the SQLTable for fallback support.
@@ -2529,9 +2732,27 @@ class SQLiteTable(SQLTable):
         )
         return insert_statement
 
+    def _insert_column(self, ser: Series) -> np.ndarray | list:
+        # pass the values of numpy columns as the native types sqlite3 binds
+        # without adapters, with missing values as None like the base class
+        dtype = ser.dtype
+        if isinstance(dtype, np.dtype):
+            if dtype.kind in "iub":
+                return ser._values.tolist()
+            elif dtype.kind == "f":
+                values = ser._values.tolist()
+                for i in np.flatnonzero(np.isnan(ser._values)):
+                    values[i] = None
+                return values
+            elif dtype.kind == "M":
+                strings = _sqlite_datetime_strings(ser.to_numpy())
+                if strings is not None:
+                    return strings
+        return super()._insert_column(ser)
+
     def _execute_insert(self, conn, keys, data_iter) -> int:
-        data_list = list(data_iter)
-        conn.executemany(self.insert_statement(num_rows=1), data_list)
+        # the rows are consumed as they are converted
+        conn.executemany(self.insert_statement(num_rows=1), data_iter)
         return conn.rowcount
 
     def _execute_insert_multi(self, conn, keys, data_iter) -> int:
@@ -2682,34 +2903,34 @@ class SQLiteDatabase(PandasSQL):
         parse_dates=None,
         dtype: DtypeArg | None = None,
         dtype_backend: DtypeBackend | Literal["numpy"] = "numpy",
+        prefetch: int = 0,
     ) -> Generator[DataFrame, None, None]:
         """Return generator through chunked result set"""
         has_read_data = False
-        while True:
-            data = cursor.fetchmany(chunksize)
-            if type(data) == tuple:
-                data = list(data)
-            if not data:
-                cursor.close()
-                if not has_read_data:
-                    result = DataFrame.from_records(
-                        [], columns=columns, coerce_float=coerce_float
-                    )
-                    if dtype:
-                        result = result.astype(dtype)
-                    yield result
-                break
+        with closing(_fetch_chunks(cursor, chunksize, prefetch)) as batches:
+            for data in batches:
+                if type(data) == tuple:
+                    data = list(data)
 
-            has_read_data = True
-            yield _wrap_result(
-                data,
-                columns,
-                index_col=index_col,
-                coerce_float=coerce_float,
-                parse_dates=parse_dates,
-                dtype=dtype,
-                dtype_backend=dtype_backend,
+                has_read_data = True
+                yield _wrap_result(
+                    data,
+                    columns,
+                    index_col=index_col,
+                    coerce_float=coerce_float,
+                    parse_dates=parse_dates,
+                    dtype=dtype,
+                    dtype_backend=dtype_backend,
+                )
+
+        cursor.close()
+        if not has_read_data:
+            result = DataFrame.from_records(
+                [], columns=columns, coerce_float=coerce_float
             )
+            if dtype:
+                result = result.astype(dtype)
+            yield result
 
     def read_query(
         self,
@@ -2721,6 +2942,7 @@ class SQLiteDatabase(PandasSQL):
         chunksize: int | None = None,
         dtype: DtypeArg | None = None,
         dtype_backend: DtypeBackend | Literal["numpy"] = "numpy",
+        prefetch: int = 0,
     ) -> DataFrame | Iterator[DataFrame]:
         cursor = self.execute(sql, params)
         columns = [col_desc[0] for col_desc in cursor.description]
@@ -2735,6 +2957,7 @@ class SQLiteDatabase(PandasSQL):
                 parse_dates=parse_dates,
                 dtype=dtype,
                 dtype_backend=dtype_backend,
+                prefetch=prefetch,
             )
         else:
             data = self._fetchall_as_list(cursor)
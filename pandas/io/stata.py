@@ -17,7 +17,10 @@ from datetime import (
     datetime,
     timedelta,
 )
-from io import BytesIO
+from io import (
+    BytesIO,
+    FileIO,
+)
 import os
 import struct
 import sys
@@ -63,6 +66,7 @@ from pandas import (
     isna,
     to_datetime,
 )
+import pandas.core.algorithms as algos
 from pandas.core.frame import DataFrame
 from pandas.core.indexes.base import Index
 from pandas.core.indexes.range import RangeIndex
@@ -1139,6 +1143,7 @@ class StataReader(StataParser, abc.Iterator):
         self._value_labels_read = False
         self._dtype: np.dtype | None = None
         self._lines_read = 0
+        self._memory_map = False
 
         self._native_byteorder = _set_endianness(sys.byteorder)
 
@@ -1171,6 +1176,9 @@ class StataReader(StataParser, abc.Iterator):
             # If the handle is directly seekable, use it without an extra copy.
             self._path_or_buf = handles.handle
             self._close_file = handles.close
+            # Local, uncompressed files are memory-mapped to read the data.
+            raw = getattr(handles.handle, "raw", handles.handle)
+            self._memory_map = isinstance(raw, FileIO)
         else:
             # Copy to memory, and ensure no encoding.
             with handles:
@@ -1513,6 +1521,21 @@ class StataReader(StataParser, abc.Iterator):
 
         return self._dtype
 
+    def _decode_strings(self, values: np.ndarray) -> np.ndarray:
+        """
+        Decode a column of fixed-width strings to an object array.
+
+        ASCII values that end at their first null byte decode identically in
+        all encodings and are converted without a Python-level loop.
+        """
+        values = np.ascontiguousarray(values)
+        raw = values.view(np.uint8).reshape(len(values), values.dtype.itemsize)
+        if raw.max(initial=0) < 128 and not (
+            (raw[:, :-1] == 0) & (raw[:, 1:] != 0)
+        ).any():
+            return values.astype(str).astype(object)
+        return np.array([self._decode(s) for s in values], dtype=object)
+
     def _decode(self, s: bytes) -> str:
         # have bytes not strings, so must decode
         s = s.partition(b"\0")[0]
@@ -1732,11 +1755,22 @@ the string values returned are correct."""
                 self._read_value_labels()
             raise StopIteration
         offset = self._lines_read * dtype.itemsize
-        self._path_or_buf.seek(self._data_location + offset)
         read_lines = min(nrows, self._nobs - self._lines_read)
-        raw_data = np.frombuffer(
-            self._path_or_buf.read(read_len), dtype=dtype, count=read_lines
-        )
+        if self._memory_map:
+            raw_data = np.asarray(
+                np.memmap(
+                    self._path_or_buf,
+                    dtype=dtype,
+                    mode="r",
+                    offset=self._data_location + offset,
+                    shape=(read_lines,),
+                )
+            )
+        else:
+            self._path_or_buf.seek(self._data_location + offset)
+            raw_data = np.frombuffer(
+                self._path_or_buf.read(read_len), dtype=dtype, count=read_lines
+            )
 
         self._lines_read += read_lines
 
@@ -1747,11 +1781,23 @@ the string values returned are correct."""
         if convert_categoricals:
             self._read_value_labels()
 
-        if len(raw_data) == 0:
-            data = DataFrame(columns=self._varlist)
-        else:
-            data = DataFrame.from_records(raw_data)
-            data.columns = Index(self._varlist)
+        # Select the columns before converting the raw data
+        data = DataFrame(columns=self._varlist)
+        if columns is not None:
+            data = self._do_select_columns(data, columns)
+
+        if len(raw_data) > 0:
+            fields = raw_data.dtype.names
+            arrays = {}
+            for i, col in enumerate(data.columns):
+                values = raw_data[fields[self._varlist.index(col)]]
+                # Decode strings from their fixed-width values
+                if values.dtype.kind == "S":
+                    values = self._decode_strings(values)
+                arrays[i] = values
+            data = DataFrame(
+                arrays, index=RangeIndex(len(raw_data)), copy=True
+            ).set_axis(data.columns, axis=1)
 
         # If index is not specified, use actual row number rather than
         # restarting at 0 for each chunk.
@@ -1760,14 +1806,6 @@ the string values returned are correct."""
                 self._lines_read - read_lines, self._lines_read
             )  # set attr instead of set_index to avoid copy
 
-        if columns is not None:
-            data = self._do_select_columns(data, columns)
-
-        # Decode strings
-        for col, typ in zip(data, self._typlist):
-            if isinstance(typ, int):
-                data[col] = data[col].apply(self._decode)
-
         data = self._insert_strls(data)
 
         # Convert columns (if needed) to match input type
@@ -1885,8 +1923,11 @@ the string values returned are correct."""
         for i, typ in enumerate(self._typlist):
             if typ != "Q":
                 continue
+            # Look up each distinct key once
+            codes, uniques = algos.factorize(data.iloc[:, i]._values)
             # Wrap v_o in a string to allow uint64 values as keys on 32bit OS
-            data.isetitem(i, [self.GSO[str(k)] for k in data.iloc[:, i]])
+            strls = np.array([self.GSO[str(k)] for k in uniques], dtype=object)
+            data.isetitem(i, strls[codes])
         return data
 
     def _do_select_columns(self, data: DataFrame, columns: Sequence[str]) -> DataFrame:
@@ -5,10 +5,12 @@
 from __future__ import annotations
 
 import io
+from itertools import islice
 from os import PathLike
 from typing import (
     TYPE_CHECKING,
     Any,
+    overload,
 )
 
 from pandas._libs import lib
@@ -22,6 +24,7 @@ from pandas.util._validators import check_dtype_backend
 
 from pandas.core.dtypes.common import is_list_like
 
+from pandas.core.indexes.api import RangeIndex
 from pandas.core.shared_docs import _shared_docs
 
 from pandas.io.common import (
@@ -32,10 +35,12 @@ from pandas.io.common import (
     stringify_path,
 )
 from pandas.io.parsers import TextParser
+from pandas.io.parsers.readers import validate_integer
 
 if TYPE_CHECKING:
     from collections.abc import (
         Callable,
+        Iterator,
         Sequence,
     )
     from xml.etree.ElementTree import Element
@@ -187,6 +192,15 @@ class _XMLFrameParser:
 
         raise AbstractMethodError(self)
 
+    def parse_data_chunks(
+        self, chunksize: int
+    ) -> Iterator[list[dict[str, str | None]]]:
+        """
+        Parse xml data in chunks of ``chunksize`` rows with ``iterparse``.
+        """
+
+        raise AbstractMethodError(self)
+
     def _parse_nodes(self, elems: list[Any]) -> list[dict[str, str | None]]:
         """
         Parse xml nodes.
@@ -296,9 +310,65 @@ class _XMLFrameParser:
         will have optional keys filled with None values.
         """
 
-        dicts: list[dict[str, str | None]] = []
-        row: dict[str, str | None] | None = None
+        dicts = list(self._iterparse_rows(iterparse, self._validate_iterparse()))
+
+        if dicts == []:
+            raise ParserError("No result from selected items in iterparse.")
+
+        keys = list(dict.fromkeys([k for d in dicts for k in d.keys()]))
+        dicts = [{k: d[k] if k in d.keys() else None for k in keys} for d in dicts]
+
+        if self.names:
+            dicts = [dict(zip(self.names, d.values())) for d in dicts]
+
+        return dicts
+
+    def _iterparse_chunks(
+        self, iterparse: Callable, chunksize: int
+    ) -> Iterator[list[dict[str, str | None]]]:
+        """
+        Iterparse xml nodes, a chunk of ``chunksize`` rows at a time.
+
+        The rows are parsed as in ``_iterparse_nodes``, but only one chunk of
+        them is held in memory. Each chunk has the keys found in all the rows
+        parsed so far, so keys first found in later rows are missing from the
+        earlier chunks.
+
+        Raises
+        ------
+        TypeError
+            * If ``iterparse`` is not a dict or its dict value is not list-like.
+        ParserError
+            * If ``path_or_buffer`` is not a physical file on disk or file-like object.
+            * If no data is returned from selected items in ``iterparse``.
+        """
+        rows = self._iterparse_rows(iterparse, self._validate_iterparse())
+
+        def chunks() -> Iterator[list[dict[str, str | None]]]:
+            keys: dict[str, None] = {}
+            found = False
+            while dicts := list(islice(rows, chunksize)):
+                found = True
+                for d in dicts:
+                    keys.update(dict.fromkeys(d))
+                dicts = [{k: d.get(k) for k in keys} for d in dicts]
+
+                if self.names:
+                    dicts = [dict(zip(self.names, d.values())) for d in dicts]
+
+                yield dicts
+
+            if not found:
+                raise ParserError("No result from selected items in iterparse.")
 
+        return chunks()
+
+    def _validate_iterparse(self) -> str:
+        """
+        Validate ``iterparse`` and ``path_or_buffer`` for iterparsing.
+
+        Returns the name of the repeating element.
+        """
         if not isinstance(self.iterparse, dict):
             raise TypeError(
                 f"{type(self.iterparse).__name__} is not a valid type for iterparse"
@@ -326,6 +396,17 @@ class _XMLFrameParser:
                 "local disk and not as compressed files or online sources."
             )
 
+        return row_node
+
+    def _iterparse_rows(
+        self, iterparse: Callable, row_node: str
+    ) -> Iterator[dict[str, str | None]]:
+        """
+        Yield the values of each repeating element, as they are iterparsed.
+        """
+        row: dict[str, str | None] | None = None
+        assert self.iterparse is not None
+
         iterparse_repeats = len(self.iterparse[row_node]) != len(
             set(self.iterparse[row_node])
         )
@@ -357,7 +438,7 @@ class _XMLFrameParser:
 
             if event == "end":
                 if curr_elem == row_node and row is not None:
-                    dicts.append(row)
+                    yield row
                     row = None
 
                 elem.clear()
@@ -367,17 +448,6 @@ class _XMLFrameParser:
                     ):
                         del elem.getparent()[0]
 
-        if dicts == []:
-            raise ParserError("No result from selected items in iterparse.")
-
-        keys = list(dict.fromkeys([k for d in dicts for k in d.keys()]))
-        dicts = [{k: d[k] if k in d.keys() else None for k in keys} for d in dicts]
-
-        if self.names:
-            dicts = [dict(zip(self.names, d.values())) for d in dicts]
-
-        return dicts
-
     def _validate_path(self) -> list[Any]:
         """
         Validate ``xpath``.
@@ -449,6 +519,20 @@ class _EtreeFrameParser(_XMLFrameParser):
 
         return xml_dicts
 
+    def parse_data_chunks(
+        self, chunksize: int
+    ) -> Iterator[list[dict[str, str | None]]]:
+        from xml.etree.ElementTree import iterparse
+
+        if self.stylesheet is not None:
+            raise ValueError(
+                "To use stylesheet, you need lxml installed and selected as parser."
+            )
+
+        self._validate_names()
+
+        return self._iterparse_chunks(iterparse, chunksize)
+
     def _validate_path(self) -> list[Any]:
         """
         Notes
@@ -568,6 +652,15 @@ class _LxmlFrameParser(_XMLFrameParser):
 
         return xml_dicts
 
+    def parse_data_chunks(
+        self, chunksize: int
+    ) -> Iterator[list[dict[str, str | None]]]:
+        from lxml.etree import iterparse
+
+        self._validate_names()
+
+        return self._iterparse_chunks(iterparse, chunksize)
+
     def _validate_path(self) -> list[Any]:
         msg = (
             "xpath does not return any nodes or attributes. "
@@ -734,6 +827,21 @@ def _data_to_frame(data, **kwargs) -> DataFrame:
         ) from err
 
 
+def _data_chunks_to_frames(chunks, **kwargs) -> Iterator[DataFrame]:
+    """
+    Convert chunks of parsed data to Data Frames.
+
+    The index of each Data Frame continues from the previous one.
+    """
+
+    nrows = 0
+    for data in chunks:
+        df = _data_to_frame(data, **kwargs)
+        df.index = RangeIndex(nrows, nrows + len(df))
+        nrows += len(df)
+        yield df
+
+
 def _parse(
     path_or_buffer: FilePath | ReadBuffer[bytes] | ReadBuffer[str],
     xpath: str,
@@ -751,8 +859,9 @@ def _parse(
     compression: CompressionOptions,
     storage_options: StorageOptions,
     dtype_backend: DtypeBackend | lib.NoDefault = lib.no_default,
+    chunksize: int | None = None,
     **kwargs,
-) -> DataFrame:
+) -> DataFrame | Iterator[DataFrame]:
     """
     Call internal parsers.
 
@@ -813,6 +922,16 @@ def _parse(
     else:
         raise ValueError("Values for parser can only be lxml or etree.")
 
+    if chunksize is not None:
+        return _data_chunks_to_frames(
+            p.parse_data_chunks(chunksize),
+            dtype=dtype,
+            converters=converters,
+            parse_dates=parse_dates,
+            dtype_backend=dtype_backend,
+            **kwargs,
+        )
+
     data_dicts = p.parse_data()
 
     return _data_to_frame(
@@ -825,6 +944,52 @@ def _parse(
     )
 
 
+@overload
+def read_xml(
+    path_or_buffer: FilePath | ReadBuffer[bytes] | ReadBuffer[str],
+    *,
+    xpath: str = ...,
+    namespaces: dict[str, str] | None = ...,
+    elems_only: bool = ...,
+    attrs_only: bool = ...,
+    names: Sequence[str] | None = ...,
+    dtype: DtypeArg | None = ...,
+    converters: ConvertersArg | None = ...,
+    parse_dates: ParseDatesArg | None = ...,
+    encoding: str | None = ...,
+    parser: XMLParsers = ...,
+    stylesheet: FilePath | ReadBuffer[bytes] | ReadBuffer[str] | None = ...,
+    iterparse: dict[str, list[str]] | None = ...,
+    chunksize: None = ...,
+    compression: CompressionOptions = ...,
+    storage_options: StorageOptions | None = ...,
+    dtype_backend: DtypeBackend | lib.NoDefault = ...,
+) -> DataFrame: ...
+
+
+@overload
+def read_xml(
+    path_or_buffer: FilePath | ReadBuffer[bytes] | ReadBuffer[str],
+    *,
+    xpath: str = ...,
+    namespaces: dict[str, str] | None = ...,
+    elems_only: bool = ...,
+    attrs_only: bool = ...,
+    names: Sequence[str] | None = ...,
+    dtype: DtypeArg | None = ...,
+    converters: ConvertersArg | None = ...,
+    parse_dates: ParseDatesArg | None = ...,
+    encoding: str | None = ...,
+    parser: XMLParsers = ...,
+    stylesheet: FilePath | ReadBuffer[bytes] | ReadBuffer[str] | None = ...,
+    iterparse: dict[str, list[str]] | None = ...,
+    chunksize: int,
+    compression: CompressionOptions = ...,
+    storage_options: StorageOptions | None = ...,
+    dtype_backend: DtypeBackend | lib.NoDefault = ...,
+) -> Iterator[DataFrame]: ...
+
+
 @doc(
     storage_options=_shared_docs["storage_options"],
     decompression_options=_shared_docs["decompression_options"] % "path_or_buffer",
@@ -845,10 +1010,11 @@ def read_xml(
     parser: XMLParsers = "lxml",
     stylesheet: FilePath | ReadBuffer[bytes] | ReadBuffer[str] | None = None,
     iterparse: dict[str, list[str]] | None = None,
+    chunksize: int | None = None,
     compression: CompressionOptions = "infer",
     storage_options: StorageOptions | None = None,
     dtype_backend: DtypeBackend | lib.NoDefault = lib.no_default,
-) -> DataFrame:
+) -> DataFrame | Iterator[DataFrame]:
     r"""
     Read XML document into a :class:`~pandas.DataFrame` object.
 
@@ -953,6 +1119,17 @@ def read_xml(
 
         .. versionadded:: 1.5.0
 
+    chunksize : int, optional
+        Return an iterator of DataFrames of up to ``chunksize`` rows each,
+        parsed as the XML document is iterparsed, instead of a single
+        DataFrame. Only supported with ``iterparse``. The index of each
+        DataFrame continues from the previous one. Each DataFrame has the
+        columns found in the document up to its last row, so earlier
+        DataFrames lack the columns that first appear in later rows, also
+        with ``names``, and the dtypes are inferred per DataFrame.
+
+        .. versionadded:: 3.0.0
+
     {decompression_options}
 
         .. versionchanged:: 1.4.0 Zstandard support.
@@ -973,8 +1150,8 @@ def read_xml(
 
     Returns
     -------
-    df
-        A DataFrame.
+    DataFrame or Iterator[DataFrame]
+        A DataFrame, or an iterator of DataFrames if ``chunksize`` is given.
 
     See Also
     --------
@@ -1009,9 +1186,9 @@ def read_xml(
     temporarily redesign original document with XSLT (a special purpose
     language) for a flatter version for migration to a DataFrame.
 
-    This function will *always* return a single :class:`DataFrame` or raise
-    exceptions due to issues with XML document, ``xpath``, or other
-    parameters.
+    Unless ``chunksize`` is given, this function will *always* return a single
+    :class:`DataFrame` or raise exceptions due to issues with XML document,
+    ``xpath``, or other parameters.
 
     See the :ref:`read_xml documentation in the IO section of the docs
     <io.read_xml>` for more information in using this method to parse XML
@@ -1120,6 +1297,10 @@ def read_xml(
     """
     check_dtype_backend(dtype_backend)
 
+    chunksize = validate_integer("chunksize", chunksize, 1)
+    if chunksize is not None and iterparse is None:
+        raise ValueError("The 'chunksize' option is only supported with 'iterparse'")
+
     return _parse(
         path_or_buffer=path_or_buffer,
         xpath=xpath,
@@ -1137,4 +1318,5 @@ def read_xml(
         compression=compression,
         storage_options=storage_options,
         dtype_backend=dtype_backend,
+        chunksize=chunksize,
     )
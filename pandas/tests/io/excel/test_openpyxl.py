@@ -401,6 +401,65 @@ def test_read_empty_with_blank_row(datapath, ext, read_only):
     tm.assert_frame_equal(result, expected)
 
 
+@pytest.mark.parametrize("read_only", [True, False])
+@pytest.mark.parametrize("usecols", [[0, 1], ["a", "b"], "A:B"])
+@pytest.mark.parametrize(
+    "skiprows, expected",
+    [
+        (None, {"a": [1, 2, 3, 4], "b": ["x", np.nan, "y", np.nan]}),
+        ([2], {"a": [1, 3, 4], "b": ["x", "y", np.nan]}),
+    ],
+)
+def test_read_usecols_skiprows_unconverted_cells(
+    tmp_excel, read_only, usecols, skiprows, expected
+):
+    # Cells outside of usecols and skiprows are not converted, which must not
+    # change the trimming of the rows or the width of the sheet
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.append(["a", "b", "c"])
+    ws.append([1, "x", None])
+    ws.append([2, None, None, None, "wide"])
+    ws.append([3, "y", 7.5])
+    ws.append([4, None, "z"])
+    # a trailing row with only an empty formatted cell is dropped
+    ws.cell(row=6, column=3).number_format = "0.00"
+    wb.save(tmp_excel)
+
+    with contextlib.closing(
+        openpyxl.load_workbook(tmp_excel, read_only=read_only)
+    ) as wb:
+        result = pd.read_excel(
+            wb, engine="openpyxl", usecols=usecols, skiprows=skiprows
+        )
+    tm.assert_frame_equal(result, DataFrame(expected))
+
+
+def test_write_only(tmp_excel):
+    # frames are appended row by row to write-only worksheets
+    df = DataFrame(
+        {
+            "a": [1.5, np.nan, 3.0],
+            "b": ["x", "y", "z"],
+            "c": pd.date_range("2020-01-01", periods=3, unit="us"),
+        }
+    )
+    with ExcelWriter(
+        tmp_excel, engine="openpyxl", engine_kwargs={"write_only": True}
+    ) as writer:
+        df.to_excel(writer, sheet_name="first", freeze_panes=(1, 1))
+        df.to_excel(writer, sheet_name="second", startrow=2, startcol=1, index=False)
+
+    with contextlib.closing(openpyxl.load_workbook(tmp_excel)) as wb:
+        assert wb["first"].freeze_panes == "B2"
+        assert wb["second"]["B3"].value == "a"
+        assert wb["second"]["D4"].number_format == "YYYY-MM-DD HH:MM:SS"
+    result = pd.read_excel(tmp_excel, sheet_name="first", index_col=0)
+    tm.assert_frame_equal(result, df)
+    result = pd.read_excel(tmp_excel, sheet_name="second", header=2, usecols="B:D")
+    tm.assert_frame_equal(result, df)
+
+
 def test_book_and_sheets_consistent(tmp_excel):
     # GH#45687 - Ensure sheets is updated if user modifies book
     with ExcelWriter(tmp_excel, engine="openpyxl") as writer:
@@ -19,6 +19,7 @@ import pytest
 
 from pandas._config import using_string_dtype
 
+from pandas.compat import WASM
 import pandas.util._test_decorators as td
 
 import pandas as pd
@@ -794,6 +795,44 @@ class TestReaders:
         tm.assert_contains_all(expected_keys, dfs.keys())
         assert len(expected_keys) == len(dfs.keys())
 
+    @pytest.mark.skipif(WASM, reason="Can't start subprocesses in WASM")
+    @pytest.mark.parametrize("sheet_name", [None, [2, "Charlie", "Alpha"]])
+    def test_reading_sheets_num_workers(self, engine, read_ext, sheet_name):
+        # the sheets are read concurrently, each process with its own handle
+        basename = "test_multisheet"
+        expected = pd.read_excel(basename + read_ext, sheet_name=sheet_name)
+        result = pd.read_excel(
+            basename + read_ext, sheet_name=sheet_name, num_workers=2
+        )
+        assert list(result) == list(expected)
+        for key, df in expected.items():
+            tm.assert_frame_equal(result[key], df)
+
+        with open(basename + read_ext, "rb") as f:
+            with pd.ExcelFile(f, engine=engine) as excel:
+                result = excel.parse(sheet_name=sheet_name, num_workers=2)
+        assert list(result) == list(expected)
+        for key, df in expected.items():
+            tm.assert_frame_equal(result[key], df)
+
+    def test_reading_sheets_num_workers_unpicklable(self, read_ext):
+        # options that cannot be sent to the worker processes are read serially
+        basename = "test_multisheet"
+        converters = {"A": lambda x: f"<{x}>"}
+        expected = pd.read_excel(
+            basename + read_ext, sheet_name=None, converters=converters
+        )
+        result = pd.read_excel(
+            basename + read_ext, sheet_name=None, converters=converters, num_workers=2
+        )
+        for key, df in expected.items():
+            tm.assert_frame_equal(result[key], df)
+
+    @pytest.mark.parametrize("num_workers", [0, 1.5])
+    def test_read_excel_num_workers_invalid(self, read_ext, num_workers):
+        with pytest.raises(ValueError, match="'num_workers' must be an integer >=1"):
+            pd.read_excel("test1" + read_ext, sheet_name=None, num_workers=num_workers)
+
     def test_reading_all_sheets_with_blank(self, read_ext):
         # Test reading all sheet names by setting sheet_name to None,
         # In the case where some sheets are blank.
@@ -3,7 +3,12 @@ import uuid
 
 import pytest
 
-from pandas import DataFrame
+from pandas import (
+    DataFrame,
+    date_range,
+    read_excel,
+)
+import pandas._testing as tm
 
 from pandas.io.excel import ExcelWriter
 
@@ -84,3 +89,26 @@ def test_book_and_sheets_consistent(tmp_excel):
         assert writer.sheets == {}
         sheet = writer.book.add_worksheet("test_name")
         assert writer.sheets == {"test_name": sheet}
+
+
+def test_constant_memory(tmp_excel):
+    # frames are written row by row, which constant_memory requires
+    pytest.importorskip("openpyxl")
+    df = DataFrame(
+        {
+            "a": [1.5, None, 3.0],
+            "b": ["x", "y", "z"],
+            "c": date_range("2020-01-01", periods=3, unit="us"),
+        }
+    )
+    engine_kwargs = {"options": {"constant_memory": True}}
+    with ExcelWriter(
+        tmp_excel, engine="xlsxwriter", engine_kwargs=engine_kwargs
+    ) as writer:
+        df.to_excel(writer, sheet_name="first")
+        df.to_excel(writer, sheet_name="second", startrow=1, index=False)
+
+    result = read_excel(tmp_excel, sheet_name="first", index_col=0)
+    tm.assert_frame_equal(result, df)
+    result = read_excel(tmp_excel, sheet_name="second", header=1)
+    tm.assert_frame_equal(result, df)
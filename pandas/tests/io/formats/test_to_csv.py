@@ -744,3 +744,65 @@ def test_to_csv_iterative_compression_buffer(compression):
             pd.read_csv(buffer, compression=compression, index_col=0), df
         )
         assert not buffer.closed
+
+
+@pytest.mark.parametrize("index", [True, False])
+@pytest.mark.parametrize("chunksize", [1, 7, 100])
+def test_to_csv_num_threads(index, chunksize):
+    df = DataFrame(
+        {
+            "a": np.arange(50) / 3,
+            "b": [f"x,{i}" if i % 3 else None for i in range(50)],
+            "c": pd.date_range("2020-01-01", periods=50, freq="h"),
+        },
+        index=pd.MultiIndex.from_arrays([np.arange(50) % 4, np.arange(50)]),
+    )
+    expected = df.to_csv(index=index, chunksize=chunksize, date_format="%Y%m%d%H")
+    result = df.to_csv(
+        index=index, chunksize=chunksize, date_format="%Y%m%d%H", num_threads=3
+    )
+    assert result == expected
+
+
+def test_to_csv_num_threads_compression(compression, temp_file):
+    df = DataFrame(1.1 * np.arange(120).reshape((30, 4)), columns=list("ABCD"))
+    df.to_csv(temp_file, compression=compression, chunksize=4, num_threads=2)
+    tm.assert_frame_equal(
+        pd.read_csv(temp_file, compression=compression, index_col=0), df
+    )
+
+
+@pytest.mark.parametrize("num_threads", [0, 1.5, "2"])
+def test_to_csv_num_threads_invalid(num_threads):
+    with pytest.raises(ValueError, match="'num_threads' must be an integer >=1"):
+        DataFrame({"a": [1]}).to_csv(num_threads=num_threads)
+
+
+@pytest.mark.parametrize("dtype", ["float64", "float32"])
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"float_format": "%.3f"},
+        {"float_format": "%.4e", "decimal": ","},
+        {"float_format": "%.0g"},
+        {"float_format": "%08.3f"},
+        {"decimal": ","},
+        {},
+    ],
+)
+def test_to_csv_float_formatting_matches_python(dtype, kwargs):
+    values = np.array([0.1, -0.0, 1 / 3, np.nan, np.inf, -1.5e-12, 2.5e17])
+    df = DataFrame({"a": values.astype(dtype)})
+    float_format = kwargs.get("float_format")
+    decimal = kwargs.get("decimal", ".")
+    na_rep = "NA"
+    formatted = [
+        na_rep
+        if np.isnan(x)
+        else (float_format % x if float_format else str(x)).replace(".", decimal, 1)
+        for x in df["a"].to_numpy()
+    ]
+    # the decimal comma has to be quoted
+    rows = ["a"] + [f'"{x}"' if "," in x else x for x in formatted]
+    expected = tm.convert_rows_list_to_csv_str(rows)
+    assert df.to_csv(index=False, na_rep=na_rep, **kwargs) == expected
@@ -569,6 +569,27 @@ class TestJSONNormalize:
         result = json_normalize(series, "counties")
         tm.assert_index_equal(result.index, idx.repeat([3, 2]))
 
+    @pytest.mark.parametrize("max_level", [None, 0, 1])
+    @pytest.mark.parametrize("record_path", [None, "recs"])
+    def test_columns_match_nested_to_record(self, max_level, record_path):
+        recs = [
+            {"a": {"b": 1, "c": {"d": 1.5}}, "e": "x"},
+            {"f": None, "a": {"c": {"d": 2.5, "g": [1, 2]}}},
+            {"e": "y", "a": {"b": 3}, "h": True},
+            {},
+        ]
+        data = [{"recs": recs}] if record_path else recs
+
+        result = json_normalize(data, record_path=record_path, max_level=max_level)
+        expected = DataFrame(nested_to_record(recs, max_level=max_level))
+        tm.assert_frame_equal(result, expected)
+
+    def test_non_string_keys(self):
+        data = [{1: {2: "a"}, 3: 4.5}, {3: 5.5}]
+        result = json_normalize(data, max_level=1)
+        expected = DataFrame({3: [4.5, 5.5], "1.2": ["a", np.nan]})
+        tm.assert_frame_equal(result, expected)
+
 
 class TestNestedToRecord:
     def test_flat_stays_flat(self):
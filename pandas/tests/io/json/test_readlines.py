@@ -8,6 +8,7 @@ import pytest
 import pandas as pd
 from pandas import (
     DataFrame,
+    Series,
     read_json,
 )
 import pandas._testing as tm
@@ -39,6 +40,55 @@ def test_read_jsonl():
     tm.assert_frame_equal(result, expected)
 
 
+@pytest.mark.parametrize("batch_chars", [1, 60, 1 << 20])
+def test_read_jsonl_batches(monkeypatch, batch_chars):
+    # the result must not depend on how the lines are split into batches
+    monkeypatch.setattr("pandas.io.json._json._LINES_BATCH_CHARS", batch_chars)
+    lines = [
+        '{"a": 1, "b": true, "c": "x", "d": 9007199254740993}',
+        '{"a": 2, "b": false, "c": null, "d": null}',
+        '{"a": 2.5, "b": null, "e": {"n": 1}}',
+        '{"a": null, "b": true, "c": "z", "d": 1, "f": [1, 2]}',
+        "",
+        '{"a": 4, "c": 1.5, "d": -1}',
+    ]
+    data = "\n".join(lines)
+    result = read_json(StringIO(data), lines=True)
+    expected = read_json(
+        StringIO(f"[{','.join(line for line in lines if line)}]"), orient="records"
+    )
+    tm.assert_frame_equal(result, expected)
+    assert result["c"][1] is None
+    assert result["d"][0] == 9007199254740993
+
+
+def test_read_jsonl_batches_typed(monkeypatch):
+    monkeypatch.setattr("pandas.io.json._json._LINES_BATCH_CHARS", 1)
+    data = '{"a": 1, "b": true}\n{"a": 2, "b": false}\n{"a": 2.5, "c": "x"}\n'
+    result = read_json(StringIO(data), lines=True, dtype=False)
+    expected = DataFrame(
+        {
+            "a": [1.0, 2.0, 2.5],
+            "b": [True, False, np.nan],
+            "c": [np.nan, np.nan, "x"],
+        }
+    )
+    tm.assert_frame_equal(result, expected)
+
+
+def test_read_jsonl_batches_mixed_types():
+    # integers and nulls of the first batch are decoded as float64, they must
+    # be restored when a later batch holds strings
+    lines = ['{"a": 1}', '{"a": null}', '{"a": 2.0}'] * 14_000 + ['{"a": "x"}']
+    data = "\n".join(lines)
+    assert len(data) > pd.io.json._json._LINES_BATCH_CHARS
+
+    result = read_json(StringIO(data), lines=True)
+    expected = read_json(StringIO(f"[{','.join(lines)}]"), orient="records")
+    tm.assert_frame_equal(result, expected)
+    assert [type(value) for value in result["a"][:3]] == [int, type(None), float]
+
+
 def test_read_jsonl_engine_pyarrow(datapath, engine):
     result = read_json(
         datapath("io", "json", "data", "line_delimited.json"),
@@ -120,6 +170,69 @@ def test_to_jsonl_count_new_lines():
     assert actual_new_lines_count == expected_new_lines_count
 
 
+@pytest.mark.parametrize("chunksize", [1, 2, 10])
+def test_to_jsonl_chunksize(temp_file, chunksize):
+    obj = DataFrame({"a": [1, 2, 3], "b": ["x", "y\n", None]})
+    expected = obj.to_json(orient="records", lines=True)
+
+    result = obj.to_json(orient="records", lines=True, chunksize=chunksize)
+    assert result == expected
+
+    obj.to_json(temp_file, orient="records", lines=True, chunksize=chunksize)
+    assert temp_file.read_text() == expected
+
+    chunks = list(pd.io.json.iter_json_lines(obj, chunksize))
+    assert len(chunks) == -(-3 // chunksize)
+    assert b"".join(chunks) == expected.encode()
+
+
+@pytest.mark.parametrize("date_format", ["iso", "epoch"])
+def test_iter_json_lines_date_format(date_format):
+    df = DataFrame({"a": pd.date_range("2020-01-01", periods=3), "b": [1, 2, 3]})
+    with tm.assert_produces_warning(
+        FutureWarning if date_format == "epoch" else None, match="'epoch' date"
+    ):
+        expected = df.to_json(orient="records", lines=True, date_format=date_format)
+
+    result = b"".join(pd.io.json.iter_json_lines(df, 2, date_format=date_format))
+    assert result == expected.encode()
+
+
+def test_iter_json_lines_default_date_format():
+    # dates are written in iso format rather than the deprecated epoch default
+    df = DataFrame({"a": pd.date_range("2020-01-01", periods=3)})
+    expected = df.to_json(orient="records", lines=True, date_format="iso")
+    assert b"".join(pd.io.json.iter_json_lines(df, 2)) == expected.encode()
+
+
+def test_to_jsonl_chunksize_empty():
+    df = DataFrame(columns=["a"])
+    expected = df.to_json(orient="records", lines=True)
+    assert df.to_json(orient="records", lines=True, chunksize=2) == expected
+    assert b"".join(pd.io.json.iter_json_lines(df, 2)) == expected.encode()
+
+
+@pytest.mark.parametrize(
+    "kwargs, msg",
+    [
+        ({"chunksize": 0}, "'chunksize' must be an integer >=1"),
+        ({"lines": False}, "chunksize can only be passed if lines=True"),
+    ],
+)
+def test_to_jsonl_chunksize_invalid(kwargs, msg):
+    df = DataFrame({"a": [1]})
+    kwargs = {"orient": "records", "lines": True, "chunksize": 2, **kwargs}
+    with pytest.raises(ValueError, match=msg):
+        df.to_json(**kwargs)
+
+
+def test_to_jsonl_chunksize_series():
+    ser = Series([1, 2])
+    msg = "chunksize is only supported when writing a DataFrame"
+    with pytest.raises(NotImplementedError, match=msg):
+        ser.to_json(orient="records", lines=True, chunksize=1)
+
+
 @pytest.mark.parametrize("chunksize", [1, 1.0])
 def test_readjson_chunks(request, lines_json_df, chunksize, engine):
     # Basic test that read_json(chunks=True) gives the same result as
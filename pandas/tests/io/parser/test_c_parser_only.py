@@ -23,6 +23,7 @@ from pandas._config import using_string_dtype
 from pandas.compat import WASM
 from pandas.compat.numpy import np_version_gte1p24
 from pandas.errors import (
+    DtypeWarning,
     ParserError,
     ParserWarning,
 )
@@ -31,6 +32,7 @@ import pandas.util._test_decorators as td
 from pandas import (
     DataFrame,
     concat,
+    read_csv,
 )
 import pandas._testing as tm
 
@@ -564,6 +566,59 @@ def test_file_handles_mmap(c_parser_only, csv1):
             assert not m.closed
 
 
+@pytest.mark.skipif(WASM, reason="limited file system access on WASM")
+def test_mmap_tokenized_in_place(c_parser_only, temp_file):
+    # the mmap is read without copying, its position still advances
+    parser = c_parser_only
+    temp_file.write_bytes(b"skipped\n" + b"a,b\n" + b"1,x\n" * 100_000)
+
+    with open(temp_file, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            m.readline()
+            result = parser.read_csv(m)
+            assert m.tell() == len(m)
+    expected = DataFrame({"a": [1] * 100_000, "b": ["x"] * 100_000})
+    tm.assert_frame_equal(result, expected)
+
+
+@pytest.mark.skipif(WASM, reason="limited file system access on WASM")
+def test_memory_map_chunks_close(c_parser_only, temp_file):
+    # the reader releases the mapping before closing it
+    parser = c_parser_only
+    temp_file.write_bytes(b"a\n" + b"1\n" * 100_000)
+
+    with parser.read_csv(
+        temp_file, memory_map=True, encoding="utf-8", chunksize=30_000
+    ) as reader:
+        result = next(reader)
+    tm.assert_frame_equal(result, DataFrame({"a": [1] * 30_000}))
+
+    msg = "Usecols do not match columns"
+    with pytest.raises(ValueError, match=msg):
+        parser.read_csv(temp_file, memory_map=True, encoding="utf-8", usecols=["b"])
+
+
+@pytest.mark.skipif(WASM, reason="limited file system access on WASM")
+def test_mmap_close_while_reading_chunks(c_parser_only, temp_file):
+    # the tokenizer points into the mapping between chunks, closing it while
+    # the reader is open must not unmap the pages
+    parser = c_parser_only
+    temp_file.write_bytes(b"a\n" + b"".join(b"%d\n" % i for i in range(100_000)))
+
+    with open(temp_file, "rb") as f:
+        m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        reader = parser.read_csv(m, chunksize=1000)
+        next(reader)
+        with pytest.raises(BufferError, match="exported pointers exist"):
+            m.close()
+        result = next(reader)
+        tm.assert_frame_equal(
+            result, DataFrame({"a": range(1000, 2000)}, index=range(1000, 2000))
+        )
+        reader.close()
+        m.close()
+
+
 def test_file_binary_mode(c_parser_only):
     # see gh-23779
     parser = c_parser_only
@@ -644,3 +699,102 @@ def test_float_precision_options(c_parser_only):
 
     with pytest.raises(ValueError, match=msg):
         parser.read_csv(StringIO(s), float_precision="junk")
+
+
+@pytest.fixture
+def small_parallel_ranges(monkeypatch):
+    # split even tiny files into several byte ranges
+    monkeypatch.setattr("pandas.io.parsers.readers._PARALLEL_MIN_RANGE_SIZE", 16)
+
+
+@pytest.mark.usefixtures("small_parallel_ranges")
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"usecols": ["c", "a"]},
+        {"usecols": [1]},
+        {"nrows": 7},
+        {"skiprows": 2, "header": None},
+        {"index_col": "a"},
+        {"names": ["x", "y", "z"], "header": 0},
+        {"dtype": {"a": "float32", "c": "category"}},
+    ],
+)
+def test_num_threads_matches_serial(c_parser_only, temp_file, kwargs):
+    parser = c_parser_only
+    data = "a,b,c\n" + "".join(
+        f'{i},{i / 3},"x\n{i},""y"""\n' if i % 4 == 0 else f"{i},{i / 3},w{i % 3}\n"
+        for i in range(50)
+    )
+    temp_file.write_text(data)
+
+    expected = parser.read_csv(temp_file, **kwargs)
+    result = parser.read_csv(temp_file, num_threads=4, **kwargs)
+    tm.assert_frame_equal(result, expected)
+
+
+@pytest.mark.usefixtures("small_parallel_ranges")
+@pytest.mark.parametrize("skiprows", [3, 30])
+def test_num_threads_skiprows_past_first_range(c_parser_only, temp_file, skiprows):
+    # the skipped rows extend over several byte ranges
+    parser = c_parser_only
+    temp_file.write_text("".join(f"{i},{i * 2}\n" for i in range(50)))
+
+    expected = parser.read_csv(temp_file, skiprows=skiprows, header=None)
+    result = parser.read_csv(
+        temp_file, skiprows=skiprows, header=None, num_threads=4
+    )
+    tm.assert_frame_equal(result, expected)
+    assert result[0].tolist() == list(range(skiprows, 50))
+
+
+@pytest.mark.usefixtures("small_parallel_ranges")
+def test_num_threads_quote_within_field(c_parser_only, temp_file):
+    # a quote character within an unquoted field is data and must not be
+    # paired with the quotes of the multi-line fields that follow
+    parser = c_parser_only
+    data = 'a,b\n0,12" pipe\n' + "".join(
+        f'{i},"x\n{i}"\n' if i % 3 == 0 else f"{i},y{i}\n" for i in range(1, 50)
+    )
+    temp_file.write_text(data)
+
+    expected = parser.read_csv(temp_file)
+    result = parser.read_csv(temp_file, num_threads=4)
+    tm.assert_frame_equal(result, expected)
+    assert result["a"].tolist() == list(range(50))
+
+
+@pytest.mark.usefixtures("small_parallel_ranges")
+def test_num_threads_mixed_types(c_parser_only, temp_file):
+    parser = c_parser_only
+    temp_file.write_text("a\n" + "1\n" * 20 + "x\n" * 20)
+
+    result = parser.read_csv_check_warnings(
+        DtypeWarning, "have mixed types", temp_file, num_threads=2
+    )
+    assert result["a"].tolist() == [1] * 20 + ["x"] * 20
+
+    result = parser.read_csv(temp_file, num_threads=2, dtype={"a": str})
+    expected = parser.read_csv(temp_file, dtype={"a": str})
+    tm.assert_frame_equal(result, expected)
+
+
+def test_num_threads_invalid(c_parser_only):
+    parser = c_parser_only
+    data = "a\n1\n"
+
+    with pytest.raises(ValueError, match="'num_threads' must be an integer >=1"):
+        parser.read_csv(StringIO(data), num_threads=0)
+
+    msg = "The 'num_threads' option cannot be used together with 'chunksize'"
+    with pytest.raises(ValueError, match=msg):
+        parser.read_csv(StringIO(data), num_threads=2, chunksize=1)
+
+    msg = "The 'num_threads' option is only supported with the 'c' engine"
+    with pytest.raises(ValueError, match=msg):
+        read_csv(StringIO(data), num_threads=2, engine="python")
+
+    # buffers are read on a single thread
+    result = parser.read_csv(StringIO(data), num_threads=2)
+    tm.assert_frame_equal(result, DataFrame({"a": [1]}))
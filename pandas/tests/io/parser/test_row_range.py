@@ -0,0 +1,165 @@
+"""
+Tests reading a slice of rows with the ``row_range`` option of read_csv.
+"""
+
+from io import StringIO
+import os
+
+import pytest
+
+from pandas import (
+    DataFrame,
+    RangeIndex,
+    read_csv,
+)
+import pandas._testing as tm
+
+from pandas.io.parsers import build_row_index
+
+
+@pytest.fixture
+def csv_file(temp_file):
+    # quoted line terminators and blank lines must not shift the row numbers
+    data = "a,b,c\n" + "".join(
+        f'{i},"x\n{i}",{i / 2}\n' if i % 5 == 0 else f"{i},y{i},{i / 2}\n\n"
+        for i in range(100)
+    )
+    temp_file.write_text(data)
+    return temp_file
+
+
+@pytest.mark.parametrize("build_index", [True, False])
+@pytest.mark.parametrize("row_range", [(0, 3), (7, 42), (95, 100), (98, 120)])
+def test_row_range(csv_file, build_index, row_range):
+    if build_index:
+        sidecar = build_row_index(csv_file, stride=4)
+        assert sidecar == f"{csv_file}.rowindex"
+        assert os.path.exists(sidecar)
+
+    expected = read_csv(csv_file).iloc[slice(*row_range)]
+    result = read_csv(csv_file, row_range=row_range)
+    tm.assert_frame_equal(result, expected)
+
+
+def test_row_range_index_col_usecols(csv_file):
+    build_row_index(csv_file, stride=8)
+
+    expected = read_csv(csv_file, index_col="a", usecols=["a", "c"]).iloc[10:20]
+    result = read_csv(csv_file, row_range=(10, 20), index_col="a", usecols=["a", "c"])
+    tm.assert_frame_equal(result, expected)
+
+
+def test_row_range_no_header(temp_file):
+    temp_file.write_text("".join(f"{i},{i * 2}\n" for i in range(10)))
+
+    result = read_csv(temp_file, header=None, row_range=(4, 6))
+    expected = DataFrame({0: [4, 5], 1: [8, 10]}, index=RangeIndex(4, 6))
+    tm.assert_frame_equal(result, expected)
+
+
+def test_row_range_stale_index(csv_file):
+    build_row_index(csv_file, stride=4)
+    csv_file.write_text("a,b\n" + "".join(f"{i},{i}\n" for i in range(20)))
+    os.utime(csv_file, ns=(0, 0))
+
+    result = read_csv(csv_file, row_range=(15, 17))
+    expected = DataFrame({"a": [15, 16], "b": [15, 16]}, index=RangeIndex(15, 17))
+    tm.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    "kwargs, msg",
+    [
+        ({"row_range": (2, 1)}, "'row_range' must be a tuple of two integers"),
+        ({"row_range": [0, 1]}, "'row_range' must be a tuple of two integers"),
+        (
+            {"row_range": (0, 1), "engine": "python"},
+            "The 'row_range' option is only supported with the 'c' engine",
+        ),
+        (
+            {"row_range": (0, 1), "nrows": 1},
+            "The 'row_range' option cannot be used together with 'nrows'",
+        ),
+        (
+            {"row_range": (0, 1), "chunksize": 1},
+            "The 'row_range' option cannot be used together with 'chunksize'",
+        ),
+    ],
+)
+def test_row_range_invalid(csv_file, kwargs, msg):
+    with pytest.raises(ValueError, match=msg):
+        read_csv(csv_file, **kwargs)
+
+
+def test_row_range_buffer():
+    msg = "The 'row_range' option requires a local, uncompressed file"
+    with pytest.raises(ValueError, match=msg):
+        read_csv(StringIO("a\n1\n"), row_range=(0, 1))
+
+
+def test_row_range_whitespace_lines(temp_file):
+    # lines of whitespace only are skipped like empty lines
+    temp_file.write_bytes(
+        b"a,b\n"
+        + b"".join(f"{i},{i}\n".encode() for i in range(5))
+        + b" \t \r\n"
+        + b"".join(f"{i},{i}\n".encode() for i in range(5, 20))
+        + b"   "
+    )
+
+    expected = read_csv(temp_file).iloc[3:13]
+    result = read_csv(temp_file, row_range=(3, 13))
+    tm.assert_frame_equal(result, expected)
+    assert result["a"].tolist() == list(range(3, 13))
+
+
+def test_row_range_carriage_return(temp_file):
+    temp_file.write_bytes(
+        b"a,b\r" + b"".join(f"{i},{i}\r".encode() for i in range(9))
+    )
+
+    msg = "has records ending with a carriage return"
+    with pytest.raises(ValueError, match=msg):
+        read_csv(temp_file, row_range=(2, 5))
+    with pytest.raises(ValueError, match=msg):
+        build_row_index(temp_file)
+
+    # quoted carriage returns and \r\n line endings are supported
+    temp_file.write_bytes(
+        b'a,b\r\n0,"x\ry"\r\n'
+        + b"".join(f"{i},{i}\r\n".encode() for i in range(1, 9))
+    )
+    result = read_csv(temp_file, row_range=(2, 5))
+    expected = DataFrame({"a": [2, 3, 4], "b": [2, 3, 4]}, index=RangeIndex(2, 5))
+    tm.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("field", ['12" pipe', '"12"" pipe"', '""'])
+def test_row_range_quote_within_field(temp_file, field):
+    # quote characters within unquoted fields are data
+    temp_file.write_text(
+        f"a,b\n0,{field}\n" + "".join(f'{i},"x\n{i}"\n' for i in range(1, 10))
+    )
+
+    if field == '12" pipe':
+        with pytest.raises(ValueError, match="quote characters within unquoted"):
+            build_row_index(temp_file)
+    else:
+        build_row_index(temp_file)
+    expected = read_csv(temp_file).iloc[2:6]
+    result = read_csv(temp_file, row_range=(2, 6))
+    tm.assert_frame_equal(result, expected)
+    assert result["a"].tolist() == [2, 3, 4, 5]
+
+
+@pytest.mark.parametrize(
+    "kwargs, msg",
+    [
+        ({"escapechar": "\\"}, "not supported with 'escapechar'"),
+        ({"sep": " "}, "not supported with a space or tab delimiter"),
+        ({"sep": "\t"}, "not supported with a space or tab delimiter"),
+    ],
+)
+def test_row_range_unsupported_options(csv_file, kwargs, msg):
+    with pytest.raises(ValueError, match=msg):
+        read_csv(csv_file, row_range=(0, 1), **kwargs)
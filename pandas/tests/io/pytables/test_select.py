@@ -1,3 +1,6 @@
+import os
+import threading
+
 import numpy as np
 import pytest
 
@@ -620,6 +623,61 @@ def test_select_iterator_many_empty_frames(setup_path):
         assert len(results) == 0
 
 
+@pytest.mark.parametrize("prefetch", [1, 3])
+def test_select_iterator_prefetch(tmp_path, prefetch):
+    df = DataFrame(
+        {"A": np.arange(100), "B": np.arange(100) / 2},
+        index=date_range("2000-01-01", periods=100),
+    )
+    df2 = df.rename(columns={"A": "C", "B": "D"})
+    path = tmp_path / "prefetch.h5"
+    with HDFStore(path) as store:
+        store.append("df", df, data_columns=["A"])
+        store.append("df2", df2)
+
+        # the last chunk is empty
+        where = "A < 90"
+        expected = list(store.select("df", where=where, chunksize=30))
+        result = list(store.select("df", where=where, chunksize=30, prefetch=prefetch))
+        assert len(result) == len(expected) == 3
+        for left, right in zip(result, expected):
+            tm.assert_frame_equal(left, right)
+
+        result = store.select_as_multiple(
+            ["df", "df2"], where=where, chunksize=30, prefetch=prefetch
+        )
+        tm.assert_frame_equal(concat(result), concat([df, df2], axis=1).iloc[:90])
+
+        # stopping early does not leave a reading thread behind
+        threads = threading.active_count()
+        for chunk in store.select("df", chunksize=10, prefetch=prefetch):
+            break
+        assert threading.active_count() == threads
+        tm.assert_frame_equal(chunk, df.iloc[:10])
+
+    result = read_hdf(path, "df", chunksize=40, prefetch=prefetch)
+    tm.assert_frame_equal(concat(result), df)
+    assert not result.store.is_open
+
+
+def test_select_iterator_prefetch_invalid(tmp_path):
+    path = tmp_path / "prefetch.h5"
+    DataFrame({"A": [1, 2]}).to_hdf(path, key="df", format="table")
+
+    with HDFStore(path) as store:
+        with pytest.raises(ValueError, match="'prefetch' must be an integer >=0"):
+            store.select("df", chunksize=1, prefetch=-1)
+        msg = "'prefetch' can only be passed together with 'iterator' or 'chunksize'"
+        with pytest.raises(ValueError, match=msg):
+            store.select("df", prefetch=1)
+
+        # errors raised while reading are raised by the iterator
+        it = store.select("df", chunksize=1, prefetch=1)
+        it.func = lambda *args: 1 / 0
+        with pytest.raises(ZeroDivisionError, match="division by zero"):
+            list(it)
+
+
 def test_frame_select(setup_path, request):
     df = DataFrame(
         np.random.default_rng(2).standard_normal((10, 4)),
@@ -1065,3 +1123,167 @@ def test_select_large_integer(tmp_path):
     expected = df["y"][0]
 
     assert expected == result
+
+
+@pytest.mark.parametrize("max_workers", [None, 1, 3])
+def test_select_many(tmp_path, max_workers):
+    df = DataFrame(
+        {
+            "A": np.arange(20, dtype="int64"),
+            "B": np.arange(20) / 2,
+            "C": [f"s{i}" for i in range(20)],
+        },
+        index=date_range("2000-01-01", periods=20),
+    )
+    path = tmp_path / "select_many.h5"
+    with HDFStore(path) as store:
+        for i in range(5):
+            store.append(f"df{i}", df.assign(A=df["A"] + i), data_columns=["A"])
+        store.put("fixed", df.iloc[:3], format="fixed")
+        store.append("ser", df["B"])
+
+        keys = [f"df{i}" for i in range(5)] + ["fixed", "ser"]
+        result = store.select_many(keys, max_workers=max_workers)
+        assert list(result) == keys
+        for key in keys:
+            tm.assert_equal(result[key], store.select(key))
+
+        threshold = 10
+        result = store.select_many(
+            ["df0", "/df1"],
+            where="A > threshold",
+            columns=["A", "C"],
+            start=2,
+            max_workers=max_workers,
+        )
+        for key in ["df0", "/df1"]:
+            expected = store.select(
+                key, where="A > threshold", columns=["A", "C"], start=2
+            )
+            tm.assert_frame_equal(result[key], expected)
+
+        where = {"df0": "A < 3", "df2": ["A >= 5", "index < '2000-01-09'"]}
+        result = store.select_many(["df0", "df2", "df3"], where=where)
+        tm.assert_frame_equal(result["df0"], df.iloc[:3])
+        tm.assert_frame_equal(result["df2"], df.assign(A=df["A"] + 2).iloc[3:8])
+        tm.assert_frame_equal(result["df3"], df.assign(A=df["A"] + 3))
+
+
+def test_select_many_concurrent_select(tmp_path, monkeypatch):
+    # a select in another thread while select_many runs must not release the
+    # lock of select_many
+    from pandas.io import pytables
+
+    df = DataFrame({"A": np.arange(10)})
+    path = tmp_path / "select_many.h5"
+    with HDFStore(path) as store:
+        store.append("df", df)
+        store.append("other", df)
+
+        entered = threading.Event()
+        resume = threading.Event()
+        select = pytables.Selection.select
+
+        def blocking_select(self):
+            if threading.current_thread() is not threading.main_thread():
+                entered.set()
+                resume.wait(5)
+            return select(self)
+
+        released = []
+        _released = pytables._released
+
+        def spy(lock):
+            released.append((threading.current_thread(), lock))
+            return _released(lock)
+
+        monkeypatch.setattr(pytables.Selection, "select", blocking_select)
+        monkeypatch.setattr(pytables, "_released", spy)
+        thread = threading.Thread(target=store.select_many, args=(["df"],))
+        thread.start()
+        try:
+            assert entered.wait(5)
+            tm.assert_frame_equal(store.select("other"), df)
+        finally:
+            resume.set()
+            thread.join(5)
+
+        # only the worker of select_many released its lock
+        assert released[0] == (threading.main_thread(), None)
+        assert released[1][0] is not threading.main_thread()
+        assert released[1][1] is not None
+
+
+def test_select_many_invalid(tmp_path):
+    path = tmp_path / "select_many.h5"
+    with HDFStore(path) as store:
+        store.append("df", DataFrame({"A": [1, 2]}))
+
+        with pytest.raises(TypeError, match="keys must be a list-like of keys"):
+            store.select_many("df")
+        with pytest.raises(ValueError, match="'max_workers' must be an integer >=1"):
+            store.select_many(["df"], max_workers=0)
+        with pytest.raises(KeyError, match="No object named missing in the file"):
+            store.select_many(["df", "missing"])
+
+        # the store remains usable after a failed read
+        tm.assert_frame_equal(
+            store.select_many(["df"])["df"], DataFrame({"A": [1, 2]})
+        )
+
+
+def test_select_coordinate_cache(tmp_path):
+    df = DataFrame({"A": np.arange(10), "B": np.arange(10) / 2})
+    path = tmp_path / "coordinate_cache.h5"
+    with HDFStore(path) as store, pd.option_context("io.hdf.coordinate_cache_size", 2):
+        store.append("df", df, data_columns=["A"])
+        store.append("other", df, data_columns=["A"])
+
+        expected = df[df["A"] > 6]
+        for _ in range(2):
+            tm.assert_frame_equal(store.select("df", where="A > 6"), expected)
+        tm.assert_index_equal(
+            store.select_as_coordinates("df", where="A > 6", start=1), expected.index
+        )
+        assert len(store._coordinate_cache) == 2
+
+        # least recently used entries are evicted
+        store.select("other", where="A > 6")
+        assert len(store._coordinate_cache) == 2
+
+        # appending, removing and replacing invalidate the entries of the table
+        store.select("df", where="A > 6")
+        store.append("df", DataFrame({"A": [20], "B": [1.0]}, index=[10]))
+        assert all(entry[0] == "/other" for entry in store._coordinate_cache)
+        result = store.select("df", where="A > 6")
+        tm.assert_frame_equal(result, store.select("df").query("A > 6"))
+        assert len(result) == 4
+
+        store.remove("df", where="A == 20")
+        tm.assert_frame_equal(store.select("df", where="A > 6"), expected)
+
+        store.put("df", df.iloc[:8], format="table", data_columns=["A"])
+        tm.assert_frame_equal(store.select("df", where="A > 6"), df.iloc[7:8])
+
+        with pd.option_context("io.hdf.coordinate_cache_size", 0):
+            tm.assert_frame_equal(store.select("df", where="A > 6"), df.iloc[7:8])
+            assert len(store._coordinate_cache) == 0
+
+
+def test_select_coordinate_cache_external_write(tmp_path):
+    # rows rewritten outside of the store, without changing the number of rows
+    df = DataFrame({"A": np.arange(10), "B": np.arange(10) / 2})
+    path = tmp_path / "coordinate_cache.h5"
+    with HDFStore(path) as store, pd.option_context("io.hdf.coordinate_cache_size", 2):
+        store.append("df", df, data_columns=["A"])
+        store.flush()
+        tm.assert_frame_equal(store.select("df", where="A > 6"), df.iloc[7:])
+
+        table = store.get_storer("df").table
+        table.modify_column(0, 1, column=np.array([20]), colname="A")
+        store.flush()
+        mtime = os.stat(path).st_mtime_ns + 10**9
+        os.utime(path, ns=(mtime, mtime))
+
+        expected = df.iloc[[0, 7, 8, 9]].assign(A=[20, 7, 8, 9])
+        tm.assert_frame_equal(store.select("df", where="A > 6"), expected)
@@ -25,6 +25,13 @@ class TestSas:
             with pytest.raises(ValueError, match=msg):
                 read_sas(path)
 
+    @pytest.mark.parametrize("kwargs", [{"usecols": ["YEAR"]}, {"num_threads": 2}])
+    def test_sas_xport_sas7bdat_only_options(self, datapath, kwargs):
+        fname = datapath("io", "sas", "data", "paxraw_d_short.xpt")
+        msg = "only supported for SAS7BDAT files"
+        with pytest.raises(ValueError, match=msg):
+            read_sas(fname, **kwargs)
+
 
 def test_sas_archive(datapath):
     fname_uncompressed = datapath("io", "sas", "data", "airline.sas7bdat")
@@ -393,15 +393,16 @@ def test_meta2_page(datapath):
         ("test3.sas7bdat", 118170, 184, "Out of bounds"),
     ],
 )
+@pytest.mark.parametrize("num_threads", [None, 2])
 def test_rle_rdc_exceptions(
-    datapath, test_file, override_offset, override_value, expected_msg
+    datapath, test_file, override_offset, override_value, expected_msg, num_threads
 ):
     """Errors in RLE/RDC decompression should propagate."""
     with open(datapath("io", "sas", "data", test_file), "rb") as fd:
         data = bytearray(fd.read())
     data[override_offset] = override_value
     with pytest.raises(Exception, match=expected_msg):
-        pd.read_sas(io.BytesIO(data), format="sas7bdat")
+        pd.read_sas(io.BytesIO(data), format="sas7bdat", num_threads=num_threads)
 
 
 def test_0x40_control_byte(datapath):
@@ -418,3 +419,55 @@ def test_0x00_control_byte(datapath):
     fname = datapath("io", "sas", "data", "0x00controlbyte.sas7bdat.bz2")
     df = next(pd.read_sas(fname, chunksize=11_000))
     assert df.shape == (11_000, 20)
+
+
+@pytest.mark.parametrize("k", [1, 2, 3])
+@pytest.mark.parametrize(
+    "usecols, expected_columns",
+    [
+        (["Column5", "Column1", "Column4"], ["Column1", "Column4", "Column5"]),
+        (lambda name: name.endswith("2"), [f"Column{i}" for i in range(2, 93, 10)]),
+        ([], []),
+    ],
+)
+def test_usecols(dirpath, k, usecols, expected_columns):
+    fname = os.path.join(dirpath, f"test{k}.sas7bdat")
+    expected = pd.read_sas(fname, encoding="utf-8")[expected_columns]
+    result = pd.read_sas(fname, encoding="utf-8", usecols=usecols)
+    tm.assert_frame_equal(result, expected)
+
+    with pd.read_sas(fname, encoding="utf-8", usecols=usecols, chunksize=3) as rdr:
+        result = pd.concat(list(rdr))
+    tm.assert_frame_equal(result, expected)
+
+
+def test_usecols_invalid(dirpath):
+    fname = os.path.join(dirpath, "test1.sas7bdat")
+    msg = "columns expected but not found: \\['Column0'\\]"
+    with pytest.raises(ValueError, match=msg):
+        pd.read_sas(fname, usecols=["Column1", "Column0"])
+    msg = "'usecols' must either be list-like of column names or a callable"
+    with pytest.raises(ValueError, match=msg):
+        pd.read_sas(fname, usecols="Column1")
+
+
+@pytest.mark.parametrize(
+    "test_file", ["test2.sas7bdat", "test3.sas7bdat", "test_meta2_page.sas7bdat"]
+)
+@pytest.mark.parametrize("num_threads", [1, 3])
+def test_num_threads(datapath, test_file, num_threads):
+    fname = datapath("io", "sas", "data", test_file)
+    expected = pd.read_sas(fname)
+    result = pd.read_sas(fname, num_threads=num_threads)
+    tm.assert_frame_equal(result, expected)
+
+    with pd.read_sas(fname, num_threads=num_threads, chunksize=7) as rdr:
+        result = pd.concat(list(rdr))
+    tm.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("num_threads", [0, 1.5, "2"])
+def test_num_threads_invalid(datapath, num_threads):
+    fname = datapath("io", "sas", "data", "test2.sas7bdat")
+    with pytest.raises(ValueError, match="'num_threads' must be an integer >=1"):
+        pd.read_sas(fname, num_threads=num_threads)
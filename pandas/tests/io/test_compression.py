@@ -379,3 +379,45 @@ def test_tar_no_error_on_close():
     with io.BytesIO() as buffer:
         with icom._BytesTarFile(fileobj=buffer, mode="w"):
             pass
+
+
+@pytest.mark.parametrize("method", ["gzip", "bz2", "xz"])
+@pytest.mark.parametrize("threads", [1, 3])
+@pytest.mark.parametrize("writer", ["to_csv", "to_json"])
+def test_compression_threads(method, threads, writer, temp_file, monkeypatch):
+    # small blocks, so the output consists of many members/streams
+    monkeypatch.setattr(icom, "_COMPRESSION_BLOCKSIZE", 64)
+    df = pd.DataFrame({"a": np.arange(200) / 7, "b": [f"x{i}" for i in range(200)]})
+    kwargs = {"orient": "records", "lines": True} if writer == "to_json" else {}
+    compression = {"method": method, "threads": threads}
+    getattr(df, writer)(temp_file, compression=compression, **kwargs)
+
+    with icom.get_handle(
+        temp_file, "rb", compression=method, is_text=False
+    ) as handles:
+        content = handles.handle.read()
+    assert content == getattr(df, writer)(**kwargs).encode()
+
+
+def test_compression_threads_buffer_empty():
+    with io.BytesIO() as buffer:
+        pd.DataFrame().to_csv(
+            buffer, compression={"method": "gzip", "threads": 2}, index=False
+        )
+        assert not buffer.closed
+        assert gzip.decompress(buffer.getvalue()) == os.linesep.encode()
+
+
+@pytest.mark.parametrize("threads", [0, 1.5])
+def test_compression_threads_invalid(threads, temp_file):
+    with pytest.raises(ValueError, match="'threads' must be an integer >=1"):
+        pd.DataFrame({"a": [1]}).to_csv(
+            temp_file, compression={"method": "gzip", "threads": threads}
+        )
+
+
+def test_compression_threads_read(temp_file):
+    pd.DataFrame({"a": [1]}).to_csv(temp_file, compression="gzip")
+    msg = "The 'threads' compression option is only supported for writing"
+    with pytest.raises(ValueError, match=msg):
+        pd.read_csv(temp_file, compression={"method": "gzip", "threads": 2})
@@ -1016,6 +1016,241 @@ class TestParquetPyArrow(Base):
             result = read_parquet(path, pa, filters=[("a", "==", 0)])
         assert len(result) == 1
 
+    @pytest.mark.parametrize(
+        "where, mask",
+        [
+            (
+                "ts >= '2024-01-05' & region == 'EU'",
+                lambda df: (df["ts"] >= "2024-01-05") & (df["region"] == "EU"),
+            ),
+            ("a < 2 | a > 7", lambda df: (df["a"] < 2) | (df["a"] > 7)),
+            ("2 <= a < 5", lambda df: (df["a"] >= 2) & (df["a"] < 5)),
+            ("region in ['EU', 'APAC']", lambda df: df["region"].isin(["EU", "APAC"])),
+            ("a not in (1, 2)", lambda df: ~df["a"].isin([1, 2])),
+            ("not a > 3", lambda df: df["a"] <= 3),
+            ("b != 0.5", lambda df: df["b"] != 0.5),
+            ("~(b == 1.5)", lambda df: df["b"] != 1.5),
+            ("b not in [1.5]", lambda df: ~df["b"].isin([1.5])),
+            ("a > 5.5", lambda df: df["a"] > 5.5),
+            ("a == 5.5", lambda df: df["a"] == 5.5),
+            ("a != 5.5", lambda df: df["a"] != 5.5),
+        ],
+    )
+    @pytest.mark.parametrize("buffer", [True, False])
+    def test_read_where(self, pa, temp_file, where, mask, buffer):
+        df = pd.DataFrame(
+            {
+                "ts": pd.date_range("2024-01-01", periods=10),
+                "region": ["EU", "US", "APAC", "EU", "US"] * 2,
+                "a": range(10),
+                "b": [np.nan, 1.5] * 5,
+            }
+        )
+        df.to_parquet(temp_file, engine=pa, row_group_size=3)
+        path = BytesIO(temp_file.read_bytes()) if buffer else temp_file
+
+        result = read_parquet(path, pa, where=where)
+        expected = df[mask(df)].reset_index(drop=True)
+        tm.assert_frame_equal(result, expected)
+
+        result = read_parquet(temp_file, pa, where=where, columns=["b"])
+        tm.assert_frame_equal(result, expected[["b"]])
+
+    @pytest.mark.parametrize(
+        "where, rows",
+        [
+            ("a != 3", [0, 1, 3]),
+            ("a != 1", [1, 2, 3]),
+            ("~(a == 3)", [0, 1, 3]),
+            ("a < 300", [0, 2, 3]),
+            ("a > 1.5", [2, 3]),
+            ("a in [1, 2.5, 1000]", [0]),
+            ("b != 'x'", [1, 2]),
+            ("b not in ['x']", [1, 2]),
+            ("a == 1 | b == 'y'", [0, 2]),
+        ],
+    )
+    def test_read_where_missing_values(self, pa, temp_file, where, rows):
+        # literals are not truncated to the type of the column and missing
+        # values compare unequal to any value, as in DataFrame.query
+        df = pd.DataFrame(
+            {
+                "a": pd.array([1, None, 3, 4], dtype="Int8"),
+                "b": ["x", None, "y", "x"],
+            }
+        )
+        df.to_parquet(temp_file, engine=pa, row_group_size=2)
+
+        result = read_parquet(temp_file, pa, where=where)
+        expected = df.iloc[rows].reset_index(drop=True)
+        tm.assert_frame_equal(result, expected)
+
+    def test_read_where_skips_row_groups(self, pa, temp_file, monkeypatch):
+        import pyarrow.parquet
+
+        from pandas.io import parquet
+
+        df = pd.DataFrame({"a": range(10)})
+        df.to_parquet(temp_file, engine=pa, row_group_size=2)
+
+        row_groups = []
+        read_row_groups = pyarrow.parquet.ParquetFile.read_row_groups
+
+        def spy(self, groups, *args, **kwargs):
+            row_groups.append(groups)
+            return read_row_groups(self, groups, *args, **kwargs)
+
+        monkeypatch.setattr(pyarrow.parquet.ParquetFile, "read_row_groups", spy)
+        result = read_parquet(temp_file, pa, where="a == 5 | a > 8")
+        expected = pd.DataFrame({"a": [5, 9]})
+        tm.assert_frame_equal(result, expected)
+        assert row_groups == [[2, 4]]
+
+        # the cached footer is only used while the file is unchanged
+        metadata = parquet._METADATA_CACHE[str(temp_file)][2]
+        read_parquet(temp_file, pa, where="a > 0")
+        assert parquet._METADATA_CACHE[str(temp_file)][2] is metadata
+
+        pd.DataFrame({"a": range(3)}).to_parquet(temp_file, engine=pa)
+        result = read_parquet(temp_file, pa, where="a > 0")
+        tm.assert_frame_equal(result, pd.DataFrame({"a": [1, 2]}))
+        assert parquet._METADATA_CACHE[str(temp_file)][2] is not metadata
+
+    def test_read_where_partitioned(self, pa, tmp_path):
+        df = pd.DataFrame({"a": range(6), "part": list("xyzxyz")})
+        df.to_parquet(tmp_path, engine=pa, partition_cols=["part"])
+
+        result = read_parquet(tmp_path, pa, where="part == 'x' & a > 0")
+        assert result["a"].tolist() == [3]
+        assert result["part"].astype(str).tolist() == ["x"]
+
+    @pytest.mark.parametrize("row_group_size", [None, 3])
+    def test_parquet_writer(self, pa, temp_file, row_group_size):
+        import pyarrow.parquet
+
+        chunks = [
+            pd.DataFrame({"a": range(i, i + 5), "b": list("abcde")})
+            for i in range(0, 20, 5)
+        ]
+        with pd.io.parquet.ParquetWriter(
+            temp_file, row_group_size=row_group_size
+        ) as writer:
+            for chunk in chunks:
+                writer.write(chunk)
+
+        metadata = pyarrow.parquet.read_metadata(temp_file)
+        assert metadata.num_row_groups == (8 if row_group_size else 4)
+        result = read_parquet(temp_file, pa)
+        tm.assert_frame_equal(result, pd.concat(chunks, ignore_index=True))
+
+    def test_parquet_writer_index(self, pa):
+        chunks = [
+            pd.DataFrame({"b": [1.5, 2.5]}, index=pd.Index(["x", "y"], name="i")),
+            pd.DataFrame({"b": [3]}, index=pd.Index(["z"], name="i")),
+        ]
+        chunks[0].attrs = {"source": "test"}
+        buf = BytesIO()
+        with pd.io.parquet.ParquetWriter(buf) as writer:
+            for chunk in chunks:
+                writer.write(chunk)
+
+        result = read_parquet(BytesIO(buf.getvalue()), pa)
+        expected = pd.concat(chunks)
+        tm.assert_frame_equal(result, expected)
+        assert result.attrs == {"source": "test"}
+
+    def test_parquet_writer_invalid(self, pa, temp_file):
+        df = pd.DataFrame({"a": [1], "b": [2]})
+        writer = pd.io.parquet.ParquetWriter(temp_file)
+        writer.write(df)
+        msg = "The columns of the DataFrame differ from the columns of the first"
+        with pytest.raises(ValueError, match=msg):
+            writer.write(df[["b", "a"]])
+        writer.close()
+        with pytest.raises(ValueError, match="I/O operation on closed"):
+            writer.write(df)
+        tm.assert_frame_equal(read_parquet(temp_file, pa), df)
+
+    @pytest.mark.parametrize(
+        "where, msg",
+        [
+            ("a >", "Invalid where expression"),
+            ("a + 1 > 2", "Invalid where expression"),
+            ("a > b", "Invalid where expression"),
+            ("a in 1", "Invalid where expression"),
+            ("c > 1", "Column 'c' of the where expression not found"),
+        ],
+    )
+    def test_read_where_invalid(self, pa, temp_file, where, msg):
+        pd.DataFrame({"a": [1], "b": [2]}).to_parquet(temp_file, engine=pa)
+        with pytest.raises(ValueError, match=msg):
+            read_parquet(temp_file, pa, where=where)
+
+    @pytest.mark.parametrize("num_threads", [1, 3])
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{}, {"columns": ["a"]}, {"where": "a > 4"}, {"where": "a > 100"}],
+    )
+    def test_read_num_threads_partitioned(self, pa, tmp_path, num_threads, kwargs):
+        df = pd.DataFrame({"a": range(12), "b": 0.5, "part": list("xyz") * 4})
+        df.to_parquet(tmp_path, engine=pa, partition_cols=["part"])
+
+        expected = read_parquet(tmp_path, pa, **kwargs)
+        result = read_parquet(tmp_path, pa, num_threads=num_threads, **kwargs)
+        tm.assert_frame_equal(result, expected)
+
+    @pytest.mark.parametrize(
+        "index",
+        [
+            None,
+            pd.RangeIndex(100, 110, name="r"),
+            pd.Index(list("abcdefghij"), name="i"),
+        ],
+    )
+    def test_read_num_threads_row_groups(self, pa, temp_file, index):
+        df = pd.DataFrame(
+            {"a": range(10), "c": pd.Categorical(list("aabbccddee"))}, index=index
+        )
+        df.to_parquet(temp_file, engine=pa, row_group_size=3)
+
+        result = read_parquet(temp_file, pa, num_threads=2)
+        tm.assert_frame_equal(result, df)
+
+    def test_read_num_threads_missing_values(self, pa, temp_file):
+        # the row groups without missing values are converted to other dtypes
+        import pyarrow
+        import pyarrow.parquet
+
+        table = pyarrow.table(
+            {
+                "a": [1, None] + list(range(8)),
+                "b": [None] + [True] * 9,
+            }
+        )
+        pyarrow.parquet.write_table(table, temp_file, row_group_size=3)
+
+        expected = read_parquet(temp_file, pa)
+        result = read_parquet(temp_file, pa, num_threads=2)
+        tm.assert_frame_equal(result, expected)
+        assert result["a"].dtype == np.float64
+        assert result["b"].dtype == object
+
+    def test_read_iterator(self, pa, temp_file):
+        df = pd.DataFrame({"a": range(10)})
+        df.attrs = {"source": "test"}
+        df.to_parquet(temp_file, engine=pa, row_group_size=4)
+
+        chunks = list(read_parquet(temp_file, pa, iterator=True, num_threads=2))
+        assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+        assert all(chunk.attrs == {"source": "test"} for chunk in chunks)
+        tm.assert_frame_equal(pd.concat(chunks), df)
+
+    @pytest.mark.parametrize("num_threads", [0, 1.5])
+    def test_read_num_threads_invalid(self, pa, temp_file, num_threads):
+        pd.DataFrame({"a": [1]}).to_parquet(temp_file, engine=pa)
+        with pytest.raises(ValueError, match="'num_threads' must be an integer >=1"):
+            read_parquet(temp_file, pa, num_threads=num_threads)
+
     @pytest.mark.filterwarnings("ignore:make_block is deprecated:DeprecationWarning")
     def test_read_dtype_backend_pyarrow_config(self, pa, df_full):
         import pyarrow
@@ -1248,6 +1483,18 @@ class TestParquetFastParquet(Base):
             result = read_parquet(path, fp, filters=[("a", "==", 0)])
         assert len(result) == 1
 
+    def test_read_where_not_supported(self, fp, temp_file):
+        pd.DataFrame({"a": [1]}).to_parquet(temp_file, engine=fp)
+        msg = "where is not implemented for the fastparquet engine."
+        with pytest.raises(NotImplementedError, match=msg):
+            read_parquet(temp_file, fp, where="a > 0")
+
+    def test_read_num_threads_not_supported(self, fp, temp_file):
+        pd.DataFrame({"a": [1]}).to_parquet(temp_file, engine=fp)
+        msg = "num_threads and iterator are not implemented for the fastparquet"
+        with pytest.raises(NotImplementedError, match=msg):
+            read_parquet(temp_file, fp, num_threads=2)
+
     @pytest.mark.single_cpu
     def test_s3_roundtrip(self, df_compat, s3_public_bucket, fp, s3so):
         # GH #19134
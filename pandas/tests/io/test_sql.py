@@ -12,6 +12,7 @@ from datetime import (
 from io import StringIO
 from pathlib import Path
 import sqlite3
+import threading
 from typing import TYPE_CHECKING
 import uuid
 
@@ -1187,6 +1188,17 @@ def test_read_iris_table_chunksize(conn, request):
     check_iris_frame(iris_frame)
 
 
+@pytest.mark.parametrize("conn", sqlalchemy_connectable_iris)
+def test_read_iris_prefetch(conn, request):
+    conn = request.getfixturevalue(conn)
+    iris_frame = concat(read_sql_table("iris", conn, chunksize=7, prefetch=2))
+    check_iris_frame(iris_frame)
+    iris_frame = concat(
+        read_sql_query("SELECT * FROM iris", conn, chunksize=7, prefetch=2)
+    )
+    check_iris_frame(iris_frame)
+
+
 @pytest.mark.parametrize("conn", sqlalchemy_connectable)
 def test_to_sql_callable(conn, test_frame1, request):
     conn = request.getfixturevalue(conn)
@@ -1205,6 +1217,17 @@ def test_to_sql_callable(conn, test_frame1, request):
     assert count_rows(conn, "test_frame") == len(test_frame1)
 
 
+def test_to_sql_callable_missing_values(sqlite_buildin):
+    rows = []
+
+    def sample(pd_table, conn, keys, data_iter):
+        rows.extend(data_iter)
+
+    df = DataFrame({"a": [1.5, np.nan], "b": [1, 2]})
+    df.to_sql(name="test", con=sqlite_buildin, index=False, method=sample)
+    assert rows == [(1.5, 1), (None, 2)]
+
+
 @pytest.mark.parametrize("conn", all_connectable_types)
 def test_default_type_conversion(conn, request):
     conn_name = conn
@@ -1598,6 +1621,82 @@ def test_api_read_sql_with_chunksize_no_result(conn, request):
     tm.assert_frame_equal(concat(with_batch), without_batch)
 
 
+@pytest.mark.parametrize("prefetch", [1, 3])
+@pytest.mark.parametrize("query", ["SELECT * FROM test", "SELECT * FROM test WHERE 0"])
+def test_api_read_sql_prefetch(prefetch, query):
+    df = DataFrame({"a": range(25), "b": [0.5, None] * 12 + [1.5]})
+    with contextlib.closing(
+        sqlite3.connect(":memory:", check_same_thread=False)
+    ) as conn:
+        df.to_sql(name="test", con=conn, index=False)
+        expected = list(sql.read_sql_query(query, conn, chunksize=4, index_col="a"))
+        result = list(
+            sql.read_sql_query(
+                query, conn, chunksize=4, index_col="a", prefetch=prefetch
+            )
+        )
+        assert len(result) == len(expected)
+        for res, exp in zip(result, expected):
+            tm.assert_frame_equal(res, exp)
+
+        # the fetching thread stops when the iterator is closed early
+        nthreads = threading.active_count()
+        iterator = sql.read_sql(query, conn, chunksize=2, prefetch=prefetch)
+        next(iterator)
+        iterator.close()
+        assert threading.active_count() == nthreads
+        tm.assert_frame_equal(sql.read_sql_query("SELECT * FROM test", conn), df)
+
+
+def test_api_read_sql_prefetch_error(sqlite_buildin):
+    # errors of the fetching thread are raised by the iterator
+    DataFrame({"a": [1, 2]}).to_sql(name="test", con=sqlite_buildin)
+    iterator = sql.read_sql(
+        "SELECT * FROM test", sqlite_buildin, chunksize=1, prefetch=1
+    )
+    with pytest.raises(sqlite3.ProgrammingError, match="same thread"):
+        list(iterator)
+
+
+@pytest.mark.parametrize(
+    "kwargs, msg",
+    [
+        ({"chunksize": 1, "prefetch": -1}, "'prefetch' must be an integer >=0"),
+        ({"chunksize": 1, "prefetch": 1.5}, "'prefetch' must be an integer >=0"),
+        ({"prefetch": 1}, "'prefetch' can only be passed together with 'chunksize'"),
+    ],
+)
+def test_api_read_sql_prefetch_invalid(sqlite_buildin, kwargs, msg):
+    with pytest.raises(ValueError, match=msg):
+        sql.read_sql("SELECT 1", sqlite_buildin, **kwargs)
+
+
+@pytest.mark.parametrize("dtype_backend", [lib.no_default, "numpy_nullable"])
+def test_api_read_sql_int_columns(sqlite_buildin, dtype_backend):
+    conn = sqlite_buildin
+    conn.execute("CREATE TABLE test (a INTEGER, b INTEGER, c INTEGER)")
+    conn.executemany(
+        "INSERT INTO test VALUES (?, ?, ?)",
+        [(1, 1, 1), (2**62, None, 2.5), (-3, 3, 3)],
+    )
+    result = sql.read_sql_query(
+        "SELECT * FROM test", conn, dtype_backend=dtype_backend
+    )
+    if dtype_backend is lib.no_default:
+        expected = DataFrame(
+            {"a": [1, 2**62, -3], "b": [1.0, np.nan, 3.0], "c": [1.0, 2.5, 3.0]}
+        )
+    else:
+        expected = DataFrame(
+            {
+                "a": pd.array([1, 2**62, -3], dtype="Int64"),
+                "b": pd.array([1, None, 3], dtype="Int64"),
+                "c": pd.array([1.0, 2.5, 3.0], dtype="Float64"),
+            }
+        )
+    tm.assert_frame_equal(result, expected)
+
+
 @pytest.mark.parametrize("conn", all_connectable)
 def test_api_to_sql(conn, request, test_frame1):
     conn = request.getfixturevalue(conn)
@@ -1708,10 +1807,6 @@ def test_api_roundtrip(conn, request, test_frame1):
 
 @pytest.mark.parametrize("conn", all_connectable)
 def test_api_roundtrip_chunksize(conn, request, test_frame1):
-    if "adbc" in conn:
-        request.node.add_marker(
-            pytest.mark.xfail(reason="chunksize argument NotImplemented with ADBC")
-        )
     conn = request.getfixturevalue(conn)
     if sql.has_table("test_frame_roundtrip", conn):
         with sql.SQLDatabase(conn, need_transaction=True) as pandasSQL:
@@ -3988,6 +4083,54 @@ def test_sqlite_datetime_date(sqlite_buildin):
     tm.assert_frame_equal(res, df.astype(str))
 
 
+@pytest.mark.parametrize("unit", ["s", "ms", "us", "ns"])
+def test_sqlite_datetime_strings(unit, sqlite_buildin):
+    conn = sqlite_buildin
+    ser = Series(
+        [
+            "1960-03-04 05:06:07",
+            "2014-01-01 09:00:00.250",
+            None,
+            "2038-01-19 03:14:08.000007",
+        ],
+        dtype="M8[ns]",
+    )
+    ser = ser.dt.floor(unit).astype(f"M8[{unit}]")
+    df = DataFrame({"a": ser})
+    assert df.to_sql(name="test_datetime", con=conn, index=False) == 4
+    result = [row[0] for row in conn.execute("SELECT a FROM test_datetime")]
+    # as stored by the sqlite3 adapter of datetime.datetime
+    expected = [
+        None if isna(ts) else ts.to_pydatetime().isoformat(" ") for ts in ser
+    ]
+    assert result == expected
+
+
+def test_sqlite_insert_blocks(sqlite_buildin, monkeypatch):
+    conn = sqlite_buildin
+    monkeypatch.setattr(sql.SQLTable, "_insert_blocksize", 3)
+    df = DataFrame(
+        {
+            "i": range(10),
+            "f": [0.5, np.nan] * 5,
+            "b": [True, False] * 5,
+            "s": ["x", None] * 5,
+        },
+        index=Index(range(10, 20), name="idx"),
+    )
+    assert df.to_sql(name="test_blocks", con=conn, chunksize=4) == 10
+    result = conn.execute(
+        "SELECT idx, i, f, typeof(f), b, s FROM test_blocks"
+    ).fetchall()
+    expected = [
+        (i + 10, i, 0.5, "real", 1, "x")
+        if i % 2 == 0
+        else (i + 10, i, None, "null", 0, None)
+        for i in range(10)
+    ]
+    assert result == expected
+
+
 @pytest.mark.parametrize("tz_aware", [False, True])
 def test_sqlite_datetime_time(tz_aware, sqlite_buildin):
     conn = sqlite_buildin
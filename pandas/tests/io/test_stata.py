@@ -2206,12 +2206,14 @@ def test_direct_read(datapath, monkeypatch):
         # Must not have been buffered to memory
         assert not reader.read().empty
         assert not isinstance(reader._path_or_buf, io.BytesIO)
+        assert reader._memory_map
 
     # Test that we use a given fp exactly, if possible.
     with open(file_path, "rb") as fp:
         with StataReader(fp) as reader:
             assert not reader.read().empty
             assert reader._path_or_buf is fp
+            assert reader._memory_map
 
     # Test that we use a given BytesIO exactly, if possible.
     with open(file_path, "rb") as fp:
@@ -2219,6 +2221,28 @@ def test_direct_read(datapath, monkeypatch):
             with StataReader(bio) as reader:
                 assert not reader.read().empty
                 assert reader._path_or_buf is bio
+                assert not reader._memory_map
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        [b"abc", b"", b"a b c d"],
+        # data after the terminating null is ignored
+        [b"ab\x00cd", b"abc"],
+        ["þâÑÐ".encode(), b"abc"],
+    ],
+)
+def test_decode_strings(datapath, values):
+    file_path = datapath("io", "data", "stata", "stata-compat-118.dta")
+    # a field of the structured array of the rows
+    rows = np.array([(1, value) for value in values], dtype=[("a", "i4"), ("s", "S8")])
+
+    with StataReader(file_path) as reader:
+        reader._ensure_open()
+        result = reader._decode_strings(rows["s"])
+        expected = np.array([reader._decode(value) for value in values], dtype=object)
+        tm.assert_numpy_array_equal(result, expected)
 
 
 @pytest.mark.parametrize("version", [114, 117, 118, 119, None])
@@ -1474,6 +1474,79 @@ def test_wrong_dict_value(xml_books, parser):
         read_xml(xml_books, parser=parser, iterparse={"book": "category"})
 
 
+@pytest.mark.parametrize("chunksize", [1, 2, 3, 4])
+def test_iterparse_chunksize(xml_books, parser, chunksize):
+    iterparse = {"book": ["category", "title", "year", "author", "price"]}
+    df_expected = read_xml(xml_books, parser=parser, iterparse=iterparse)
+
+    chunks = list(
+        read_xml(xml_books, parser=parser, iterparse=iterparse, chunksize=chunksize)
+    )
+
+    assert [len(chunk) for chunk in chunks[:-1]] == [chunksize] * (len(chunks) - 1)
+    tm.assert_frame_equal(pd.concat(chunks), df_expected)
+
+
+def test_iterparse_chunksize_new_columns(parser):
+    xml = """\
+<?xml version='1.0' encoding='utf-8'?>
+<data>
+  <row>
+    <shape>square</shape>
+    <degrees>360</degrees>
+  </row>
+  <row>
+    <shape>circle</shape>
+    <degrees>360</degrees>
+  </row>
+  <row>
+    <shape>triangle</shape>
+    <sides>3</sides>
+  </row>
+</data>"""
+
+    with tm.ensure_clean() as path:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(xml)
+
+        chunks = list(
+            read_xml(
+                path,
+                parser=parser,
+                iterparse={"row": ["shape", "degrees", "sides"]},
+                chunksize=2,
+            )
+        )
+
+    tm.assert_frame_equal(
+        chunks[0],
+        DataFrame({"shape": ["square", "circle"], "degrees": [360, 360]}),
+    )
+    tm.assert_frame_equal(
+        chunks[1],
+        DataFrame(
+            {"shape": ["triangle"], "degrees": [np.nan], "sides": [3]},
+            index=range(2, 3),
+        ),
+    )
+
+
+@pytest.mark.parametrize("chunksize", [0, 1.5, "2"])
+def test_iterparse_chunksize_invalid(xml_books, parser, chunksize):
+    with pytest.raises(ValueError, match="'chunksize' must be an integer >=1"):
+        read_xml(
+            xml_books,
+            parser=parser,
+            iterparse={"book": ["category", "title"]},
+            chunksize=chunksize,
+        )
+
+
+def test_chunksize_without_iterparse(xml_books, parser):
+    with pytest.raises(ValueError, match="only supported with 'iterparse'"):
+        read_xml(xml_books, parser=parser, chunksize=2)
+
+
 def test_bad_xml(parser):
     bad_xml = """\
 <?xml version='1.0' encoding='utf-8'?>
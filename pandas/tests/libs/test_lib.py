@@ -30,6 +30,35 @@ class TestMisc:
         with pytest.raises(TypeError, match=msg):
             libwriters.max_len_string_array(arr.astype("U"))
 
+    @pytest.mark.parametrize("format_code", ["e", "E", "f", "F", "g", "G"])
+    @pytest.mark.parametrize("precision", [0, 3, 17])
+    @pytest.mark.parametrize("decimal", [".", ","])
+    @pytest.mark.parametrize("leading_space", [True, False])
+    def test_format_float_array(self, format_code, precision, decimal, leading_space):
+        arr = np.array([1.5, -0.0, 1e-310, np.nan, -np.inf, 123456789.125, 1e300])
+        result = libwriters.format_float_array(
+            arr, "NA", format_code, precision, decimal, leading_space
+        )
+        fmt = f"{{: .{precision}{format_code}}}" if leading_space else None
+        expected = np.array(
+            [
+                "NA"
+                if np.isnan(x)
+                else (
+                    fmt.format(x) if fmt else f"%.{precision}{format_code}" % x
+                ).replace(".", decimal, 1)
+                for x in arr
+            ],
+            dtype=object,
+        )
+        tm.assert_numpy_array_equal(result, expected)
+
+    def test_format_float_array_repr(self):
+        arr = np.array([0.1, 1.0, -0.0, 1e16, 1e-5, 2.0**0.5, np.nan, np.inf])
+        result = libwriters.format_float_array(arr, "", "r", 0)
+        expected = np.array([str(x) if x == x else "" for x in arr], dtype=object)
+        tm.assert_numpy_array_equal(result, expected)
+
     def test_fast_unique_multiple_list_gen_sort(self):
         keys = [["p", "a"], ["n", "d"], ["a", "s"]]
 